@@ -0,0 +1,76 @@
+# backend/app/api/idempotency.py
+
+"""
+Idempotency-Key support for write endpoints.
+
+A request sent with an `Idempotency-Key` header runs once; retries with the same key
+replay the stored response instead of writing again. The key, the write and the stored
+response commit in one transaction, so a crash can never leave a key without its response.
+"""
+
+import json
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import crud_idempotency
+from app.models.idempotency import IdempotencyKey
+
+
+def replay(record: IdempotencyKey, request_hash: str) -> JSONResponse:
+    """Replay the response stored for a key, or 422 if it was used for a different request."""
+    if record.request_hash != request_hash:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="This Idempotency-Key was already used for a different request."
+        )
+    return JSONResponse(
+        status_code=record.status_code,
+        content=json.loads(record.response_body),
+        headers={"Idempotent-Replayed": "true"}
+    )
+
+
+async def run_idempotent(
+    session: AsyncSession,
+    scope: str,
+    idempotency_key: Optional[str],
+    payload: Any,
+    status_code: int,
+    handler: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Run a write handler at most once per idempotency key.
+    
+    The handler must write without committing; this function commits once, together
+    with the key and its stored response. Without a key the handler simply runs. With
+    a key, a stored response is replayed and a key reused for a different payload gets
+    422. If the handler fails, everything rolls back and the request can be retried.
+    A concurrent request that commits the same key first wins: this request's write is
+    rolled back and the winner's response replayed.
+    """
+    if not idempotency_key:
+        result = await handler()
+        await session.commit()
+        return result
+    
+    request_hash = crud_idempotency.hash_request(payload)
+    existing = await crud_idempotency.get(session, scope, idempotency_key)
+    if existing:
+        return replay(existing, request_hash)
+    
+    try:
+        result = await handler()
+        record, saved = await crud_idempotency.save(
+            session, scope, idempotency_key, request_hash, status_code, jsonable_encoder(result)
+        )
+        if saved:
+            await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    if not saved:
+        return replay(record, request_hash)
+    return result
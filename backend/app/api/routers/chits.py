@@ -1,13 +1,11 @@
 # backend/app/api/routers/chits.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, status
 from typing import Annotated, List
 from datetime import date, datetime, timezone
 from dateutil.relativedelta import relativedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
 from calendar import monthrange
 
 
@@ -18,13 +16,15 @@ def calculate_end_date_with_last_day(start_date: date, duration_months: int) ->
     return date(end_month_date.year, end_month_date.month, last_day)
 
 
+from app.core.utils import normalize_name
 from app.db.session import get_session
+from app.api.idempotency import run_idempotent
 from app.models.chits import Chit
 from app.models.auth import AuthorizedPhone
 from app.security.dependencies import get_current_user
 from app.crud import crud_chits, crud_slots, crud_payments
+from app.crud.crud_slots import build_slot_rows
 from app.models.chits import ChitType
-from app.models.payments import PaymentType
 
 
 def calculate_variable_payout_schedule(chit_value: int, size: int, premium_percent: float, commission_percent: float, duration_months: int) -> dict[int, int]:
@@ -76,47 +76,14 @@ def normalize_chit_fields_for_type(chit_type: str, data: dict) -> dict:
 
 from app.schemas.chits import (
     ChitCreate, ChitUpdate, ChitResponse, ChitListResponse,
-    ChitPatch, AuctionRequest
+    ChitPatch, AuctionRequest, BULK_CREATE_MAX
 )
 from app.schemas.slots import ChitSlotListPublicResponse, ChitSlotPublic
 from app.schemas.members import MemberPublic
 
-router = APIRouter(prefix="/chits", tags=["chits"])
-
-
-@router.get("/check-name")
-async def check_chit_name_availability(
-    name: str,
-    current_user: Annotated[AuthorizedPhone, Depends(get_current_user)],
-    session: Annotated[AsyncSession, Depends(get_session)],
-):
-    """Check if a chit name is available (case-insensitive)."""
-    trimmed = name.strip()
-    if len(trimmed) < 3:
-        return {"available": True}  # Too short to validate
-    
-    existing = await session.execute(
-        select(Chit).where(func.lower(Chit.name) == func.lower(trimmed))
-    )
-    return {"available": existing.scalar_one_or_none() is None}
-
-
-@router.post("", response_model=ChitResponse, status_code=status.HTTP_201_CREATED)
-async def create_chit(
-    chit: ChitCreate,
-    current_user: Annotated[AuthorizedPhone, Depends(get_current_user)],
-    session: Annotated[AsyncSession, Depends(get_session)],
-):
+def build_chit_from_create(chit: ChitCreate) -> Chit:
+    """Build a new Chit from a create request, normalizing fields for its chit type."""
     trimmed_name = chit.name.strip()
-    existing_chit = await session.execute(
-        select(Chit).where(func.lower(Chit.name) == func.lower(trimmed_name))
-    )
-    if existing_chit.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="A chit with this name already exists. Please choose a different name."
-        )
-
     end_date = calculate_end_date_with_last_day(chit.start_date, chit.duration_months)
 
     # Calculate contribution fields based on chit type
@@ -127,7 +94,7 @@ async def create_chit(
     duration = chit.duration_months
     
     chit_type_str = chit.chit_type.value if hasattr(chit.chit_type, 'value') else chit.chit_type
-    
+
     if chit_type_str == "fixed":
         # Fixed: Only base_contribution from user, others NULL
         base_contribution = chit.base_contribution
@@ -156,6 +123,7 @@ async def create_chit(
 
     db_chit = Chit(
         name=trimmed_name,
+        name_normalized=normalize_name(trimmed_name),  # Set explicitly for bulk inserts
         chit_value=chit.chit_value,
         size=chit.size,
         duration_months=duration,
@@ -171,50 +139,91 @@ async def create_chit(
         foreman_commission_percent=foreman_commission_percent,
         notes=notes,
     )
+    return db_chit
+
+
+def calculate_slot_schedule(db_chit: Chit) -> dict:
+    """Calculate the slot schedule arguments (payout and contribution amounts) for a new chit."""
+    chit_type_str = db_chit.chit_type.value if hasattr(db_chit.chit_type, 'value') else db_chit.chit_type
+
+    # Determine slot values based on Chit Type
+    payout_amount = None  # NULL for Fixed/Auction
+    payout_map = None
+    expected_contribution = None  # NULL for Auction
+    contribution_map = None
+
+    if chit_type_str == "fixed":
+        # Fixed: payout_amount = NULL (user enters later)
+        # expected_contribution = base × size
+        payout_amount = None
+        expected_contribution = (db_chit.base_contribution or 0) * db_chit.size
+        
+    elif chit_type_str == "variable":
+        # Variable: Calculate per-month payout and contribution schedules
+        payout_map = calculate_variable_payout_schedule(
+            db_chit.chit_value, db_chit.size, db_chit.payout_premium_percent or 0, 
+            db_chit.foreman_commission_percent or 0, db_chit.duration_months
+        )
+        # Calculate per-month contribution schedule (Total Collection)
+        contribution_map = {}
+        base = db_chit.base_contribution or 0
+        premium = db_chit.premium_contribution or 0
+        for m in range(1, db_chit.duration_months + 1):
+            paid_count = m - 1
+            unpaid_count = db_chit.size - paid_count
+            total = (paid_count * premium) + (unpaid_count * base)
+            contribution_map[m] = total
+            
+    # Auction: payout_amount, expected_contribution = NULL (calculated when auction recorded)
+    return {
+        "payout_amount": payout_amount,
+        "payout_map": payout_map,
+        "expected_contribution": expected_contribution,
+        "contribution_map": contribution_map,
+    }
+
+
+router = APIRouter(prefix="/chits", tags=["chits"])
+
+
+@router.get("/check-name")
+async def check_chit_name_availability(
+    name: str,
+    current_user: Annotated[AuthorizedPhone, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """Check if a chit name is available (case-insensitive)."""
+    trimmed = name.strip()
+    if len(trimmed) < 3:
+        return {"available": True}  # Too short to validate
+    
+    return {"available": not await crud_chits.is_name_taken(session, trimmed)}
+
+
+@router.post("", response_model=ChitResponse, status_code=status.HTTP_201_CREATED)
+async def create_chit(
+    chit: ChitCreate,
+    current_user: Annotated[AuthorizedPhone, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    trimmed_name = chit.name.strip()
+    if await crud_chits.is_name_taken(session, trimmed_name):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A chit with this name already exists. Please choose a different name."
+        )
+
+    db_chit = build_chit_from_create(chit)
     session.add(db_chit)
     
     try:
-        await session.commit()
-        await session.refresh(db_chit)
-        
-        # Determine slot values based on Chit Type
-        payout_amount = None  # NULL for Fixed/Auction
-        payout_map = None
-        expected_contribution = None  # NULL for Auction
-        contribution_map = None
-
-        if chit_type_str == "fixed":
-            # Fixed: payout_amount = NULL (user enters later)
-            # expected_contribution = base × size
-            payout_amount = None
-            expected_contribution = (db_chit.base_contribution or 0) * db_chit.size
-            
-        elif chit_type_str == "variable":
-            # Variable: Calculate per-month payout and contribution schedules
-            payout_map = calculate_variable_payout_schedule(
-                db_chit.chit_value, db_chit.size, db_chit.payout_premium_percent or 0, 
-                db_chit.foreman_commission_percent or 0, db_chit.duration_months
-            )
-            # Calculate per-month contribution schedule (Total Collection)
-            contribution_map = {}
-            base = db_chit.base_contribution or 0
-            premium = db_chit.premium_contribution or 0
-            for m in range(1, db_chit.duration_months + 1):
-                paid_count = m - 1
-                unpaid_count = db_chit.size - paid_count
-                total = (paid_count * premium) + (unpaid_count * base)
-                contribution_map[m] = total
-                
-        # Auction: payout_amount, expected_contribution = NULL (calculated when auction recorded)
+        # Flush to get the chit id; chit and slots are committed together below
+        await session.flush()
         
         # Create Slot records for each month
         await crud_slots.create_slots_for_chit(
-            session, db_chit.id, db_chit.duration_months, 
-            payout_amount=payout_amount, 
-            payout_map=payout_map,
-            expected_contribution=expected_contribution,
-            contribution_map=contribution_map,
-            chit_type=chit_type_str
+            session, db_chit.id, db_chit.duration_months,
+            **calculate_slot_schedule(db_chit)
         )
         await session.commit()
     except IntegrityError:
@@ -224,8 +233,63 @@ async def create_chit(
             detail="A chit with this name already exists. Please choose a different name."
         )
     
-    response_details = await crud_chits.get_chit_by_id_with_details(session, chit_id=db_chit.id)
-    return response_details
+    # A new chit has no assigned slots yet
+    return crud_chits.build_chit_response(db_chit, members_count=0)
+
+
+@router.post("/bulk", response_model=ChitListResponse, status_code=status.HTTP_201_CREATED)
+async def create_chits_bulk(
+    chits: Annotated[List[ChitCreate], Body(max_length=BULK_CREATE_MAX)],
+    current_user: Annotated[AuthorizedPhone, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """
+    Creates several chits with their slot schedules in one transaction.
+    Either every chit is created or none is.
+    """
+    if not chits:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No chits provided.")
+
+    names = [chit.name.strip() for chit in chits]
+    seen = set()
+    duplicates = []
+    for name in names:
+        if name.lower() in seen:
+            duplicates.append(name)
+        seen.add(name.lower())
+    if duplicates:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Chit names are repeated in the request: {', '.join(duplicates)}"
+        )
+
+    existing_names = await crud_chits.get_existing_names(session, names)
+    if existing_names:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Chits with these names already exist: {', '.join(existing_names)}"
+        )
+
+    db_chits = [build_chit_from_create(chit) for chit in chits]
+    try:
+        await crud_chits.bulk_create_chits(session, db_chits)
+        slot_rows = []
+        for db_chit in db_chits:
+            slot_rows.extend(build_slot_rows(
+                db_chit.id, db_chit.duration_months,
+                **calculate_slot_schedule(db_chit)
+            ))
+        await crud_slots.bulk_create_slots(session, slot_rows)
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A chit with one of these names already exists. Please choose different names."
+        )
+
+    # New chits have no assigned slots yet
+    return ChitListResponse(chits=[crud_chits.build_chit_summary(db_chit, members_count=0) for db_chit in db_chits])
 
 
 @router.get("", response_model=ChitListResponse)
@@ -233,17 +297,8 @@ async def read_chits(
     current_user: Annotated[AuthorizedPhone, Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_session)],
 ):
-    # Fetch all chits
-    statement = select(Chit)
-    result = await session.execute(statement)
-    chits = result.scalars().all()
-    
-    response_chits = []
-    for chit in chits:
-        response_details = await crud_chits.get_chit_by_id_with_details(session, chit_id=chit.id)
-        response_chits.append(response_details)
-
-    response_chits.sort(key=lambda c: (c.status != 'Active', c.start_date), reverse=False)
+    # Fetch all chits with member counts and ordering resolved in one query
+    response_chits = await crud_chits.get_all_chits_with_details(session)
     return {"chits": response_chits}
 
 
@@ -260,6 +315,9 @@ async def get_chit_slots(
         
     all_slots = await crud_slots.get_by_chit(session, chit_id=chit_id)
     
+    # TOTAL collection payments for ALL members, per month, in one grouped query
+    collected_by_month = await crud_payments.get_collection_totals_by_month(session, chit_id=chit_id)
+    
     response_slots = []
     for slot in all_slots:
         member_public = None
@@ -291,13 +349,7 @@ async def get_chit_slots(
             else:
                 expected_total = slot.expected_contribution or 0
         
-        # Get TOTAL collection payments for ALL members in this month
-        all_month_payments = await crud_payments.get_by_chit_and_month(session, chit_id=chit_id, month=slot.month)
-        collection_payments = [
-            p for p in all_month_payments 
-            if p.payment_type == PaymentType.COLLECTION
-        ]
-        total_paid = sum(p.amount for p in collection_payments)
+        total_paid = collected_by_month.get(slot.month, 0)
         
         due_amount = max(expected_total - total_paid, 0)
 
@@ -433,10 +485,7 @@ async def patch_chit(
     
     if "name" in chit_data:
         trimmed_name = chit_data["name"].strip()
-        existing_chit = await session.execute(
-            select(Chit).where(func.lower(Chit.name) == func.lower(trimmed_name), Chit.id != chit_id)
-        )
-        if existing_chit.scalar_one_or_none():
+        if await crud_chits.is_name_taken(session, trimmed_name, exclude_id=chit_id):
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A chit with this name already exists.")
         chit_data["name"] = trimmed_name
 
@@ -558,9 +607,8 @@ async def get_payouts_for_chit(
                 phone_number=slot.member.phone_number,
             )
         
-        # Calculate amount paid for payout
-        payout_payments = [p for p in slot.payments if p.payment_type == PaymentType.PAYOUT] if slot.payments else []
-        amount_paid = sum(p.amount for p in payout_payments)
+        # Amount paid for payout (stored running total on the slot)
+        amount_paid = slot.amount_paid
         due_amount = slot.payout_amount - amount_paid
         
         if amount_paid == 0:
@@ -594,25 +642,35 @@ async def record_auction(
     auction_data: AuctionRequest,
     current_user: Annotated[AuthorizedPhone, Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_session)],
+    idempotency_key: Annotated[str | None, Header(max_length=255)] = None,
 ):
-    """Record an auction for a specific month and auto-calculate financials."""
-    try:
-        result = await crud_chits.record_auction_month(
-            session=session,
-            chit_id=chit_id,
-            month=auction_data.month,
-            bid_amount=auction_data.bid_amount,
-            member_id=auction_data.member_id
-        )
-        return result
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    """
+    Record an auction for a specific month and auto-calculate financials.
+    Retries sent with the same Idempotency-Key header return the original response.
+    """
+    async def record():
+        try:
+            return await crud_chits.record_auction_month(
+                session=session,
+                chit_id=chit_id,
+                month=auction_data.month,
+                bid_amount=auction_data.bid_amount,
+                member_id=auction_data.member_id,
+                commit=False
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+    
+    return await run_idempotent(
+        session, f"POST /chits/{chit_id}/auctions", idempotency_key, auction_data.model_dump(mode="json"),
+        status.HTTP_200_OK, record
+    )
 
 
-from app.schemas.month_members import MonthMembersResponse, MemberMonthlyData, PaymentSummary
+from app.schemas.month_members import MonthMembersResponse, MemberMonthlyData
 
 @router.get("/{chit_id}/months/{month}/members", response_model=MonthMembersResponse)
 async def get_month_members(
@@ -643,8 +701,8 @@ async def get_month_members(
     # Get all assigned slots for this chit (these are the "members" for collection purposes)
     all_assigned_slots = await crud_slots.get_assigned_slots(session, chit_id=chit_id)
     
-    # Get all payments for this chit in this month
-    month_payments = await crud_payments.get_by_chit_and_month(session, chit_id=chit_id, month=month)
+    # Get this month's collection payments, already bucketed by member_id
+    payments_by_member = await crud_payments.get_collection_summaries_by_member(session, chit_id=chit_id, month=month)
     
     # Calculate total expected based on chit type
     if db_chit.chit_type.value == "fixed":
@@ -695,8 +753,8 @@ async def get_month_members(
         total_expected += member_expected or 0
         
         # Get payments made by this member for this month
-        member_payments = [p for p in month_payments if p.member_id == member.id and p.payment_type == PaymentType.COLLECTION]
-        amount_paid = sum(p.amount for p in member_payments)
+        payment_summaries = payments_by_member.get(member.id, [])
+        amount_paid = sum(p.amount for p in payment_summaries)
         total_collected += amount_paid
         
         # Determine status
@@ -707,18 +765,6 @@ async def get_month_members(
         else:
             status_str = "Partial"
         
-        # Build payment summaries
-        payment_summaries = [
-            PaymentSummary(
-                id=p.id,
-                amount=p.amount,
-                date=p.date,
-                method=p.method.value if p.method else "cash",
-                notes=p.notes
-            )
-            for p in member_payments
-        ]
-        
         members_data.append(MemberMonthlyData(
             member_id=member.id,
             member_name=member.full_name,
@@ -8,7 +8,6 @@ from dateutil.relativedelta import relativedelta
 from app.db.session import get_session
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.auth import AuthorizedPhone
-from app.models.payments import PaymentType
 from app.security.dependencies import get_current_user
 from app.crud import crud_members, crud_slots, crud_chits, crud_payments
 from app.schemas import members as members_schemas
@@ -84,6 +83,8 @@ async def patch_member_details(
     db_member.updated_at = datetime.now(timezone.utc)
 
     session.add(db_member)
+    if "full_name" in update_data:
+        await crud_members.sync_search_tokens(session, db_member)
     await session.commit()
     await session.refresh(db_member)
     return db_member
@@ -93,8 +94,10 @@ async def search_for_members(
     query: Annotated[str, Query(min_length=2)],
     current_user: Annotated[AuthorizedPhone, Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_session)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 20,
 ):
-    members = await crud_members.search_members(session, query=query)
+    """Typeahead search by phone number prefix or name word prefixes, best matches first."""
+    members = await crud_members.search_members(session, query=query, limit=limit)
     return members
 
 @router.get("/{member_id}", response_model=members_schemas.MemberPublic)
@@ -121,6 +124,9 @@ async def get_member_slots(
     
     member_slots = await crud_slots.get_by_member(session, member_id=member_id)
     
+    # Collection totals for this member keyed by (chit_id, month), loaded once
+    collected = await crud_payments.get_collection_totals_for_member(session, member_id=member_id)
+    
     response_slots = []
     today = date.today()
 
@@ -140,18 +146,11 @@ async def get_member_slots(
             expected = chit.base_contribution
         elif chit.chit_type.value == "variable":
             # Check if member has received payout
-            payout_payments = [p for p in (slot.payments or []) if p.payment_type == PaymentType.PAYOUT]
-            expected = chit.premium_contribution if payout_payments else chit.base_contribution
+            expected = chit.premium_contribution if slot.amount_paid > 0 else chit.base_contribution
         else:  # auction
             expected = slot.expected_contribution or (chit.chit_value // chit.size if chit.size > 0 else 0)
         
-        # Get collection payments for this member in this month
-        all_payments = await crud_payments.get_by_member(session, member_id=member_id)
-        member_collection_payments = [
-            p for p in all_payments
-            if p.chit_id == chit.id and p.month == slot.month and p.payment_type == PaymentType.COLLECTION
-        ]
-        total_paid = sum(p.amount for p in member_collection_payments)
+        total_paid = collected.get((chit.id, slot.month), 0)
         due_amount = expected - total_paid
 
         if total_paid == 0: 
@@ -198,8 +197,7 @@ async def get_member_payouts(
     
     result = []
     for slot in member_slots:
-        payout_payments = [p for p in (slot.payments or []) if p.payment_type == PaymentType.PAYOUT]
-        amount_paid = sum(p.amount for p in payout_payments)
+        amount_paid = slot.amount_paid
         due_amount = slot.payout_amount - amount_paid
         
         if amount_paid == 0:
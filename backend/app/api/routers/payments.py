@@ -1,26 +1,142 @@
 # backend/app/api/routers/payments.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import csv
+import io
+import json
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import iterate_in_threadpool
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import Annotated, Iterator, List, Optional
 
 from app.security.dependencies import get_current_user
-from app.db.session import get_session
-from app.crud import crud_payments
+from app.db.session import get_session, AsyncSessionLocal
+from app.api.idempotency import run_idempotent
+from app.core.utils import normalize_name
+from app.crud import crud_payments, crud_chits, crud_members, crud_slots
 from app.models.payments import Payment, PaymentType
 
-from app.schemas.payments import PaymentCreate, PaymentUpdate, PaymentResponse
+from app.schemas.payments import (
+    PaymentCreate, PaymentUpdate, PaymentFilters, PaymentResponse, PaymentListResponse, PaymentListQuery, PaymentExportQuery,
+    PaymentBulkResponse, PaymentImportResponse, PaymentSummaryResponse, PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX, BULK_CREATE_MAX
+)
 
 router = APIRouter(prefix="/payments", tags=["payments"])
 
+EXPORT_CHUNK_SIZE = 64 * 1024  # Characters buffered before each chunk is sent during export
+IMPORT_BATCH_SIZE = 500  # Rows inserted (and committed) per batch during CSV import
+IMPORT_REJECTED_LIMIT = 1000  # Max rejected rows listed in the import response
 
-@router.get("", response_model=List[PaymentResponse])
+
+async def paginate(fetch) -> PaymentListResponse:
+    """Run a paged crud_payments query, turning a malformed cursor into a 400."""
+    try:
+        payments, next_cursor = await fetch()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return PaymentListResponse(
+        payments=[PaymentResponse.model_validate(payment) for payment in payments],
+        next_cursor=next_cursor
+    )
+
+
+@router.get("", response_model=PaymentListResponse)
 async def get_all_payments(
+    params: Annotated[PaymentListQuery, Query()],
+    session: AsyncSession = Depends(get_session),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Get payments, newest first, one page at a time.
+    Filters: chit_id, member_id, payment_type, method, and inclusive ranges
+    date_from/date_to, month_from/month_to, amount_min/amount_max.
+    Pass the returned next_cursor as `cursor` to fetch the following page.
+    """
+    return await paginate(
+        lambda: crud_payments.get_all(session, limit=params.limit, cursor=params.cursor, filters=params)
+    )
+
+
+@router.get("/summary", response_model=PaymentSummaryResponse)
+async def get_payments_summary(
+    params: Annotated[PaymentFilters, Query()],
     session: AsyncSession = Depends(get_session),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get all payments."""
-    return await crud_payments.get_all(session)
+    """
+    Get the count and total amount of the payments matching the filters, computed in SQL.
+    Accepts the same filters as GET /payments, e.g. payment_type=collection with a
+    date_from/date_to range for a month's collections.
+    """
+    count, total_amount = await crud_payments.get_summary(session, filters=params)
+    return PaymentSummaryResponse(count=count, total_amount=total_amount)
+
+
+def export_value(value):
+    """Convert a column value from an export row to a plain CSV/JSON value."""
+    if hasattr(value, "value"):  # Enums
+        return value.value
+    if hasattr(value, "isoformat"):  # Dates
+        return value.isoformat()
+    return value
+
+
+@router.get("/export")
+async def export_payments(
+    params: Annotated[PaymentExportQuery, Query()],
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Export payments as CSV or NDJSON (one JSON object per line), newest first.
+    Accepts the same filters as GET /payments (e.g. chit_id, member_id, date range);
+    without filters the whole ledger is exported. Rows are streamed from a server-side
+    cursor and written out incrementally.
+    """
+    columns = [column.key for column in crud_payments.EXPORT_COLUMNS]
+    
+    async def generate_csv():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        # The request's session closes when the endpoint returns, so stream from our own
+        async with AsyncSessionLocal() as session:
+            async for row in crud_payments.stream_export_rows(session, filters=params):
+                writer.writerow([export_value(row[column]) for column in columns])
+                if buffer.tell() >= EXPORT_CHUNK_SIZE:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+        yield buffer.getvalue()
+    
+    async def generate_ndjson():
+        lines = []
+        size = 0
+        async with AsyncSessionLocal() as session:
+            async for row in crud_payments.stream_export_rows(session, filters=params):
+                line = json.dumps({column: export_value(row[column]) for column in columns}) + "\n"
+                lines.append(line)
+                size += len(line)
+                if size >= EXPORT_CHUNK_SIZE:
+                    yield "".join(lines)
+                    lines = []
+                    size = 0
+        yield "".join(lines)
+    
+    if params.format == "ndjson":
+        return StreamingResponse(
+            generate_ndjson(),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": 'attachment; filename="payments.ndjson"'}
+        )
+    return StreamingResponse(
+        generate_csv(),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="payments.csv"'}
+    )
 
 
 @router.get("/{payment_id}", response_model=PaymentResponse)
@@ -60,33 +176,41 @@ async def get_payments_by_chit_and_month(
     return await crud_payments.get_by_chit_and_month(session, chit_id, month)
 
 
-@router.get("/member/{member_id}", response_model=List[PaymentResponse])
+@router.get("/member/{member_id}", response_model=PaymentListResponse)
 async def get_payments_by_member(
     member_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    limit: int = Query(default=PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX),
+    cursor: Optional[str] = None
 ):
-    """Get all payments for a specific member."""
-    return await crud_payments.get_by_member(session, member_id)
+    """Get payments for a specific member, newest first, one page at a time."""
+    return await paginate(lambda: crud_payments.get_by_member(session, member_id, limit=limit, cursor=cursor))
 
 
-@router.get("/chit/{chit_id}", response_model=List[PaymentResponse])
+@router.get("/chit/{chit_id}", response_model=PaymentListResponse)
 async def get_payments_by_chit(
     chit_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    limit: int = Query(default=PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX),
+    cursor: Optional[str] = None
 ):
-    """Get all payments for a specific chit."""
-    return await crud_payments.get_by_chit(session, chit_id)
+    """Get payments for a specific chit, newest first, one page at a time."""
+    return await paginate(lambda: crud_payments.get_by_chit(session, chit_id, limit=limit, cursor=cursor))
 
 
 @router.post("", response_model=PaymentResponse, status_code=status.HTTP_201_CREATED)
 async def create_payment(
     payment_in: PaymentCreate,
     session: AsyncSession = Depends(get_session),
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(default=None, max_length=255)
 ):
-    """Create a new payment. Automatically updates related slot status for payout payments."""
+    """
+    Create a new payment. Automatically updates related slot status for payout payments.
+    Retries sent with the same Idempotency-Key header return the original response.
+    """
     # Validate that slot_id is provided for payout payments
     if payment_in.payment_type == PaymentType.PAYOUT and not payment_in.slot_id:
         raise HTTPException(
@@ -101,7 +225,152 @@ async def create_payment(
             detail="slot_id should not be provided for collection payments"
         )
     
-    return await crud_payments.create(session, payment_in)
+    async def create():
+        payment = await crud_payments.create(session, payment_in, commit=False)
+        return PaymentResponse.model_validate(payment)
+    
+    return await run_idempotent(
+        session, "POST /payments", idempotency_key, payment_in.model_dump(mode="json"),
+        status.HTTP_201_CREATED, create
+    )
+
+
+@router.post("/bulk", response_model=PaymentBulkResponse, status_code=status.HTTP_201_CREATED)
+async def create_payments_bulk(
+    payments_in: Annotated[List[PaymentCreate], Body(max_length=BULK_CREATE_MAX)],
+    session: AsyncSession = Depends(get_session),
+    current_user: dict = Depends(get_current_user)
+):
+    """Create many payments in one transaction. Invalid rows are skipped and reported per row."""
+    if not payments_in:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No payments provided"
+        )
+    
+    results = await crud_payments.create_bulk(session, payments_in)
+    created_count = sum(1 for r in results if r["status"] == "created")
+    return {
+        "created_count": created_count,
+        "rejected_count": len(results) - created_count,
+        "results": results,
+    }
+
+
+def parse_import_rows(
+    file, 
+    chit_ids: set, 
+    chit_ids_by_name: dict, 
+    member_lookup: dict, 
+    slot_lookup: dict
+) -> Iterator[List[tuple]]:
+    """
+    Parse and validate an uploaded payments CSV (blocking file reads; run in a threadpool).
+    
+    Yields chunks of up to IMPORT_BATCH_SIZE rows as (line, payment_in, detail)
+    tuples: payment_in is a PaymentCreate for valid rows, detail the rejection
+    reason otherwise. The chit column is matched by name first and, if no chit has
+    that name, by ID.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    chunk = []
+    for line, row in enumerate(reader, start=2):
+        row = {key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+        
+        chit = row.get("chit", "")
+        chit_id = chit_ids_by_name.get(normalize_name(chit))
+        if chit_id is None and chit.isdigit() and int(chit) in chit_ids:
+            chit_id = int(chit)
+        member_id = member_lookup.get(row.get("member_phone", ""))
+        if chit_id is None:
+            chunk.append((line, None, "Chit not found"))
+        elif member_id is None:
+            chunk.append((line, None, "Member not found"))
+        else:
+            data = {
+                "chit_id": chit_id,
+                "member_id": member_id,
+                "month": row.get("month"),
+                "amount": row.get("amount"),
+                "date": row.get("date"),
+                "payment_type": (row.get("payment_type") or PaymentType.COLLECTION.value).lower(),
+                "notes": row.get("notes") or None,
+            }
+            if row.get("method"):
+                data["method"] = row["method"].lower()
+            if data["payment_type"] == PaymentType.PAYOUT.value and (row.get("month") or "").isdigit():
+                data["slot_id"] = slot_lookup.get((chit_id, int(row["month"])))
+            
+            try:
+                chunk.append((line, PaymentCreate(**data), None))
+            except ValidationError as e:
+                error = e.errors()[0]
+                field = ".".join(str(loc) for loc in error["loc"])
+                chunk.append((line, None, f"{field}: {error['msg']}" if field else error["msg"]))
+        
+        if len(chunk) >= IMPORT_BATCH_SIZE:
+            yield chunk
+            chunk = []
+    
+    if chunk:
+        yield chunk
+
+
+@router.post("/import", response_model=PaymentImportResponse)
+async def import_payments_csv(
+    file: UploadFile,
+    session: AsyncSession = Depends(get_session),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Import payments from a CSV file, streamed and inserted in fixed-size batches.
+    
+    Columns: chit (name or id), member_phone, month, amount, date (YYYY-MM-DD),
+    and optionally method, notes and payment_type (defaults to collection).
+    Payout rows are linked to the chit's slot for that month. Each batch is
+    committed on its own; rejected rows are reported with their line number.
+    Parsing runs in a threadpool so large uploads don't block the event loop.
+    """
+    chit_ids, chit_ids_by_name = await crud_chits.get_chit_id_lookup(session)
+    member_lookup = await crud_members.get_member_ids_by_phone(session)
+    slot_lookup = await crud_slots.get_slot_ids_by_chit_month(session)
+    
+    total_rows = 0
+    imported_count = 0
+    rejected_count = 0
+    rejected = []
+    
+    def reject(line: int, detail: str):
+        nonlocal rejected_count
+        rejected_count += 1
+        if len(rejected) < IMPORT_REJECTED_LIMIT:
+            rejected.append({"line": line, "detail": detail})
+    
+    chunks = parse_import_rows(file.file, chit_ids, chit_ids_by_name, member_lookup, slot_lookup)
+    async for chunk in iterate_in_threadpool(chunks):
+        total_rows += len(chunk)
+        batch = []
+        for line, payment_in, detail in chunk:
+            if payment_in is None:
+                reject(line, detail)
+            else:
+                batch.append((line, payment_in))
+        if not batch:
+            continue
+        
+        results = await crud_payments.create_bulk(session, [payment for _, payment in batch])
+        for (line, _), result in zip(batch, results):
+            if result["status"] == "created":
+                imported_count += 1
+            else:
+                reject(line, result["detail"])
+    
+    return {
+        "total_rows": total_rows,
+        "imported_count": imported_count,
+        "rejected_count": rejected_count,
+        "rejected": rejected,
+    }
 
 
 @router.patch("/{payment_id}", response_model=PaymentResponse)
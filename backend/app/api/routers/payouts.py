@@ -1,82 +1,119 @@
 # backend/app/api/routers/payouts.py
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import Annotated, Optional, List
+from typing import Annotated
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_session
 from app.models.auth import AuthorizedPhone
-from app.models.slots import ChitSlot, SlotStatus
-from app.models.payments import PaymentType
 from app.security.dependencies import get_current_user
 from app.crud import crud_slots, crud_chits, crud_members
-from app.schemas.slots import ChitSlotResponse, ChitSlotListResponse, ChitSlotUpdate
+from app.crud.crud_slots import encode_payout_cursor, decode_payout_cursor
+from app.schemas.slots import (
+    ChitSlotResponse, ChitSlotListResponse, ChitSlotUpdate, PayoutListQuery, PayoutSummaryQuery, PayoutSummaryResponse
+)
 from app.schemas.members import MemberPublic
-from app.schemas.chits import ChitNested
 
 router = APIRouter(prefix="/payouts", tags=["payouts"])
 
 
-def slot_to_payout_response(slot: ChitSlot) -> dict:
+def payout_row_to_response(row: RowMapping) -> dict:
     """
-    Transform a ChitSlot model into a payout response dict with computed payment fields.
-    Aggregates payment data from the payments relationship.
+    Transform a flat payout row from CRUDSlot.get_payout_rows into a payout response dict.
+    Payment aggregates (amount_paid, latest payment details) are already computed in SQL.
     """
-    # Filter to only payout payments
-    payout_payments = [p for p in (slot.payments or []) if p.payment_type == PaymentType.PAYOUT]
+    member = None
+    if row["member_id"] is not None:
+        member = MemberPublic(
+            id=row["member_id"],
+            full_name=row["member_full_name"],
+            phone_number=row["member_phone_number"],
+            created_at=row["member_created_at"],
+            updated_at=row["member_updated_at"],
+        )
     
-    # Sum of all payout payment amounts (in rupees)
-    amount_paid = sum(p.amount for p in payout_payments if p.amount is not None)
-    
-    # Get the most recent payment for date/method/notes
-    sorted_payments = sorted(
-        [p for p in payout_payments if p.date is not None],
-        key=lambda p: p.date,
-        reverse=True
-    )
-    latest_payment = sorted_payments[0] if sorted_payments else None
-    
-    # Build response dict
-    response_data = {
-        "id": slot.id,
-        "month": slot.month,
-        "payout_amount": slot.payout_amount,
-        "bid_amount": slot.bid_amount,
-        "expected_contribution": slot.expected_contribution,
-        "chit_id": slot.chit_id,
-        "status": slot.status,
-        "member_id": slot.member_id,
-        "created_at": slot.created_at,
-        "updated_at": slot.updated_at,
+    return {
+        "id": row["id"],
+        "month": row["month"],
+        "payout_amount": row["payout_amount"],
+        "bid_amount": row["bid_amount"],
+        "expected_contribution": row["expected_contribution"],
+        "chit_id": row["chit_id"],
+        "status": row["status"],
+        "member_id": row["member_id"],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
         # Nested objects
-        "member": MemberPublic.model_validate(slot.member) if slot.member else None,
+        "member": member,
         # Computed payment fields
-        "amount_paid": amount_paid,
-        "paid_date": latest_payment.date if latest_payment else None,
-        "payment_method": latest_payment.method.value if latest_payment and latest_payment.method else None,
-        "notes": latest_payment.notes if latest_payment else None,
+        "amount_paid": row["amount_paid"],
+        "paid_date": row["paid_date"],
+        "payment_method": row["payment_method"].value if row["payment_method"] else None,
+        "notes": row["notes"],
     }
-    
-    return response_data
 
 
-def slots_to_payout_response_list(slots: List[ChitSlot]) -> List[dict]:
-    """Transform a list of slots to payout response dicts."""
-    return [slot_to_payout_response(s) for s in slots]
+async def get_payout_response(session: AsyncSession, slot_id: int) -> dict:
+    """Load a single slot's payout row and transform it into a response dict."""
+    rows = await crud_slots.get_payout_rows(session, slot_id=slot_id)
+    if not rows:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Slot not found")
+    return payout_row_to_response(rows[0])
 
 
 @router.get("", response_model=ChitSlotListResponse)
 async def read_all_payouts(
+    params: Annotated[PayoutListQuery, Query()],
     current_user: Annotated[AuthorizedPhone, Depends(get_current_user)],
     session: Annotated[AsyncSession, Depends(get_session)],
-    status_filter: Optional[SlotStatus] = Query(default=None, alias="status"),
 ):
-    """Get all slots (payouts). Optional status filter."""
-    if status_filter:
-        slots_list = await crud_slots.get_by_status(session, status_filter)
-    else:
-        slots_list = await crud_slots.get_all(session)
-    return {"slots": slots_to_payout_response_list(slots_list)}
+    """
+    Get slots (payouts) ordered by chit and month, one page at a time.
+    Filters: chit_id, member_id, status, month_from/month_to, has_unpaid_balance,
+    and paid_from/paid_to on the latest payout payment date.
+    Pass the returned next_cursor as `cursor` to fetch the following page.
+    """
+    after = None
+    if params.cursor:
+        try:
+            after = decode_payout_cursor(params.cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    rows = await crud_slots.get_payout_rows(
+        session,
+        chit_id=params.chit_id,
+        member_id=params.member_id,
+        status=params.status,
+        month_from=params.month_from,
+        month_to=params.month_to,
+        has_unpaid_balance=params.has_unpaid_balance,
+        paid_from=params.paid_from,
+        paid_to=params.paid_to,
+        after=after,
+        limit=params.limit + 1
+    )
+    next_cursor = None
+    if len(rows) > params.limit:
+        rows = rows[:params.limit]
+        next_cursor = encode_payout_cursor(rows[-1]["chit_id"], rows[-1]["month"])
+    return {"slots": [payout_row_to_response(row) for row in rows], "next_cursor": next_cursor}
+
+
+@router.get("/summary", response_model=PayoutSummaryResponse)
+async def read_payouts_summary(
+    params: Annotated[PayoutSummaryQuery, Query()],
+    current_user: Annotated[AuthorizedPhone, Depends(get_current_user)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """Get the count, planned total and paid total of the payouts scheduled in a calendar month."""
+    count, paid_count, payout_total, amount_paid = await crud_slots.get_month_summary(
+        session, params.year, params.month
+    )
+    return PayoutSummaryResponse(
+        count=count, paid_count=paid_count, payout_total=payout_total, amount_paid=amount_paid
+    )
 
 
 @router.get("/chit/{chit_id}", response_model=ChitSlotListResponse)
@@ -90,8 +127,8 @@ async def read_payouts_by_chit(
     if not db_chit:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Chit not found")
     
-    slots_list = await crud_slots.get_by_chit(session, chit_id)
-    return {"slots": slots_to_payout_response_list(slots_list)}
+    rows = await crud_slots.get_payout_rows(session, chit_id=chit_id)
+    return {"slots": [payout_row_to_response(row) for row in rows]}
 
 
 @router.get("/member/{member_id}", response_model=ChitSlotListResponse)
@@ -105,8 +142,8 @@ async def read_payouts_by_member(
     if not db_member:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
 
-    slots_list = await crud_slots.get_by_member(session, member_id)
-    return {"slots": slots_to_payout_response_list(slots_list)}
+    rows = await crud_slots.get_payout_rows(session, member_id=member_id)
+    return {"slots": [payout_row_to_response(row) for row in rows]}
 
 
 @router.get("/{slot_id}", response_model=ChitSlotResponse)
@@ -116,10 +153,7 @@ async def read_payout(
     session: Annotated[AsyncSession, Depends(get_session)],
 ):
     """Get a specific slot (payout) by ID."""
-    slot = await crud_slots.get(session, slot_id)
-    if not slot:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Slot not found")
-    return slot_to_payout_response(slot)
+    return await get_payout_response(session, slot_id)
 
 
 @router.put("/{slot_id}", response_model=ChitSlotResponse)
@@ -160,12 +194,10 @@ async def update_payout(
                         detail=str(e)
                     )
                 
-                # record_auction_month commits, so return refreshed slot
-                updated_slot = await crud_slots.get(session, slot_id)
-                return slot_to_payout_response(updated_slot)
+                # record_auction_month commits, so return refreshed payout row
+                return await get_payout_response(session, slot_id)
 
     await crud_slots.update(db=session, db_obj=db_slot, obj_in=slot_in)
     
-    # Re-fetch with relationships
-    updated_slot = await crud_slots.get(session, slot_id)
-    return slot_to_payout_response(updated_slot)
+    # Re-fetch with payout aggregates
+    return await get_payout_response(session, slot_id)
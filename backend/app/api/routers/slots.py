@@ -7,8 +7,7 @@ from app.db.session import get_session
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.auth import AuthorizedPhone
 from app.security.dependencies import get_current_user
-from app.crud import crud_chits, crud_members, crud_slots, crud_payments
-from app.models.payments import PaymentType
+from app.crud import crud_chits, crud_members, crud_slots
 from app.schemas import slots as slots_schemas
 from app.schemas.members import MemberPublic
 
@@ -63,7 +62,7 @@ async def assign_member_to_slot(
     )
 
 
-@router.post("/chit/{chit_id}/bulk-assign", status_code=status.HTTP_201_CREATED)
+@router.post("/chit/{chit_id}/bulk-assign", response_model=slots_schemas.BulkSlotAssignmentResponse, status_code=status.HTTP_201_CREATED)
 async def bulk_assign_members(
     chit_id: int,
     bulk_data: slots_schemas.BulkSlotAssignmentRequest,
@@ -72,17 +71,14 @@ async def bulk_assign_members(
 ):
     """
     Assigns multiple members to multiple slots for a single chit in one transaction.
+    Returns a per-item report; items whose slot is missing or already taken are skipped.
     """
     db_chit = await crud_chits.get_chit_by_id(session, chit_id=chit_id)
     if not db_chit:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Chit not found")
     
     try:
-        for item in bulk_data.assignments:
-            # Get the slot
-            slot = await crud_slots.get_by_chit_and_month(session, chit_id=chit_id, month=item.month)
-            if slot and slot.member_id is None:
-                await crud_slots.assign_member(session, slot, item.member_id)
+        results = await crud_slots.bulk_assign_members(session, chit_id=chit_id, assignments=bulk_data.assignments)
     except Exception as e:
         await session.rollback()
         raise HTTPException(
@@ -90,7 +86,14 @@ async def bulk_assign_members(
             detail=f"Failed to create assignments. Error: {str(e)}"
         )
     
-    return {"message": "Assignments created successfully."}
+    assigned_count = sum(1 for r in results if r["status"] == "assigned")
+    skipped_count = len(results) - assigned_count
+    return {
+        "message": f"Assigned {assigned_count} of {len(results)} slot(s); {skipped_count} skipped.",
+        "assigned_count": assigned_count,
+        "skipped_count": skipped_count,
+        "results": results,
+    }
 
 
 @router.get("/chit/{chit_id}/unassigned", response_model=slots_schemas.UnassignedMonthResponse)
@@ -152,29 +155,22 @@ async def get_member_slots(
     if not member:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
     
-    member_slots = await crud_slots.get_by_member(session, member_id=member_id)
+    # Collection totals and payout flags are aggregated in SQL alongside the slots
+    member_slots = await crud_slots.get_by_member_with_totals(session, member_id=member_id)
     
     result = []
-    for slot in member_slots:
+    for slot, total_paid, has_payout in member_slots:
         chit = slot.chit
         
         # Calculate expected contribution based on chit type
         if chit.chit_type.value == "fixed":
             expected = chit.base_contribution
         elif chit.chit_type.value == "variable":
-            # Check if member has received payout (slot has payments)
-            has_payout = bool(slot.payments)
+            # Member pays premium once a payout has been made for their slot
             expected = chit.premium_contribution if has_payout else chit.base_contribution
         else:  # auction
             expected = slot.expected_contribution or (chit.chit_value // chit.size if chit.size > 0 else 0)
         
-        # Get collection payments for this member in this slot's month
-        all_payments = await crud_payments.get_by_member(session, member_id=member_id)
-        member_collection_payments = [
-            p for p in all_payments
-            if p.chit_id == chit.id and p.month == slot.month and p.payment_type == PaymentType.COLLECTION
-        ]
-        total_paid = sum(p.amount for p in member_collection_payments)
         due_amount = expected - total_paid
         
         if total_paid == 0:
@@ -7,6 +7,18 @@ from typing import List, Any
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    
+    # Database connection pool (see app/db/session.py)
+    DB_POOL_SIZE: int = 10  # Connections kept open
+    DB_MAX_OVERFLOW: int = 20  # Extra connections allowed under burst load
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0  # Max wait for a free connection before failing
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # Replace connections before MySQL's wait_timeout drops them
+    DB_POOL_PRE_PING: bool = True  # Test connections on checkout; reconnect if dropped while idle
+    
+    # SQL logging: DB_ECHO logs every statement (local debugging only);
+    # DB_SQL_LOG_SAMPLE_RATE logs that fraction of statements (0.0 - 1.0) to the app.db.sql logger
+    DB_ECHO: bool = False
+    DB_SQL_LOG_SAMPLE_RATE: float = 0.0
 
     # Security
     SECRET_KEY: str
@@ -23,6 +35,9 @@ class Settings(BaseSettings):
     # Cookie Security
     COOKIE_SECURE: bool = False
 
+    # Idempotency keys (stored responses for retried POST requests)
+    IDEMPOTENCY_KEY_TTL_HOURS: int = 24
+
     # Fixed validator - using mode='before' and proper type checking
     @field_validator("AUTHORIZED_PHONE_NUMBERS", mode='before')
     @classmethod
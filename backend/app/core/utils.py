@@ -6,3 +6,8 @@ from datetime import datetime, timezone
 def utc_now() -> datetime:
     """Return current UTC time (timezone-aware)."""
     return datetime.now(timezone.utc)
+
+
+def normalize_name(name: str) -> str:
+    """Return the case-insensitive comparison form of a name (trimmed, lowercased)."""
+    return name.strip().lower()
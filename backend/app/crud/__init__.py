@@ -4,6 +4,8 @@
 from app.crud import crud_chits
 from app.crud import crud_members
 from app.crud import crud_payments
+from app.crud import crud_ledger
+from app.crud import crud_idempotency
 
 # Import class-based CRUD singletons
 from app.crud.crud_slots import slots as crud_slots
@@ -12,5 +14,7 @@ __all__ = [
     "crud_chits",
     "crud_members",
     "crud_payments",
+    "crud_ledger",
+    "crud_idempotency",
     "crud_slots",
 ]
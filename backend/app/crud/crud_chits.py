@@ -1,24 +1,26 @@
 # backend/app/crud/crud_chits.py
 
+from typing import Dict, List, Set, Tuple
 from sqlmodel import select, func
+from sqlalchemy import Select, and_, case, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from app.core.utils import normalize_name
 from app.models.chits import Chit
 from app.models.slots import ChitSlot
+from app.models.ledger import CollectionLedger
 from datetime import date, datetime, timezone
 from dateutil.relativedelta import relativedelta
-from app.schemas.chits import ChitResponse
+from app.schemas.chits import ChitResponse, ChitSummary
 
 
 async def get_chit_by_id(session: AsyncSession, chit_id: int) -> Chit | None:
-    """Get chit by ID."""
-    return await session.get(Chit, chit_id)
+    """Get chit by ID, without its notes (use session.get where the notes are needed)."""
+    return await session.get(Chit, chit_id, options=[defer(Chit.notes)])
 
 
-async def get_chit_by_id_with_details(session: AsyncSession, chit_id: int) -> ChitResponse | None:
-    db_chit = await session.get(Chit, chit_id)
-    if not db_chit:
-        return None
-
+def build_chit_summary(db_chit: Chit, members_count: int) -> ChitSummary:
+    """Build a ChitSummary from a chit row and its assigned slot count."""
     today = date.today()
     status = "Active" if db_chit.start_date <= today <= db_chit.end_date else "Inactive"
     
@@ -29,17 +31,10 @@ async def get_chit_by_id_with_details(session: AsyncSession, chit_id: int) -> Ch
     else:
         chit_cycle = f"-/{db_chit.duration_months}"
 
-    # Count total assigned slots for this chit (slots with member_id set)
-    members_count_result = await session.execute(
-        select(func.count(ChitSlot.id))
-        .where(ChitSlot.chit_id == chit_id, ChitSlot.member_id.isnot(None))
-    )
-    members_count = members_count_result.scalar() or 0
-
     # Handle chit_type - convert enum to string if needed
     chit_type_value = db_chit.chit_type.value if hasattr(db_chit.chit_type, 'value') else db_chit.chit_type
 
-    return ChitResponse(
+    return ChitSummary(
         id=db_chit.id,
         name=db_chit.name,
         chit_value=db_chit.chit_value,
@@ -58,16 +53,119 @@ async def get_chit_by_id_with_details(session: AsyncSession, chit_id: int) -> Ch
         premium_contribution=db_chit.premium_contribution,
         payout_premium_percent=db_chit.payout_premium_percent,
         foreman_commission_percent=db_chit.foreman_commission_percent,
-        # Optional notes field
-        notes=db_chit.notes,
         # Audit timestamps
         created_at=db_chit.created_at,
         updated_at=db_chit.updated_at,
     )
 
 
+def build_chit_response(db_chit: Chit, members_count: int) -> ChitResponse:
+    """Build a ChitResponse (summary plus notes) for detail endpoints."""
+    return ChitResponse(
+        **build_chit_summary(db_chit, members_count).model_dump(),
+        notes=db_chit.notes,
+    )
+
+
+def name_taken_statement(name: str, exclude_id: int | None = None) -> Select:
+    """Select the id of a chit whose name matches case-insensitively (other than exclude_id)."""
+    statement = select(Chit.id).where(Chit.name_normalized == normalize_name(name))
+    if exclude_id is not None:
+        statement = statement.where(Chit.id != exclude_id)
+    return statement
+
+
+async def is_name_taken(session: AsyncSession, name: str, exclude_id: int | None = None) -> bool:
+    """Whether another chit already uses this name (case-insensitive, one unique-index lookup)."""
+    result = await session.execute(name_taken_statement(name, exclude_id))
+    return result.first() is not None
+
+
+async def get_existing_names(session: AsyncSession, names: List[str]) -> List[str]:
+    """Return the stored names of chits matching any of the given names (case-insensitive)."""
+    if not names:
+        return []
+    result = await session.execute(
+        select(Chit.name).where(Chit.name_normalized.in_([normalize_name(name) for name in names]))
+    )
+    return list(result.scalars().all())
+
+
+async def bulk_create_chits(session: AsyncSession, db_chits: List[Chit]) -> None:
+    """Insert several new chits as one batched INSERT and fill in their ids.
+    
+    Runs inside the caller's transaction; the caller commits.
+    """
+    rows = [db_chit.model_dump(exclude={"id"}) for db_chit in db_chits]
+    if session.bind.dialect.insert_executemany_returning:
+        result = await session.execute(insert(Chit).returning(Chit.id, Chit.name_normalized), rows)
+    else:
+        # MySQL has no INSERT ... RETURNING; look the ids up by the unique normalized name
+        await session.execute(insert(Chit), rows)
+        result = await session.execute(
+            select(Chit.id, Chit.name_normalized)
+            .where(Chit.name_normalized.in_([db_chit.name_normalized for db_chit in db_chits]))
+        )
+    ids_by_name = {name_normalized: chit_id for chit_id, name_normalized in result.all()}
+    for db_chit in db_chits:
+        db_chit.id = ids_by_name[db_chit.name_normalized]
+
+
+async def get_chit_id_lookup(session: AsyncSession) -> Tuple[Set[int], Dict[str, int]]:
+    """Get the set of chit IDs and a map from normalized chit name (see `normalize_name`) to ID."""
+    result = await session.execute(select(Chit.id, Chit.name_normalized))
+    chit_ids = set()
+    ids_by_name = {}
+    for chit_id, name_normalized in result.all():
+        chit_ids.add(chit_id)
+        ids_by_name[name_normalized] = chit_id
+    return chit_ids, ids_by_name
+
+
+async def get_chit_by_id_with_details(session: AsyncSession, chit_id: int) -> ChitResponse | None:
+    db_chit = await session.get(Chit, chit_id)
+    if not db_chit:
+        return None
+
+    # Count total assigned slots for this chit (slots with member_id set)
+    members_count_result = await session.execute(
+        select(func.count(ChitSlot.id))
+        .where(ChitSlot.chit_id == chit_id, ChitSlot.member_id.isnot(None))
+    )
+    members_count = members_count_result.scalar() or 0
+
+    return build_chit_response(db_chit, members_count)
+
+
+async def get_all_chits_with_details(session: AsyncSession) -> list[ChitSummary]:
+    """
+    Get all chits with their assigned member counts in a single grouped query.
+    Active chits come first, then inactive ones, each ordered by start_date.
+    Notes are not loaded; fetch a single chit for those.
+    """
+    today = date.today()
+    is_inactive = case(
+        (and_(Chit.start_date <= today, Chit.end_date >= today), 0),
+        else_=1
+    )
+    statement = (
+        select(Chit, func.count(ChitSlot.id))
+        .outerjoin(
+            ChitSlot,
+            and_(ChitSlot.chit_id == Chit.id, ChitSlot.member_id.isnot(None))
+        )
+        .group_by(Chit.id)
+        .order_by(is_inactive, Chit.start_date, Chit.id)
+        .options(defer(Chit.notes))
+    )
+    result = await session.execute(statement)
+    return [build_chit_summary(db_chit, members_count) for db_chit, members_count in result.all()]
+
+
 async def delete_chit_by_id(session: AsyncSession, db_chit: Chit):
     """Permanently deletes a chit from the database."""
+    # Ledger rows are not ORM children of the chit, so clear them explicitly
+    await session.execute(delete(CollectionLedger).where(CollectionLedger.chit_id == db_chit.id))
     await session.delete(db_chit)
     await session.commit()
 
@@ -80,14 +178,16 @@ async def record_auction_month(
     chit_id: int,
     month: int,
     bid_amount: int,
-    member_id: int | None = None
+    member_id: int | None = None,
+    commit: bool = True
 ) -> dict:
     """
     Record or Update an auction for a specific month.
     Calculates dividends based on Chit Size (Total Members) and updates the slot.
+    With commit=False the changes are only flushed and the caller commits.
     """
     # 1. Fetch Chit details
-    db_chit = await session.get(Chit, chit_id)
+    db_chit = await session.get(Chit, chit_id, options=[defer(Chit.notes)])
     if not db_chit:
         raise ValueError("Chit not found")
     
@@ -149,7 +249,10 @@ async def record_auction_month(
         )
         session.add(db_slot)
 
-    await session.commit()
+    if commit:
+        await session.commit()
+    else:
+        await session.flush()
     
     return {
         "dividend_per_member": dividend_per_member,
@@ -0,0 +1,98 @@
+# backend/app/crud/crud_idempotency.py
+
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Tuple
+
+from sqlmodel import select
+from sqlalchemy import Select, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.idempotency import IdempotencyKey
+
+
+def hash_request(payload: Any) -> str:
+    """Get a stable SHA-256 hex digest of a JSON-compatible request payload."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def expiry_cutoff() -> datetime:
+    """Get the creation time before which stored keys are expired."""
+    return datetime.now(timezone.utc) - timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS)
+
+
+def get_statement(scope: str, key: str) -> Select:
+    """Select the record for a key in a scope, with whether it has expired."""
+    return select(
+        IdempotencyKey,
+        (IdempotencyKey.created_at < expiry_cutoff()).label("expired")
+    ).where(
+        IdempotencyKey.scope == scope,
+        IdempotencyKey.key == key
+    )
+
+
+async def get(db: AsyncSession, scope: str, key: str) -> Optional[IdempotencyKey]:
+    """Get the unexpired record for a key in a scope (one unique-index lookup).
+    
+    An expired record holding the key is deleted by primary key, so the key can be
+    reused without locking a range of the unique index.
+    """
+    row = (await db.execute(get_statement(scope, key))).first()
+    if row is None:
+        return None
+    record, expired = row
+    if expired:
+        await db.execute(delete(IdempotencyKey).where(IdempotencyKey.id == record.id))
+        return None
+    return record
+
+
+async def save(
+    db: AsyncSession,
+    scope: str,
+    key: str,
+    request_hash: str,
+    status_code: int,
+    response_body: Any,
+) -> Tuple[IdempotencyKey, bool]:
+    """Store a key with its response inside the caller's transaction, after the write it guards.
+    
+    The record is flushed, not committed: it commits together with the write. If a
+    concurrent request committed the same key first, the unique index rejects the insert;
+    the whole transaction (the caller's write included) is rolled back.
+    
+    Returns (record, True) when the key was stored, or (existing record, False) when the
+    key was already used.
+    """
+    record = IdempotencyKey(
+        scope=scope,
+        key=key,
+        request_hash=request_hash,
+        status_code=status_code,
+        response_body=json.dumps(response_body)
+    )
+    db.add(record)
+    try:
+        await db.flush()
+    except IntegrityError:
+        # A concurrent request committed the key first
+        await db.rollback()
+        existing = await get(db, scope, key)
+        if existing is None:
+            raise
+        return existing, False
+    return record, True
+
+
+async def prune(db: AsyncSession) -> int:
+    """Delete expired keys. Returns the number of rows deleted."""
+    result = await db.execute(
+        delete(IdempotencyKey).where(IdempotencyKey.created_at < expiry_cutoff())
+    )
+    await db.commit()
+    return result.rowcount
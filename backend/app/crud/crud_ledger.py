@@ -0,0 +1,128 @@
+# backend/app/crud/crud_ledger.py
+
+from typing import Dict, Tuple
+from sqlmodel import select, func
+from sqlalchemy import Select, delete, literal
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.utils import utc_now
+from app.models.ledger import CollectionLedger
+from app.models.payments import Payment, PaymentType
+
+
+async def apply_collection_delta(
+    db: AsyncSession,
+    chit_id: int,
+    month: int,
+    member_id: int,
+    amount_delta: int,
+    count_delta: int
+) -> None:
+    """
+    Add a collection payment change to the ledger row for (chit_id, month, member_id).
+    Upserts with an in-database increment inside the caller's transaction; the caller commits.
+    A row left with no payments is deleted, so it does not keep the chit or member referenced.
+    """
+    now = utc_now()
+    values = dict(
+        chit_id=chit_id,
+        month=month,
+        member_id=member_id,
+        amount_collected=amount_delta,
+        payment_count=count_delta,
+        created_at=now,
+        updated_at=now,
+    )
+    increments = dict(
+        amount_collected=CollectionLedger.amount_collected + amount_delta,
+        payment_count=CollectionLedger.payment_count + count_delta,
+        updated_at=now,
+    )
+    if db.get_bind().dialect.name == "mysql":
+        statement = mysql.insert(CollectionLedger).values(**values).on_duplicate_key_update(**increments)
+    else:
+        statement = sqlite.insert(CollectionLedger).values(**values).on_conflict_do_update(
+            index_elements=["chit_id", "month", "member_id"],
+            set_=increments
+        )
+    await db.execute(statement)
+    if count_delta < 0:
+        await db.execute(
+            delete(CollectionLedger).where(
+                CollectionLedger.chit_id == chit_id,
+                CollectionLedger.month == month,
+                CollectionLedger.member_id == member_id,
+                CollectionLedger.payment_count <= 0
+            )
+        )
+
+
+async def rebuild(db: AsyncSession) -> int:
+    """
+    Rebuild the whole ledger from COLLECTION payments in one transaction.
+    Returns the number of ledger rows written.
+    """
+    now = utc_now()
+    await db.execute(delete(CollectionLedger))
+    result = await db.execute(
+        CollectionLedger.__table__.insert().from_select(
+            ["chit_id", "month", "member_id", "amount_collected", "payment_count", "created_at", "updated_at"],
+            select(
+                Payment.chit_id,
+                Payment.month,
+                Payment.member_id,
+                func.sum(Payment.amount),
+                func.count(Payment.id),
+                literal(now),
+                literal(now)
+            )
+            .where(Payment.payment_type == PaymentType.COLLECTION)
+            .group_by(Payment.chit_id, Payment.month, Payment.member_id)
+        )
+    )
+    await db.commit()
+    return result.rowcount
+
+
+# Statement builders, shared with the query-plan check in app.db.query_plans
+
+def total_statement(chit_id: int, member_id: int, month: int) -> Select:
+    return select(CollectionLedger.amount_collected).where(
+        CollectionLedger.chit_id == chit_id,
+        CollectionLedger.month == month,
+        CollectionLedger.member_id == member_id
+    )
+
+
+def totals_by_month_statement(chit_id: int) -> Select:
+    return (
+        select(CollectionLedger.month, func.sum(CollectionLedger.amount_collected))
+        .where(CollectionLedger.chit_id == chit_id)
+        .group_by(CollectionLedger.month)
+    )
+
+
+def totals_for_member_statement(member_id: int) -> Select:
+    return (
+        select(CollectionLedger.chit_id, CollectionLedger.month, CollectionLedger.amount_collected)
+        .where(CollectionLedger.member_id == member_id)
+    )
+
+
+async def get_total(db: AsyncSession, chit_id: int, member_id: int, month: int) -> int:
+    """Get the collected amount for a member in a chit month (point lookup)."""
+    result = await db.execute(total_statement(chit_id, member_id, month))
+    return int(result.scalar_one_or_none() or 0)
+
+
+async def get_totals_by_month(db: AsyncSession, chit_id: int) -> Dict[int, int]:
+    """Get the collected amount per month for a chit, keyed by month number."""
+    result = await db.execute(totals_by_month_statement(chit_id))
+    return {month: int(total or 0) for month, total in result.all()}
+
+
+async def get_totals_for_member(db: AsyncSession, member_id: int) -> Dict[Tuple[int, int], int]:
+    """Get the collected amount for a member, keyed by (chit_id, month)."""
+    result = await db.execute(totals_for_member_statement(member_id))
+    return {(chit_id, month): amount for chit_id, month, amount in result.all()}
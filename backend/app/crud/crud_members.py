@@ -1,11 +1,16 @@
 # backend/app/crud/crud_members.py
 
-from sqlmodel import select
+import re
+
+from sqlmodel import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import or_
+from sqlalchemy import Select, case, delete, insert
 from sqlalchemy.orm import selectinload
 
 from app.models.members import Member
+from app.models.member_search import MemberSearchToken
+from app.models.ledger import CollectionLedger
+from app.models.chits import Chit
 from app.models.slots import ChitSlot
 from app.schemas.members import MemberCreate, MemberUpdate
 
@@ -17,9 +22,17 @@ async def get_member_by_phone(session: AsyncSession, phone_number: str) -> Membe
     return result.scalar_one_or_none()
 
 
+async def get_member_ids_by_phone(session: AsyncSession) -> dict[str, int]:
+    """Get a phone number -> member ID lookup for all members."""
+    result = await session.execute(select(Member.phone_number, Member.id))
+    return {phone_number: member_id for phone_number, member_id in result.all()}
+
+
 async def create_member(session: AsyncSession, member_in: MemberCreate) -> Member:
     db_member = Member.model_validate(member_in)
     session.add(db_member)
+    await session.flush()
+    await sync_search_tokens(session, db_member)
     await session.commit()
     await session.refresh(db_member)
     return db_member
@@ -32,6 +45,7 @@ async def get_all_members(session: AsyncSession) -> list[Member]:
         .options(
             selectinload(Member.slots)
             .selectinload(ChitSlot.chit)
+            .defer(Chit.notes)
         )
         .order_by(Member.full_name)
     )
@@ -40,15 +54,104 @@ async def get_all_members(session: AsyncSession) -> list[Member]:
     return result.scalars().unique().all()
 
 
-async def search_members(session: AsyncSession, query: str) -> list[Member]:
-    """Search members by name or phone."""
-    search_term = f"%{query.lower()}%"
-    statement = select(Member).where(
-        or_(
-            Member.full_name.ilike(search_term),
-            Member.phone_number.ilike(search_term)
+def name_tokens(full_name: str) -> set[str]:
+    """Split a name into the lowercase words stored as MemberSearchToken rows."""
+    return {token[:100] for token in re.findall(r"\w+", full_name.lower())}
+
+
+async def sync_search_tokens(session: AsyncSession, db_member: Member) -> None:
+    """Replace a member's search tokens with those of its current name. The caller commits."""
+    await session.execute(delete(MemberSearchToken).where(MemberSearchToken.member_id == db_member.id))
+    tokens = name_tokens(db_member.full_name)
+    if tokens:
+        await session.execute(
+            insert(MemberSearchToken),
+            [{"member_id": db_member.id, "token": token} for token in tokens]
+        )
+
+
+async def rebuild_search_tokens(session: AsyncSession, batch_size: int = 1000) -> int:
+    """Rebuild every member's search tokens. Returns the number of tokens written.
+    
+    Members are read in buffered pages keyed on id (not a streamed cursor), so the
+    token inserts between pages never run while a result set is still open.
+    """
+    await session.execute(delete(MemberSearchToken))
+    written = 0
+    last_id = 0
+    while True:
+        result = await session.execute(
+            select(Member.id, Member.full_name)
+            .where(Member.id > last_id)
+            .order_by(Member.id)
+            .limit(batch_size)
+        )
+        page = result.all()
+        if not page:
+            break
+        rows = [
+            {"member_id": member_id, "token": token}
+            for member_id, full_name in page
+            for token in name_tokens(full_name)
+        ]
+        if rows:
+            await session.execute(insert(MemberSearchToken), rows)
+            written += len(rows)
+        last_id = page[-1][0]
+    await session.commit()
+    return written
+
+
+def search_statement(query: str, limit: int = 20) -> Select | None:
+    """Build the member search query (see search_members); None when the query has no terms."""
+    normalized = " ".join(query.lower().split())
+    terms = sorted(name_tokens(normalized), key=len, reverse=True)
+    
+    if normalized.isdigit():
+        criteria = [Member.phone_number.startswith(normalized, autoescape=True)]
+        rank = case((Member.phone_number == normalized, 0), else_=1)
+    elif terms:
+        criteria = [
+            Member.id.in_(
+                select(MemberSearchToken.member_id)
+                .where(MemberSearchToken.token.startswith(term, autoescape=True))
+            )
+            for term in terms
+        ]
+        lowered_name = func.lower(Member.full_name)
+        rank = case(
+            (lowered_name == normalized, 0),
+            (lowered_name.startswith(normalized, autoescape=True), 1),
+            (
+                Member.id.in_(
+                    select(MemberSearchToken.member_id)
+                    .where(MemberSearchToken.token.in_(terms))
+                ),
+                2
+            ),
+            else_=3
         )
-    ).order_by(Member.full_name)
+    else:
+        return None
+    
+    return (
+        select(Member)
+        .where(*criteria)
+        .order_by(rank, Member.full_name, Member.id)
+        .limit(limit)
+    )
+
+
+async def search_members(session: AsyncSession, query: str, limit: int = 20) -> list[Member]:
+    """Search members by phone number prefix or by name word prefixes, best matches first.
+    
+    Digits match the start of the phone number. Otherwise every word of the query must
+    prefix a word of the name ("ra ku" finds "Ravi Kumar"), using the MemberSearchToken
+    index. Ranking: exact name, name prefix, exact word match, then other matches.
+    """
+    statement = search_statement(query, limit)
+    if statement is None:
+        return []
     result = await session.execute(statement)
     return result.scalars().all()
 
@@ -65,6 +168,8 @@ async def update_member(session: AsyncSession, db_member: Member, member_in: Mem
         setattr(db_member, key, value)
     # Note: updated_at is now automatically set by the event listener
     session.add(db_member)
+    if "full_name" in member_data:
+        await sync_search_tokens(session, db_member)
     await session.commit()
     await session.refresh(db_member)
     return db_member
@@ -72,5 +177,7 @@ async def update_member(session: AsyncSession, db_member: Member, member_in: Mem
 
 async def delete_member_by_id(session: AsyncSession, db_member: Member):
     """Permanently deletes a member from the database."""
+    await session.execute(delete(MemberSearchToken).where(MemberSearchToken.member_id == db_member.id))
+    await session.execute(delete(CollectionLedger).where(CollectionLedger.member_id == db_member.id))
     await session.delete(db_member)
     await session.commit()
\ No newline at end of file
@@ -1,56 +1,165 @@
 # backend/app/crud/crud_payments.py
 
-from sqlmodel import select
+import base64
+from sqlmodel import select, func
+from sqlalchemy import Select, and_, insert, or_, RowMapping
+from sqlalchemy.orm import selectinload
 from sqlmodel.ext.asyncio.session import AsyncSession
-from typing import List, Optional
-from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from datetime import date, datetime, timezone
 
 from app.models.payments import Payment, PaymentType
-from app.models.slots import ChitSlot, SlotStatus
-from app.schemas.payments import PaymentCreate, PaymentUpdate
+from app.models.chits import Chit
+from app.models.members import Member
+from app.models.slots import ChitSlot
+from app.crud import crud_ledger
+from app.crud.crud_slots import slots as crud_slots
+from app.schemas.payments import PaymentCreate, PaymentUpdate, PaymentFilters
+from app.schemas.month_members import PaymentSummary
 
 
-async def create(db: AsyncSession, payment_in: PaymentCreate) -> Payment:
-    """Create a new payment and update related slot status if payout."""
+# Columns and nested relationships loaded for a PaymentResponse after a write
+PAYMENT_RESPONSE_ATTRIBUTES = [*Payment.model_fields.keys(), "member", "chit"]
+
+
+async def create(db: AsyncSession, payment_in: PaymentCreate, commit: bool = True) -> Payment:
+    """Create a new payment and update the related slot's payout totals if payout.
+    
+    With commit=False the changes are only flushed and the caller commits.
+    """
     payment_data = payment_in.model_dump()
     db_payment = Payment(**payment_data)
     db.add(db_payment)
-    await db.commit()
-    await db.refresh(db_payment)
+    await db.flush()
     
-    # Update the related slot's status for payout payments
-    if payment_in.payment_type == PaymentType.PAYOUT and payment_in.slot_id:
-        await update_slot_status(db, db_payment)
+    # Update the related slot's running totals and status in the same transaction
+    if db_payment.payment_type == PaymentType.PAYOUT and db_payment.slot_id:
+        await crud_slots.apply_payout_delta(db, db_payment.slot_id, db_payment.amount)
+    elif db_payment.payment_type == PaymentType.COLLECTION:
+        await crud_ledger.apply_collection_delta(
+            db, db_payment.chit_id, db_payment.month, db_payment.member_id,
+            amount_delta=db_payment.amount, count_delta=1
+        )
     
+    if commit:
+        await db.commit()
+    await db.refresh(db_payment, attribute_names=PAYMENT_RESPONSE_ATTRIBUTES)
     return db_payment
 
 
-async def update_slot_status(db: AsyncSession, payment: Payment) -> None:
-    """Update the status of the related ChitSlot based on total payout payments."""
-    if payment.payment_type == PaymentType.PAYOUT and payment.slot_id:
-        slot = await db.get(ChitSlot, payment.slot_id)
-        if slot:
-            total_paid = await get_total_for_slot(db, payment.slot_id)
-            
-            if total_paid >= slot.payout_amount:
-                slot.status = SlotStatus.PAID
-            elif total_paid > 0:
-                slot.status = SlotStatus.PARTIAL
-            else:
-                slot.status = SlotStatus.SCHEDULED
-            
-            slot.updated_at = datetime.now(timezone.utc)
-            db.add(slot)
-            await db.commit()
+async def create_bulk(db: AsyncSession, payments_in: List[PaymentCreate]) -> List[dict]:
+    """Validate and insert many payments in one transaction.
+    
+    Chits, members and slots referenced by the batch are looked up with one query each.
+    Valid rows are inserted with a single executemany; ledger and slot payout totals are
+    updated once per distinct (chit, month, member) and slot, followed by one commit.
+    Returns a result dict (index, status, detail) per input row.
+    """
+    chit_ids = {p.chit_id for p in payments_in}
+    member_ids = {p.member_id for p in payments_in}
+    slot_ids = {p.slot_id for p in payments_in if p.slot_id}
+    
+    chit_result = await db.execute(select(Chit.id).where(Chit.id.in_(chit_ids)))
+    existing_chits = set(chit_result.scalars().all())
+    member_result = await db.execute(select(Member.id).where(Member.id.in_(member_ids)))
+    existing_members = set(member_result.scalars().all())
+    slot_chits: Dict[int, int] = {}
+    if slot_ids:
+        slot_result = await db.execute(
+            select(ChitSlot.id, ChitSlot.chit_id).where(ChitSlot.id.in_(slot_ids))
+        )
+        slot_chits = {slot_id: chit_id for slot_id, chit_id in slot_result.all()}
+    
+    now = datetime.now(timezone.utc)
+    rows = []
+    results = []
+    collection_deltas: Dict[Tuple[int, int, int], Tuple[int, int]] = {}
+    payout_deltas: Dict[int, int] = {}
+    for index, payment_in in enumerate(payments_in):
+        detail = None
+        if payment_in.payment_type == PaymentType.PAYOUT and not payment_in.slot_id:
+            detail = "slot_id is required for payout payments"
+        elif payment_in.payment_type == PaymentType.COLLECTION and payment_in.slot_id:
+            detail = "slot_id should not be provided for collection payments"
+        elif payment_in.chit_id not in existing_chits:
+            detail = "Chit not found"
+        elif payment_in.member_id not in existing_members:
+            detail = "Member not found"
+        elif payment_in.slot_id and slot_chits.get(payment_in.slot_id) != payment_in.chit_id:
+            detail = "Slot not found for this chit"
+        
+        if detail:
+            results.append({"index": index, "status": "rejected", "detail": detail})
+            continue
+        
+        rows.append({**payment_in.model_dump(), "created_at": now, "updated_at": now})
+        results.append({"index": index, "status": "created", "detail": None})
+        if payment_in.payment_type == PaymentType.PAYOUT:
+            payout_deltas[payment_in.slot_id] = payout_deltas.get(payment_in.slot_id, 0) + payment_in.amount
+        else:
+            key = (payment_in.chit_id, payment_in.month, payment_in.member_id)
+            amount, count = collection_deltas.get(key, (0, 0))
+            collection_deltas[key] = (amount + payment_in.amount, count + 1)
+    
+    if rows:
+        await db.execute(insert(Payment), rows)
+        for (chit_id, month, member_id), (amount, count) in collection_deltas.items():
+            await crud_ledger.apply_collection_delta(
+                db, chit_id, month, member_id, amount_delta=amount, count_delta=count
+            )
+        for slot_id, amount in payout_deltas.items():
+            await crud_slots.apply_payout_delta(db, slot_id, amount)
+        await db.commit()
+    
+    return results
 
 
-async def get_total_for_slot(db: AsyncSession, slot_id: int) -> int:
-    """Get total amount paid for a specific slot (payout payments)."""
+# --- Aggregate query layer ---
+# Totals are computed with SUM() in the database instead of loading Payment rows.
+# Collection totals are served from the incrementally maintained CollectionLedger.
+
+def amount_total_statement(*criteria) -> Select:
+    return select(func.coalesce(func.sum(Payment.amount), 0)).where(*criteria)
+
+
+async def get_amount_total(db: AsyncSession, *criteria) -> int:
+    """Get SUM(amount) of the payments matching all criteria (0 when none match)."""
+    result = await db.execute(amount_total_statement(*criteria))
+    return int(result.scalar_one())
+
+
+def summary_statement(*criteria) -> Select:
+    return select(func.count(Payment.id), func.coalesce(func.sum(Payment.amount), 0)).where(*criteria)
+
+
+async def get_summary(db: AsyncSession, filters: Optional[PaymentFilters] = None) -> Tuple[int, int]:
+    """Get (count, SUM(amount)) of the payments matching the filters."""
+    criteria = filter_criteria(filters) if filters else []
+    result = await db.execute(summary_statement(*criteria))
+    count, total = result.one()
+    return int(count), int(total)
+
+
+async def get_amount_totals_by(db: AsyncSession, group_by: Sequence[Any], *criteria) -> Dict[Any, int]:
+    """Get SUM(amount) of the payments matching all criteria, grouped by the given columns.
+    
+    Keys are the group value for a single column, or a tuple of values for several.
+    """
     result = await db.execute(
-        select(Payment).where(Payment.slot_id == slot_id)
+        select(*group_by, func.sum(Payment.amount))
+        .where(*criteria)
+        .group_by(*group_by)
     )
-    payments = result.scalars().all()
-    return sum(p.amount for p in payments)
+    totals = {}
+    for row in result.all():
+        key = row[0] if len(group_by) == 1 else tuple(row[:-1])
+        totals[key] = int(row[-1] or 0)
+    return totals
+
+
+async def get_total_for_slot(db: AsyncSession, slot_id: int) -> int:
+    """Get total amount paid for a specific slot (payout payments)."""
+    return await get_amount_total(db, Payment.slot_id == slot_id)
 
 
 async def get_collection_total_for_member(
@@ -60,17 +169,124 @@ async def get_collection_total_for_member(
     month: int
 ) -> int:
     """Get total collection payment amount for a specific member in a specific month."""
-    result = await db.execute(
+    return await crud_ledger.get_total(db, chit_id=chit_id, member_id=member_id, month=month)
+
+
+async def get_collection_totals_by_month(db: AsyncSession, chit_id: int) -> Dict[int, int]:
+    """Get total collection amount per month for a chit, keyed by month number."""
+    return await crud_ledger.get_totals_by_month(db, chit_id=chit_id)
+
+
+async def get_collection_totals_for_member(db: AsyncSession, member_id: int) -> Dict[Tuple[int, int], int]:
+    """Get total collection amount for a member, keyed by (chit_id, month)."""
+    return await crud_ledger.get_totals_for_member(db, member_id=member_id)
+
+
+# --- Keyset pagination ---
+# Pages are ordered by (date DESC, id DESC) and continue after the last row of the
+# previous page, so each page is an index range scan however deep the client pages.
+
+def encode_cursor(payment_date: date, payment_id: int) -> str:
+    """Encode the (date, id) position of a payment as an opaque cursor."""
+    raw = f"{payment_date.isoformat()}|{payment_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    """Decode a cursor from encode_cursor. Raises ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        payment_date, payment_id = raw.split("|")
+        return date.fromisoformat(payment_date), int(payment_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def page_statement(*criteria, limit: int, cursor: Optional[str] = None) -> Select:
+    """Select one page (plus one lookahead row) of payments matching all criteria.
+    
+    Raises ValueError if the cursor is malformed.
+    """
+    statement = (
         select(Payment)
-        .where(
-            Payment.chit_id == chit_id,
-            Payment.member_id == member_id,
-            Payment.month == month,
-            Payment.payment_type == PaymentType.COLLECTION
+        .where(*criteria)
+        .options(selectinload(Payment.member), selectinload(Payment.chit).defer(Chit.notes))
+        .order_by(Payment.date.desc(), Payment.id.desc())
+        .limit(limit + 1)
+    )
+    if cursor:
+        after_date, after_id = decode_cursor(cursor)
+        statement = statement.where(
+            or_(
+                Payment.date < after_date,
+                and_(Payment.date == after_date, Payment.id < after_id)
+            )
         )
+    return statement
+
+
+async def get_page(
+    db: AsyncSession, 
+    *criteria, 
+    limit: int, 
+    cursor: Optional[str] = None
+) -> Tuple[List[Payment], Optional[str]]:
+    """Get a page of payments matching all criteria, newest first.
+    
+    Returns (payments, next_cursor); next_cursor is None on the last page.
+    """
+    result = await db.execute(page_statement(*criteria, limit=limit, cursor=cursor))
+    payments = list(result.scalars().all())
+    
+    next_cursor = None
+    if len(payments) > limit:
+        payments = payments[:limit]
+        next_cursor = encode_cursor(payments[-1].date, payments[-1].id)
+    return payments, next_cursor
+
+
+# --- Export ---
+
+EXPORT_COLUMNS = [
+    Payment.id,
+    Payment.date,
+    Payment.payment_type,
+    Payment.amount,
+    Payment.method,
+    Payment.month,
+    Payment.chit_id,
+    Chit.name.label("chit_name"),
+    Payment.member_id,
+    Member.full_name.label("member_name"),
+    Member.phone_number.label("member_phone"),
+    Payment.slot_id,
+    Payment.notes,
+]
+
+
+async def stream_export_rows(
+    db: AsyncSession, 
+    filters: Optional[PaymentFilters] = None, 
+    batch_size: int = 1000
+) -> AsyncIterator[RowMapping]:
+    """Stream flat export rows for the payments matching the filters, newest first.
+    
+    Rows come from a server-side cursor in batches of batch_size, so memory use does
+    not grow with the number of rows exported.
+    """
+    criteria = filter_criteria(filters) if filters else []
+    statement = (
+        select(*EXPORT_COLUMNS)
+        .join(Chit, Chit.id == Payment.chit_id)
+        .join(Member, Member.id == Payment.member_id)
+        .where(*criteria)
+        .order_by(Payment.date.desc(), Payment.id.desc())
+        .execution_options(yield_per=batch_size)
     )
-    payments = result.scalars().all()
-    return sum(p.amount for p in payments)
+    result = await db.stream(statement)
+    async for partition in result.mappings().partitions():
+        for row in partition:
+            yield row
 
 
 async def get_by_id(db: AsyncSession, payment_id: int) -> Optional[Payment]:
@@ -78,43 +294,84 @@ async def get_by_id(db: AsyncSession, payment_id: int) -> Optional[Payment]:
     return await db.get(Payment, payment_id)
 
 
-async def get_all(db: AsyncSession) -> List[Payment]:
-    """Get all payments."""
-    result = await db.execute(select(Payment).order_by(Payment.date.desc()))
-    return list(result.scalars().all())
+def filter_criteria(filters: PaymentFilters) -> list:
+    """Translate payment filters into SQL predicates (unset filters are skipped)."""
+    criteria = []
+    if filters.chit_id is not None:
+        criteria.append(Payment.chit_id == filters.chit_id)
+    if filters.member_id is not None:
+        criteria.append(Payment.member_id == filters.member_id)
+    if filters.payment_type is not None:
+        criteria.append(Payment.payment_type == filters.payment_type)
+    if filters.method is not None:
+        criteria.append(Payment.method == filters.method)
+    if filters.date_from is not None:
+        criteria.append(Payment.date >= filters.date_from)
+    if filters.date_to is not None:
+        criteria.append(Payment.date <= filters.date_to)
+    if filters.month_from is not None:
+        criteria.append(Payment.month >= filters.month_from)
+    if filters.month_to is not None:
+        criteria.append(Payment.month <= filters.month_to)
+    if filters.amount_min is not None:
+        criteria.append(Payment.amount >= filters.amount_min)
+    if filters.amount_max is not None:
+        criteria.append(Payment.amount <= filters.amount_max)
+    return criteria
+
+
+async def get_all(
+    db: AsyncSession, 
+    limit: int, 
+    cursor: Optional[str] = None,
+    filters: Optional[PaymentFilters] = None
+) -> Tuple[List[Payment], Optional[str]]:
+    """Get a page of payments matching the filters, newest first. Returns (payments, next_cursor)."""
+    criteria = filter_criteria(filters) if filters else []
+    return await get_page(db, *criteria, limit=limit, cursor=cursor)
+
+
+def by_slot_statement(slot_id: int) -> Select:
+    return select(Payment).where(Payment.slot_id == slot_id)
 
 
 async def get_by_slot(db: AsyncSession, slot_id: int) -> List[Payment]:
     """Get all payments for a specific slot (payout payments)."""
-    result = await db.execute(
-        select(Payment).where(Payment.slot_id == slot_id)
-    )
+    result = await db.execute(by_slot_statement(slot_id))
     return list(result.scalars().all())
 
 
-async def get_by_member(db: AsyncSession, member_id: int) -> List[Payment]:
-    """Get all payments for a specific member."""
-    result = await db.execute(
-        select(Payment).where(Payment.member_id == member_id).order_by(Payment.date.desc())
-    )
-    return list(result.scalars().all())
+async def get_by_member(
+    db: AsyncSession, 
+    member_id: int, 
+    limit: int, 
+    cursor: Optional[str] = None
+) -> Tuple[List[Payment], Optional[str]]:
+    """Get a page of payments for a specific member, newest first. Returns (payments, next_cursor)."""
+    return await get_page(db, Payment.member_id == member_id, limit=limit, cursor=cursor)
 
 
-async def get_by_chit(db: AsyncSession, chit_id: int) -> List[Payment]:
-    """Get all payments for a specific chit."""
-    result = await db.execute(
-        select(Payment).where(Payment.chit_id == chit_id).order_by(Payment.date.desc())
-    )
-    return list(result.scalars().all())
+async def get_by_chit(
+    db: AsyncSession, 
+    chit_id: int, 
+    limit: int, 
+    cursor: Optional[str] = None
+) -> Tuple[List[Payment], Optional[str]]:
+    """Get a page of payments for a specific chit, newest first. Returns (payments, next_cursor)."""
+    return await get_page(db, Payment.chit_id == chit_id, limit=limit, cursor=cursor)
 
 
-async def get_by_chit_and_month(db: AsyncSession, chit_id: int, month: int) -> List[Payment]:
-    """Get all payments for a specific chit in a specific month."""
-    result = await db.execute(
+def by_chit_and_month_statement(chit_id: int, month: int, *criteria) -> Select:
+    return (
         select(Payment)
-        .where(Payment.chit_id == chit_id, Payment.month == month)
+        .where(Payment.chit_id == chit_id, Payment.month == month, *criteria)
         .order_by(Payment.date.desc())
     )
+
+
+async def get_by_chit_and_month(db: AsyncSession, chit_id: int, month: int) -> List[Payment]:
+    """Get all payments for a specific chit in a specific month."""
+    result = await db.execute(by_chit_and_month_statement(chit_id, month))
     return list(result.scalars().all())
 
 
@@ -125,70 +382,111 @@ async def get_collections_by_chit_and_month(
 ) -> List[Payment]:
     """Get all collection payments for a specific chit and month."""
     result = await db.execute(
-        select(Payment)
+        by_chit_and_month_statement(chit_id, month, Payment.payment_type == PaymentType.COLLECTION)
+    )
+    return list(result.scalars().all())
+
+
+async def get_collection_summaries_by_member(
+    db: AsyncSession, 
+    chit_id: int, 
+    month: int
+) -> Dict[int, List[PaymentSummary]]:
+    """Get collection payment summaries for a chit and month, bucketed by member_id."""
+    result = await db.execute(
+        select(
+            Payment.id,
+            Payment.member_id,
+            Payment.amount,
+            Payment.date,
+            Payment.method,
+            Payment.notes
+        )
         .where(
             Payment.chit_id == chit_id,
             Payment.month == month,
             Payment.payment_type == PaymentType.COLLECTION
         )
-        .order_by(Payment.date.desc())
+        .order_by(Payment.member_id, Payment.date.desc())
     )
-    return list(result.scalars().all())
+    summaries: Dict[int, List[PaymentSummary]] = {}
+    for row in result.all():
+        summaries.setdefault(row.member_id, []).append(
+            PaymentSummary(
+                id=row.id,
+                amount=row.amount,
+                date=row.date,
+                method=row.method.value if row.method else "cash",
+                notes=row.notes
+            )
+        )
+    return summaries
 
 
 async def update(db: AsyncSession, db_payment: Payment, payment_in: PaymentUpdate) -> Payment:
-    """Update a payment."""
+    """Update a payment and adjust the related slot's payout totals if payout."""
+    previous_amount = db_payment.amount
     payment_data = payment_in.model_dump(exclude_unset=True)
     for key, value in payment_data.items():
         setattr(db_payment, key, value)
     db_payment.updated_at = datetime.now(timezone.utc)
     db.add(db_payment)
-    await db.commit()
-    await db.refresh(db_payment)
+    await db.flush()
     
-    # Re-calculate slot status for payout payments
+    # Re-calculate slot totals and status for payout payments
     if db_payment.payment_type == PaymentType.PAYOUT and db_payment.slot_id:
-        await update_slot_status(db, db_payment)
+        await crud_slots.apply_payout_delta(db, db_payment.slot_id, db_payment.amount - previous_amount)
+    elif db_payment.payment_type == PaymentType.COLLECTION and db_payment.amount != previous_amount:
+        await crud_ledger.apply_collection_delta(
+            db, db_payment.chit_id, db_payment.month, db_payment.member_id,
+            amount_delta=db_payment.amount - previous_amount, count_delta=0
+        )
     
+    await db.commit()
+    await db.refresh(db_payment, attribute_names=PAYMENT_RESPONSE_ATTRIBUTES)
     return db_payment
 
 
 async def delete(db: AsyncSession, db_payment: Payment) -> None:
-    """Delete a payment and recalculate slot status if payout."""
+    """Delete a payment and adjust the related slot's payout totals if payout."""
     slot_id = db_payment.slot_id
     payment_type = db_payment.payment_type
+    amount = db_payment.amount
+    chit_id, month, member_id = db_payment.chit_id, db_payment.month, db_payment.member_id
     
     await db.delete(db_payment)
-    await db.commit()
+    await db.flush()
     
-    # Recalculate slot status after deletion for payout payments
+    # Recalculate slot totals and status after deletion for payout payments
     if payment_type == PaymentType.PAYOUT and slot_id:
-        slot = await db.get(ChitSlot, slot_id)
-        if slot:
-            total_paid = await get_total_for_slot(db, slot_id)
-            if total_paid >= slot.payout_amount:
-                slot.status = SlotStatus.PAID
-            elif total_paid > 0:
-                slot.status = SlotStatus.PARTIAL
-            else:
-                slot.status = SlotStatus.SCHEDULED
-            slot.updated_at = datetime.now(timezone.utc)
-            db.add(slot)
-            await db.commit()
+        await crud_slots.apply_payout_delta(db, slot_id, -amount)
+    elif payment_type == PaymentType.COLLECTION:
+        await crud_ledger.apply_collection_delta(
+            db, chit_id, month, member_id, amount_delta=-amount, count_delta=-1
+        )
+    
+    await db.commit()
 
 
 # Module-level access
 payments = type('PaymentsCRUD', (), {
     'create': create,
+    'create_bulk': create_bulk,
     'get_by_id': get_by_id,
     'get_all': get_all,
+    'get_page': get_page,
     'get_by_slot': get_by_slot,
     'get_by_member': get_by_member,
     'get_by_chit': get_by_chit,
     'get_by_chit_and_month': get_by_chit_and_month,
     'get_collections_by_chit_and_month': get_collections_by_chit_and_month,
+    'get_collection_totals_by_month': get_collection_totals_by_month,
+    'get_collection_totals_for_member': get_collection_totals_for_member,
+    'get_collection_summaries_by_member': get_collection_summaries_by_member,
     'get_collection_total_for_member': get_collection_total_for_member,
     'get_total_for_slot': get_total_for_slot,
+    'get_amount_total': get_amount_total,
+    'get_amount_totals_by': get_amount_totals_by,
     'update': update,
     'delete': delete,
 })()
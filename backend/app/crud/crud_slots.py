@@ -1,13 +1,249 @@
 # backend/app/crud/crud_slots.py
 
-from typing import List, Optional
-from datetime import datetime, timezone
+import base64
+from typing import List, Optional, Tuple
+from datetime import date, datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from sqlmodel import select, func
+from sqlalchemy import Select, and_, case, delete, exists, insert, literal, or_, tuple_, update, RowMapping
 from sqlalchemy.orm import selectinload
 
+from app.models.chits import Chit
 from app.models.slots import ChitSlot, SlotStatus
-from app.schemas.slots import ChitSlotUpdate
+from app.models.members import Member
+from app.models.payments import Payment, PaymentType
+from app.models.ledger import CollectionLedger
+from app.schemas.slots import ChitSlotUpdate, BulkSlotAssignment
+
+
+def payout_status_case(amount_paid):
+    """SQL CASE deriving a slot's payout status from an amount_paid expression."""
+    return case(
+        (
+            and_(ChitSlot.payout_amount.isnot(None), amount_paid >= ChitSlot.payout_amount),
+            literal(SlotStatus.PAID, ChitSlot.status.type)
+        ),
+        (amount_paid > 0, literal(SlotStatus.PARTIAL, ChitSlot.status.type)),
+        else_=literal(SlotStatus.SCHEDULED, ChitSlot.status.type)
+    )
+
+
+def encode_payout_cursor(chit_id: int, month: int) -> str:
+    """Encode the (chit_id, month) position of a slot as an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{chit_id}|{month}".encode()).decode().rstrip("=")
+
+
+def decode_payout_cursor(cursor: str) -> Tuple[int, int]:
+    """Decode a cursor from encode_payout_cursor. Raises ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        chit_id, month = raw.split("|")
+        return int(chit_id), int(month)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def latest_payout_date(slot_id):
+    """Scalar subquery for the date of the latest payment recorded against a slot."""
+    return (
+        select(func.max(Payment.date))
+        .where(Payment.slot_id == slot_id)
+        .scalar_subquery()
+    )
+
+
+def build_slot_rows(
+    chit_id: int,
+    duration_months: int,
+    payout_amount: Optional[int] = None,
+    payout_map: Optional[dict[int, int]] = None,
+    expected_contribution: Optional[int] = None,
+    contribution_map: Optional[dict[int, int]] = None
+) -> List[dict]:
+    """Build insertable slot rows for all months of a chit."""
+    now = datetime.now(timezone.utc)
+    slots = []
+    for month in range(1, duration_months + 1):
+        # Determine payout_amount for this slot
+        if payout_map:
+            amount = payout_map.get(month, payout_amount)
+        else:
+            amount = payout_amount  # Can be None for Fixed/Auction
+        
+        # Determine expected_contribution for this slot
+        if contribution_map:
+            contribution = contribution_map.get(month, expected_contribution)
+        else:
+            contribution = expected_contribution  # Can be None for Auction
+        
+        slots.append({
+            "chit_id": chit_id,
+            "month": month,
+            "payout_amount": amount,
+            "expected_contribution": contribution,
+            "status": SlotStatus.SCHEDULED,
+            "amount_paid": 0,
+            "created_at": now,
+            "updated_at": now,
+        })
+    return slots
+
+
+# --- Statement builders, shared with the query-plan check in app.db.query_plans ---
+
+def chit_slots_statement(chit_id: int) -> Select:
+    return (
+        select(ChitSlot)
+        .where(ChitSlot.chit_id == chit_id)
+        .options(
+            selectinload(ChitSlot.member),
+            selectinload(ChitSlot.chit).defer(Chit.notes),
+            selectinload(ChitSlot.payments)
+        )
+        .order_by(ChitSlot.month)
+    )
+
+
+def member_slots_statement(member_id: int) -> Select:
+    return (
+        select(ChitSlot)
+        .where(ChitSlot.member_id == member_id)
+        .options(
+            selectinload(ChitSlot.chit).defer(Chit.notes),
+            selectinload(ChitSlot.member)
+        )
+        .order_by(ChitSlot.chit_id, ChitSlot.month)
+    )
+
+
+def member_slots_with_totals_statement(member_id: int) -> Select:
+    """Select (slot, collected total, has payout) for a member's slots via the collection ledger."""
+    has_payout = exists().where(Payment.slot_id == ChitSlot.id)
+    return (
+        select(
+            ChitSlot,
+            func.coalesce(CollectionLedger.amount_collected, 0),
+            has_payout
+        )
+        .outerjoin(
+            CollectionLedger,
+            and_(
+                CollectionLedger.member_id == member_id,
+                CollectionLedger.chit_id == ChitSlot.chit_id,
+                CollectionLedger.month == ChitSlot.month
+            )
+        )
+        .where(ChitSlot.member_id == member_id)
+        .options(
+            selectinload(ChitSlot.chit).defer(Chit.notes),
+            selectinload(ChitSlot.member)
+        )
+        .order_by(ChitSlot.chit_id, ChitSlot.month)
+    )
+
+
+def payout_filters(
+    *,
+    slot_id: Optional[int] = None,
+    chit_id: Optional[int] = None,
+    member_id: Optional[int] = None,
+    status: Optional[SlotStatus] = None,
+    month_from: Optional[int] = None,
+    month_to: Optional[int] = None,
+    has_unpaid_balance: Optional[bool] = None,
+    paid_from: Optional[date] = None,
+    paid_to: Optional[date] = None,
+    after: Optional[Tuple[int, int]] = None
+) -> list:
+    """Translate payout filters into SQL predicates on ChitSlot (unset filters are skipped)."""
+    filters = []
+    if slot_id:
+        filters.append(ChitSlot.id == slot_id)
+    if chit_id:
+        filters.append(ChitSlot.chit_id == chit_id)
+    if member_id:
+        filters.append(ChitSlot.member_id == member_id)
+    if status:
+        filters.append(ChitSlot.status == status)
+    if month_from:
+        filters.append(ChitSlot.month >= month_from)
+    if month_to:
+        filters.append(ChitSlot.month <= month_to)
+    if has_unpaid_balance is not None:
+        unpaid = and_(
+            ChitSlot.payout_amount.isnot(None),
+            ChitSlot.amount_paid < ChitSlot.payout_amount
+        )
+        filters.append(unpaid if has_unpaid_balance else ~unpaid)
+    if paid_from:
+        filters.append(ChitSlot.last_paid_date >= paid_from)
+    if paid_to:
+        filters.append(ChitSlot.last_paid_date <= paid_to)
+    if after:
+        after_chit_id, after_month = after
+        filters.append(
+            or_(
+                ChitSlot.chit_id > after_chit_id,
+                and_(ChitSlot.chit_id == after_chit_id, ChitSlot.month > after_month)
+            )
+        )
+    return filters
+
+
+def payout_page_statement(filters: list, limit: int) -> Select:
+    """Select the slot ids of one payout page, ordered by chit_id, month."""
+    return (
+        select(ChitSlot.id)
+        .where(*filters)
+        .order_by(ChitSlot.chit_id, ChitSlot.month)
+        .limit(limit)
+    )
+
+
+def payout_rows_statement(filters: list) -> Select:
+    """Select flat payout rows with the latest payout payment's method/notes per slot."""
+    payout_payments = select(
+        Payment.slot_id,
+        Payment.method.label("payment_method"),
+        Payment.notes.label("notes"),
+        func.row_number().over(
+            partition_by=Payment.slot_id,
+            order_by=(Payment.date.desc(), Payment.id.desc())
+        ).label("row_number")
+    ).where(Payment.payment_type == PaymentType.PAYOUT)
+    if filters:
+        # Restrict the window to payments of the requested slots
+        payout_payments = payout_payments.where(
+            Payment.slot_id.in_(select(ChitSlot.id).where(*filters))
+        )
+    latest = payout_payments.subquery()
+    
+    return (
+        select(
+            ChitSlot.id,
+            ChitSlot.month,
+            ChitSlot.payout_amount,
+            ChitSlot.bid_amount,
+            ChitSlot.expected_contribution,
+            ChitSlot.chit_id,
+            ChitSlot.status,
+            ChitSlot.member_id,
+            ChitSlot.created_at,
+            ChitSlot.updated_at,
+            Member.full_name.label("member_full_name"),
+            Member.phone_number.label("member_phone_number"),
+            Member.created_at.label("member_created_at"),
+            Member.updated_at.label("member_updated_at"),
+            ChitSlot.amount_paid,
+            ChitSlot.last_paid_date.label("paid_date"),
+            latest.c.payment_method,
+            latest.c.notes
+        )
+        .outerjoin(Member, Member.id == ChitSlot.member_id)
+        .outerjoin(latest, and_(latest.c.slot_id == ChitSlot.id, latest.c.row_number == 1))
+        .where(*filters)
+        .order_by(ChitSlot.chit_id, ChitSlot.month)
+    )
 
 
 class CRUDSlot:
@@ -34,30 +270,23 @@ class CRUDSlot:
             contribution_map: Optional map of month->expected_contribution for variable schedules
             chit_type: Type of chit (fixed/variable/auction)
         """
-        slots = []
-        for month in range(1, duration_months + 1):
-            # Determine payout_amount for this slot
-            if payout_map:
-                amount = payout_map.get(month, payout_amount)
-            else:
-                amount = payout_amount  # Can be None for Fixed/Auction
-            
-            # Determine expected_contribution for this slot
-            if contribution_map:
-                contribution = contribution_map.get(month, expected_contribution)
-            else:
-                contribution = expected_contribution  # Can be None for Auction
-            
-            slots.append(
-                ChitSlot(
-                    chit_id=chit_id, 
-                    month=month, 
-                    payout_amount=amount,
-                    expected_contribution=contribution,
-                    status=SlotStatus.SCHEDULED
-                )
-            )
-        db.add_all(slots)
+        slots = build_slot_rows(
+            chit_id, duration_months,
+            payout_amount=payout_amount,
+            payout_map=payout_map,
+            expected_contribution=expected_contribution,
+            contribution_map=contribution_map
+        )
+        # One multi-row INSERT inside the caller's transaction; the caller commits
+        await db.execute(insert(ChitSlot).values(slots))
+
+    async def bulk_create_slots(self, db: AsyncSession, slot_rows: List[dict]) -> None:
+        """Insert slot rows built by build_slot_rows for several chits as one batched INSERT.
+        
+        Runs inside the caller's transaction; the caller commits.
+        """
+        if slot_rows:
+            await db.execute(insert(ChitSlot), slot_rows)
 
     async def get(self, db: AsyncSession, id: int) -> Optional[ChitSlot]:
         result = await db.execute(
@@ -65,64 +294,15 @@ class CRUDSlot:
             .where(ChitSlot.id == id)
             .options(
                 selectinload(ChitSlot.member),
-                selectinload(ChitSlot.chit),
+                selectinload(ChitSlot.chit).defer(Chit.notes),
                 selectinload(ChitSlot.payments)
             )
         )
         return result.scalar_one_or_none()
 
-    async def get_all(self, db: AsyncSession) -> List[ChitSlot]:
-        """Get all slots."""
-        result = await db.execute(
-            select(ChitSlot)
-            .options(
-                selectinload(ChitSlot.member),
-                selectinload(ChitSlot.chit),
-                selectinload(ChitSlot.payments)
-            )
-            .order_by(ChitSlot.chit_id, ChitSlot.month)
-        )
-        return result.scalars().all()
-
-    async def get_by_status(
-        self, 
-        db: AsyncSession,
-        status: SlotStatus,
-        chit_id: Optional[int] = None,
-        member_id: Optional[int] = None
-    ) -> List[ChitSlot]:
-        """Get slots by status (scheduled, partial, paid, overdue)."""
-        statement = (
-            select(ChitSlot)
-            .where(ChitSlot.status == status)
-            .options(
-                selectinload(ChitSlot.member),
-                selectinload(ChitSlot.chit),
-                selectinload(ChitSlot.payments)
-            )
-            .order_by(ChitSlot.chit_id, ChitSlot.month)
-        )
-        
-        if chit_id:
-            statement = statement.where(ChitSlot.chit_id == chit_id)
-        if member_id:
-            statement = statement.where(ChitSlot.member_id == member_id)
-            
-        result = await db.execute(statement)
-        return result.scalars().all()
-        
     async def get_by_chit(self, db: AsyncSession, chit_id: int) -> List[ChitSlot]:
         """Get all slots for a specific chit."""
-        result = await db.execute(
-            select(ChitSlot)
-            .where(ChitSlot.chit_id == chit_id)
-            .options(
-                selectinload(ChitSlot.member),
-                selectinload(ChitSlot.chit),
-                selectinload(ChitSlot.payments)
-            )
-            .order_by(ChitSlot.month)
-        )
+        result = await db.execute(chit_slots_statement(chit_id))
         return result.scalars().all()
 
     async def get_by_chit_and_month(self, db: AsyncSession, chit_id: int, month: int) -> Optional[ChitSlot]:
@@ -131,25 +311,101 @@ class CRUDSlot:
             .where(ChitSlot.chit_id == chit_id, ChitSlot.month == month)
             .options(
                 selectinload(ChitSlot.member),
-                selectinload(ChitSlot.chit),
+                selectinload(ChitSlot.chit).defer(Chit.notes),
                 selectinload(ChitSlot.payments)
             )
         )
         return result.scalar_one_or_none()
         
+    async def get_slot_ids_by_chit_month(self, db: AsyncSession) -> dict[Tuple[int, int], int]:
+        """Get a (chit_id, month) -> slot ID lookup for all slots."""
+        result = await db.execute(select(ChitSlot.chit_id, ChitSlot.month, ChitSlot.id))
+        return {(chit_id, month): slot_id for chit_id, month, slot_id in result.all()}
+
     async def get_by_member(self, db: AsyncSession, member_id: int) -> List[ChitSlot]:
         """Get all slots assigned to a specific member."""
+        result = await db.execute(member_slots_statement(member_id))
+        return result.scalars().all()
+
+    async def get_by_member_with_totals(self, db: AsyncSession, member_id: int) -> List[Tuple[ChitSlot, int, bool]]:
+        """Get a member's slots with per-slot collection totals and payout flags computed in SQL.
+        
+        Returns (slot, total_paid, has_payout) rows, where total_paid is the member's
+        collection total for the slot's chit and month, and has_payout is True when
+        any payment has been recorded against the slot.
+        """
+        result = await db.execute(member_slots_with_totals_statement(member_id))
+        return [(slot, int(total_paid), bool(payout_made)) for slot, total_paid, payout_made in result.all()]
+
+    async def get_payout_rows(
+        self,
+        db: AsyncSession,
+        *,
+        slot_id: Optional[int] = None,
+        chit_id: Optional[int] = None,
+        member_id: Optional[int] = None,
+        status: Optional[SlotStatus] = None,
+        month_from: Optional[int] = None,
+        month_to: Optional[int] = None,
+        has_unpaid_balance: Optional[bool] = None,
+        paid_from: Optional[date] = None,
+        paid_to: Optional[date] = None,
+        after: Optional[Tuple[int, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[RowMapping]:
+        """Get flat payout rows (slot, member and latest payout payment details).
+        
+        amount_paid and paid_date come from the slot's stored running totals; the
+        latest payment's method/notes are picked in the database with a window
+        function over the payout payments of each slot, so no Payment objects are
+        loaded. Rows are ordered by chit_id, month; `after` is a (chit_id, month)
+        position to continue from and `limit` caps the number of rows.
+        """
+        filters = payout_filters(
+            slot_id=slot_id,
+            chit_id=chit_id,
+            member_id=member_id,
+            status=status,
+            month_from=month_from,
+            month_to=month_to,
+            has_unpaid_balance=has_unpaid_balance,
+            paid_from=paid_from,
+            paid_to=paid_to,
+            after=after
+        )
+        if limit:
+            # Resolve the page's slot ids first so the window below only covers this page
+            page_result = await db.execute(payout_page_statement(filters, limit))
+            filters = [ChitSlot.id.in_(page_result.scalars().all())]
+        
+        result = await db.execute(payout_rows_statement(filters))
+        return list(result.mappings().all())
+
+    async def get_month_summary(self, db: AsyncSession, year: int, month: int) -> Tuple[int, int, int, int]:
+        """Get (count, paid count, SUM(payout_amount), SUM(amount_paid)) for the slots paid out in a calendar month.
+        
+        A slot's payout falls in month `slot.month - 1` after its chit's start month, so each
+        chit contributes at most one (chit_id, month) pair; the totals are one aggregate over them.
+        """
+        chits_result = await db.execute(select(Chit.id, Chit.start_date, Chit.duration_months))
+        pairs = []
+        for chit_id, start_date, duration_months in chits_result.all():
+            slot_month = (year - start_date.year) * 12 + (month - start_date.month) + 1
+            if 1 <= slot_month <= duration_months:
+                pairs.append((chit_id, slot_month))
+        if not pairs:
+            return 0, 0, 0, 0
+        
         result = await db.execute(
-            select(ChitSlot)
-            .where(ChitSlot.member_id == member_id)
-            .options(
-                selectinload(ChitSlot.chit),
-                selectinload(ChitSlot.member),
-                selectinload(ChitSlot.payments)
-            )
-            .order_by(ChitSlot.chit_id, ChitSlot.month)
+            select(
+                func.count(ChitSlot.id),
+                func.count(ChitSlot.last_paid_date),
+                func.coalesce(func.sum(ChitSlot.payout_amount), 0),
+                func.coalesce(func.sum(ChitSlot.amount_paid), 0)
+            ).where(tuple_(ChitSlot.chit_id, ChitSlot.month).in_(pairs))
         )
-        return result.scalars().all()
+        count, paid_count, payout_total, amount_paid = result.one()
+        return int(count), int(paid_count), int(payout_total), int(amount_paid)
 
     async def get_unassigned_months(self, db: AsyncSession, chit_id: int) -> List[int]:
         """Get list of month numbers that don't have a member assigned."""
@@ -165,11 +421,7 @@ class CRUDSlot:
         result = await db.execute(
             select(ChitSlot)
             .where(ChitSlot.chit_id == chit_id, ChitSlot.member_id.isnot(None))
-            .options(
-                selectinload(ChitSlot.member),
-                selectinload(ChitSlot.chit),
-                selectinload(ChitSlot.payments)
-            )
+            .options(selectinload(ChitSlot.member))
             .order_by(ChitSlot.month)
         )
         return result.scalars().all()
@@ -183,6 +435,63 @@ class CRUDSlot:
         await db.refresh(slot)
         return slot
 
+    async def bulk_assign_members(
+        self,
+        db: AsyncSession,
+        chit_id: int,
+        assignments: List[BulkSlotAssignment]
+    ) -> List[dict]:
+        """Assign members to several slots of a chit with one UPDATE and one commit.
+        
+        Target slots and members are validated with one query each; items that cannot
+        be applied are skipped. Returns a result dict (month, member_id, status) per item.
+        """
+        months = {item.month for item in assignments}
+        member_ids = {item.member_id for item in assignments}
+        
+        slot_result = await db.execute(
+            select(ChitSlot.month, ChitSlot.member_id)
+            .where(ChitSlot.chit_id == chit_id, ChitSlot.month.in_(months))
+        )
+        current_members = {month: member_id for month, member_id in slot_result.all()}
+        
+        member_result = await db.execute(select(Member.id).where(Member.id.in_(member_ids)))
+        existing_members = set(member_result.scalars().all())
+        
+        month_to_member: dict[int, int] = {}
+        results = []
+        for item in assignments:
+            if item.month in month_to_member:
+                item_status = "duplicate_month"
+            elif item.month not in current_members:
+                item_status = "slot_not_found"
+            elif current_members[item.month] is not None:
+                item_status = "already_assigned"
+            elif item.member_id not in existing_members:
+                item_status = "member_not_found"
+            else:
+                item_status = "assigned"
+                month_to_member[item.month] = item.member_id
+            results.append({"month": item.month, "member_id": item.member_id, "status": item_status})
+        
+        if month_to_member:
+            await db.execute(
+                update(ChitSlot)
+                .where(
+                    ChitSlot.chit_id == chit_id,
+                    ChitSlot.month.in_(month_to_member.keys()),
+                    ChitSlot.member_id.is_(None)
+                )
+                .values(
+                    member_id=case(month_to_member, value=ChitSlot.month),
+                    updated_at=datetime.now(timezone.utc)
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        
+        return results
+
     async def unassign_member(self, db: AsyncSession, slot: ChitSlot) -> ChitSlot:
         """Remove member assignment from a slot."""
         slot.member_id = None
@@ -210,34 +519,41 @@ class CRUDSlot:
         payout_amount: Optional[int] = None,
         payout_map: Optional[dict[int, int]] = None
     ):
-        """Sync slot schedule when chit duration changes."""
+        """Sync slot schedule when chit duration changes.
+        
+        Surplus months are removed with one ranged DELETE and missing months are
+        added with one multi-row INSERT.
+        """
         result = await db.execute(
-            select(ChitSlot).where(ChitSlot.chit_id == chit_id).order_by(ChitSlot.month)
+            select(func.count(ChitSlot.id)).where(ChitSlot.chit_id == chit_id)
         )
-        current_slots = result.scalars().all()
-        current_count = len(current_slots)
+        current_count = result.scalar_one()
 
         if new_duration == current_count:
             return
 
         if new_duration > current_count:
-            new_slots = []
-            for m in range(current_count + 1, new_duration + 1):
-                amount = payout_map.get(m, payout_amount) if payout_map else payout_amount
-                new_slots.append(
-                    ChitSlot(
-                        chit_id=chit_id, 
-                        month=m, 
-                        payout_amount=amount, 
-                        status=SlotStatus.SCHEDULED
-                    )
-                )
-            db.add_all(new_slots)
+            now = datetime.now(timezone.utc)
+            new_slots = [
+                {
+                    "chit_id": chit_id,
+                    "month": m,
+                    "payout_amount": payout_map.get(m, payout_amount) if payout_map else payout_amount,
+                    "status": SlotStatus.SCHEDULED,
+                    "amount_paid": 0,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for m in range(current_count + 1, new_duration + 1)
+            ]
+            await db.execute(insert(ChitSlot).values(new_slots))
         
         elif new_duration < current_count:
-            slots_to_delete = current_slots[new_duration:]
-            for s in slots_to_delete:
-                await db.delete(s)
+            await db.execute(
+                delete(ChitSlot)
+                .where(ChitSlot.chit_id == chit_id, ChitSlot.month > new_duration)
+                .execution_options(synchronize_session=False)
+            )
                 
         await db.commit()
 
@@ -248,7 +564,7 @@ class CRUDSlot:
         payout_amount: Optional[int],
         payout_map: Optional[dict[int, int]] = None
     ):
-        """Update payout_amount for all slots of a chit.
+        """Update payout_amount for all slots of a chit with a single UPDATE.
         
         For Fixed/Auction chits where payout_amount is None (user-entered manually),
         this function should NOT be called - users enter values individually.
@@ -256,17 +572,65 @@ class CRUDSlot:
         # Skip if payout_amount is None and no payout_map (Fixed/Auction chits)
         if payout_amount is None and not payout_map:
             return
-            
-        result = await db.execute(
-            select(ChitSlot).where(ChitSlot.chit_id == chit_id)
+        
+        if payout_map:
+            new_amount = case(payout_map, value=ChitSlot.month, else_=payout_amount)
+        else:
+            new_amount = payout_amount
+        await db.execute(
+            update(ChitSlot)
+            .where(ChitSlot.chit_id == chit_id)
+            .values(payout_amount=new_amount, updated_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
         )
-        slots = result.scalars().all()
-        for slot in slots:
-            amount = payout_map.get(slot.month, payout_amount) if payout_map else payout_amount
-            slot.payout_amount = amount
-            slot.updated_at = datetime.now(timezone.utc)
         await db.commit()
 
+    async def apply_payout_delta(self, db: AsyncSession, slot_id: int, delta: int) -> None:
+        """Increment a slot's stored payout totals in the database and move its status.
+        
+        Runs as a single UPDATE inside the caller's transaction; the caller commits.
+        The payment change must already be flushed so last_paid_date sees it.
+        """
+        new_amount_paid = ChitSlot.amount_paid + delta
+        await db.execute(
+            update(ChitSlot)
+            .where(ChitSlot.id == slot_id)
+            # status is assigned before amount_paid: MySQL evaluates SET clauses
+            # left to right, so both must see the pre-increment amount_paid
+            .ordered_values(
+                (ChitSlot.status, payout_status_case(new_amount_paid)),
+                (ChitSlot.last_paid_date, latest_payout_date(ChitSlot.id)),
+                (ChitSlot.amount_paid, new_amount_paid),
+                (ChitSlot.updated_at, datetime.now(timezone.utc)),
+            )
+        )
+
+    async def recompute_payout_totals(self, db: AsyncSession, chit_id: Optional[int] = None) -> int:
+        """Recompute stored payout totals and statuses from payments, repairing any drift.
+        
+        Returns the number of slots updated.
+        """
+        total_paid = func.coalesce(
+            select(func.sum(Payment.amount))
+            .where(Payment.slot_id == ChitSlot.id)
+            .scalar_subquery(),
+            0
+        )
+        statement = (
+            update(ChitSlot)
+            .values(
+                status=payout_status_case(total_paid),
+                last_paid_date=latest_payout_date(ChitSlot.id),
+                amount_paid=total_paid,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if chit_id:
+            statement = statement.where(ChitSlot.chit_id == chit_id)
+        result = await db.execute(statement)
+        await db.commit()
+        return result.rowcount
+
     async def delete(self, db: AsyncSession, *, db_obj: ChitSlot) -> None:
         await db.delete(db_obj)
         await db.commit()
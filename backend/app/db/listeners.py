@@ -32,6 +32,7 @@ def register_listeners():
     from app.models.members import Member
     from app.models.slots import ChitSlot
     from app.models.payments import Payment
+    from app.models.ledger import CollectionLedger
     from app.models.auth import AuthorizedPhone, Credential
     
     MODELS_WITH_TIMESTAMPS = [
@@ -39,9 +40,15 @@ def register_listeners():
         Member,
         ChitSlot,
         Payment,
+        CollectionLedger,
         AuthorizedPhone,
         Credential
     ]
     
     for model in MODELS_WITH_TIMESTAMPS:
         event.listen(model, 'before_update', before_update_listener)
+    
+    # Normalized chit name used by the case-insensitive unique index
+    from app.models.chits import sync_name_normalized
+    event.listen(Chit, 'before_insert', sync_name_normalized)
+    event.listen(Chit, 'before_update', sync_name_normalized)
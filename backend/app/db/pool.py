@@ -0,0 +1,71 @@
+# backend/app/db/pool.py
+
+"""
+Connection pool with checkout timing.
+
+TimedQueuePool records how long each connection checkout takes (waiting for a
+free connection, plus reconnecting or pre-pinging when needed) and how many
+checkouts timed out. `pool_status()` combines those counters with the pool's
+live size so GET /health/db can show saturation without any extra tooling.
+"""
+
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class CheckoutStats:
+    """Running totals for connection checkouts since process start."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+
+
+checkout_stats = CheckoutStats()
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait times in `checkout_stats`."""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            checkout_stats.record_timeout()
+            raise
+        checkout_stats.record(time.perf_counter() - started)
+        return connection
+
+
+def pool_status(engine: Engine) -> dict:
+    """Current pool usage plus checkout wait statistics."""
+    pool = engine.pool
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    checked_out = pool.checkedout()
+    stats = checkout_stats
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": checked_out,
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "saturation": round(checked_out / capacity, 3) if capacity else None,
+        "checkouts": stats.checkouts,
+        "checkout_timeouts": stats.timeouts,
+        "checkout_wait_avg_ms": round(stats.total_wait / stats.checkouts * 1000, 3) if stats.checkouts else 0.0,
+        "checkout_wait_max_ms": round(stats.max_wait * 1000, 3),
+    }
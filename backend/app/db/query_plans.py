@@ -0,0 +1,96 @@
+# backend/app/db/query_plans.py
+
+"""
+EXPLAIN checks for the hot CRUD access paths.
+
+`checked_queries()` builds each statement with the same builder function the
+CRUD layer executes, using representative arguments, so the plans checked are
+the plans served. `find_full_scans()` runs MySQL EXPLAIN on every one of them
+and reports the ones it would answer with a full table scan, so a dropped or
+mismatched index shows up before it shows up in latency. Run it with
+`python -m app.manage explain-check` against a database with realistic data;
+on near-empty tables MySQL may prefer a scan even when an index exists.
+"""
+
+from datetime import date
+from typing import List, Tuple
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.crud import crud_chits, crud_idempotency, crud_ledger, crud_members, crud_payments
+from app.crud.crud_slots import (
+    chit_slots_statement,
+    member_slots_statement,
+    member_slots_with_totals_statement,
+    payout_filters,
+    payout_page_statement,
+    payout_rows_statement,
+)
+from app.models.payments import Payment, PaymentType
+from app.models.slots import ChitSlot, SlotStatus
+
+# Representative arguments; only the plan matters, not the rows
+SAMPLE_ID = 1
+SAMPLE_MONTH = 1
+PAGE_LIMIT = 100
+SAMPLE_CURSOR = crud_payments.encode_cursor(date(2024, 1, 1), SAMPLE_ID)
+
+
+def checked_queries() -> List[Tuple[str, Select]]:
+    """Return (name, statement) pairs for the access paths that must use an index."""
+    page = crud_payments.page_statement
+    return [
+        ("payments.get_all", page(limit=PAGE_LIMIT)),
+        ("payments.get_all(cursor)", page(limit=PAGE_LIMIT, cursor=SAMPLE_CURSOR)),
+        ("payments.get_by_member", page(Payment.member_id == SAMPLE_ID, limit=PAGE_LIMIT, cursor=SAMPLE_CURSOR)),
+        ("payments.get_by_chit", page(Payment.chit_id == SAMPLE_ID, limit=PAGE_LIMIT, cursor=SAMPLE_CURSOR)),
+        ("payments.get_all(payment_type)", page(Payment.payment_type == PaymentType.PAYOUT, limit=PAGE_LIMIT)),
+        ("payments.get_by_slot", crud_payments.by_slot_statement(SAMPLE_ID)),
+        ("payments.get_total_for_slot", crud_payments.amount_total_statement(Payment.slot_id == SAMPLE_ID)),
+        ("payments.get_by_chit_and_month", crud_payments.by_chit_and_month_statement(SAMPLE_ID, SAMPLE_MONTH)),
+        ("payments.get_collections_by_chit_and_month", crud_payments.by_chit_and_month_statement(
+            SAMPLE_ID, SAMPLE_MONTH, Payment.payment_type == PaymentType.COLLECTION
+        )),
+        ("slots.get_by_chit", chit_slots_statement(SAMPLE_ID)),
+        ("slots.get_by_member", member_slots_statement(SAMPLE_ID)),
+        ("slots.get_by_member_with_totals", member_slots_with_totals_statement(SAMPLE_ID)),
+        ("slots.get_payout_rows(page)", payout_page_statement(
+            payout_filters(status=SlotStatus.PARTIAL, after=(SAMPLE_ID, SAMPLE_MONTH)), PAGE_LIMIT + 1
+        )),
+        ("slots.get_payout_rows(rows)", payout_rows_statement([ChitSlot.id.in_([1, 2, 3])])),
+        ("slots.get_payout_rows(slot_id)", payout_rows_statement(payout_filters(slot_id=SAMPLE_ID))),
+        ("ledger.get_total", crud_ledger.total_statement(SAMPLE_ID, SAMPLE_ID, SAMPLE_MONTH)),
+        ("ledger.get_totals_by_month", crud_ledger.totals_by_month_statement(SAMPLE_ID)),
+        ("ledger.get_totals_for_member", crud_ledger.totals_for_member_statement(SAMPLE_ID)),
+        ("chits.is_name_taken", crud_chits.name_taken_statement("Sample Chit", exclude_id=SAMPLE_ID)),
+        ("members.search(name)", crud_members.search_statement("ravi ku")),
+        ("members.search(phone)", crud_members.search_statement("98765")),
+        ("idempotency.get", crud_idempotency.get_statement("POST /payments", "sample")),
+    ]
+
+
+async def explain_full_scans(conn: AsyncConnection, statement: Select) -> List[str]:
+    """Return the tables MySQL would read with a full scan (EXPLAIN type ALL) for the statement.
+    
+    Derived tables (`<derived2>` and the like) are skipped: they are built from the
+    subquery's own plan rows, which are checked on the base tables they read.
+    """
+    sql = str(statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    result = await conn.exec_driver_sql(f"EXPLAIN {sql}")
+    return [
+        row["table"] for row in result.mappings()
+        if row["type"] == "ALL" and not str(row["table"]).startswith("<")
+    ]
+
+
+async def find_full_scans(conn: AsyncConnection) -> List[Tuple[str, List[str]]]:
+    """EXPLAIN every checked query; return (name, tables) for those with full scans."""
+    if conn.dialect.name != "mysql":
+        raise ValueError(f"explain-check reads MySQL EXPLAIN output; got a {conn.dialect.name} database.")
+    failures = []
+    for name, statement in checked_queries():
+        tables = await explain_full_scans(conn, statement)
+        if tables:
+            failures.append((name, tables))
+    return failures
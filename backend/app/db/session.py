@@ -1,16 +1,39 @@
 # backend/app/db/session.py
 
+import logging
+import random
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
 
 from app.core.config import settings
+from app.db.pool import TimedQueuePool
 
 if not settings.DATABASE_URL:
     raise ValueError("No DATABASE_URL found in environment variables")
 
-# Create an asynchronous engine
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+# Create an asynchronous engine with a sized, self-healing connection pool
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DB_ECHO,
+    poolclass=TimedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
+# Sampled SQL logging: a fraction of statements instead of echoing all of them
+sql_logger = logging.getLogger("app.db.sql")
+
+if settings.DB_SQL_LOG_SAMPLE_RATE > 0:
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def log_sampled_statement(conn, cursor, statement, parameters, context, executemany):
+        if random.random() < settings.DB_SQL_LOG_SAMPLE_RATE:
+            sql_logger.info("%s %r", statement, parameters)
 
 # Define an async session maker
 AsyncSessionLocal = sessionmaker(
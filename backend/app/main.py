@@ -18,12 +18,16 @@ from app.api.routers import (
 )
 from app.core.config import settings
 from app.db.session import engine, AsyncSessionLocal
+from app.db.pool import pool_status
 from app.models import (
     auth as auth_models, 
     chits as chits_models,
     members as members_models,             
     slots as slots_models,
-    payments as payments_models
+    payments as payments_models,
+    ledger as ledger_models,
+    idempotency as idempotency_models,
+    member_search as member_search_models
 )
 from app.security import core as security
 
@@ -37,6 +41,9 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(members_models.SQLModel.metadata.create_all)
         await conn.run_sync(slots_models.SQLModel.metadata.create_all)
         await conn.run_sync(payments_models.SQLModel.metadata.create_all)
+        await conn.run_sync(ledger_models.SQLModel.metadata.create_all)
+        await conn.run_sync(idempotency_models.SQLModel.metadata.create_all)
+        await conn.run_sync(member_search_models.SQLModel.metadata.create_all)
 
     print("Seeding initial data...")
     async with AsyncSessionLocal() as session:
@@ -103,6 +110,11 @@ async def health_check():
         "version": "1.0.0"
     }
 
+@app.get("/health/db")
+async def database_health_check():
+    """Connection pool usage and checkout wait times, for watching pool saturation."""
+    return pool_status(engine.sync_engine)
+
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
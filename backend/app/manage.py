@@ -0,0 +1,114 @@
+# backend/app/manage.py
+
+"""
+Maintenance commands for the Chitti backend.
+
+Run from the backend directory:
+    python -m app.manage recompute-slot-totals [--chit-id ID]
+    python -m app.manage rebuild-collection-ledger
+    python -m app.manage prune-idempotency-keys
+    python -m app.manage rebuild-member-search
+    python -m app.manage explain-check
+"""
+
+import argparse
+import asyncio
+
+from app.db.session import AsyncSessionLocal, engine
+from app.db.query_plans import find_full_scans
+from app.crud import crud_idempotency, crud_ledger, crud_members, crud_slots
+
+
+async def recompute_slot_totals(args: argparse.Namespace) -> None:
+    """Recompute stored payout totals (amount_paid, last_paid_date, status) from payments."""
+    async with AsyncSessionLocal() as session:
+        updated = await crud_slots.recompute_payout_totals(session, chit_id=args.chit_id)
+    print(f"Recomputed payout totals for {updated} slot(s).")
+
+
+async def rebuild_collection_ledger(args: argparse.Namespace) -> None:
+    """Rebuild the monthly collection ledger from collection payments."""
+    async with AsyncSessionLocal() as session:
+        written = await crud_ledger.rebuild(session)
+    print(f"Rebuilt collection ledger with {written} row(s).")
+
+
+async def prune_idempotency_keys(args: argparse.Namespace) -> None:
+    """Delete stored idempotency keys older than IDEMPOTENCY_KEY_TTL_HOURS."""
+    async with AsyncSessionLocal() as session:
+        deleted = await crud_idempotency.prune(session)
+    print(f"Pruned {deleted} expired idempotency key(s).")
+
+
+async def rebuild_member_search(args: argparse.Namespace) -> None:
+    """Rebuild the member name search tokens."""
+    async with AsyncSessionLocal() as session:
+        written = await crud_members.rebuild_search_tokens(session)
+    print(f"Rebuilt member search with {written} token(s).")
+
+
+async def explain_check(args: argparse.Namespace) -> int:
+    """EXPLAIN the hot CRUD queries; exit non-zero if any would scan a whole table."""
+    async with engine.connect() as conn:
+        failures = await find_full_scans(conn)
+    for name, tables in failures:
+        print(f"FULL SCAN  {name}: {', '.join(tables)}")
+    if failures:
+        print(f"{len(failures)} query plan(s) fall back to a full table scan.")
+        return 1
+    print("All checked query plans use an index.")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.manage", description="Chitti maintenance commands.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    recompute = subparsers.add_parser(
+        "recompute-slot-totals",
+        help="Repair drift in ChitSlot.amount_paid / last_paid_date / status."
+    )
+    recompute.add_argument("--chit-id", type=int, default=None, help="Only recompute slots of this chit.")
+    recompute.set_defaults(handler=recompute_slot_totals)
+
+    rebuild = subparsers.add_parser(
+        "rebuild-collection-ledger",
+        help="Backfill or repair the CollectionLedger summary table."
+    )
+    rebuild.set_defaults(handler=rebuild_collection_ledger)
+
+    prune = subparsers.add_parser(
+        "prune-idempotency-keys",
+        help="Delete expired Idempotency-Key records (run periodically, e.g. from cron)."
+    )
+    prune.set_defaults(handler=prune_idempotency_keys)
+
+    search = subparsers.add_parser(
+        "rebuild-member-search",
+        help="Backfill or repair the MemberSearchToken table."
+    )
+    search.set_defaults(handler=rebuild_member_search)
+
+    explain = subparsers.add_parser(
+        "explain-check",
+        help="Fail if any hot CRUD query plan falls back to a full table scan (run in CI against a seeded DB)."
+    )
+    explain.set_defaults(handler=explain_check)
+
+    return parser
+
+
+async def run(args: argparse.Namespace) -> int | None:
+    try:
+        return await args.handler(args)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    raise SystemExit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
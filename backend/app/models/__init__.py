@@ -4,6 +4,9 @@ from app.models.chits import Chit, ChitType
 from app.models.members import Member
 from app.models.slots import ChitSlot, SlotStatus
 from app.models.payments import Payment, PaymentType, PaymentMethod
+from app.models.ledger import CollectionLedger
+from app.models.idempotency import IdempotencyKey
+from app.models.member_search import MemberSearchToken
 
 __all__ = [
     "Chit",
@@ -14,4 +17,7 @@ __all__ = [
     "Payment",
     "PaymentType",
     "PaymentMethod",
+    "CollectionLedger",
+    "IdempotencyKey",
+    "MemberSearchToken",
 ]
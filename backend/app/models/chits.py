@@ -6,7 +6,7 @@ from sqlmodel import Field, SQLModel, Relationship
 from sqlalchemy import Text
 import enum
 
-from app.core.utils import utc_now
+from app.core.utils import utc_now, normalize_name
 
 if TYPE_CHECKING:
     from app.models.slots import ChitSlot
@@ -23,6 +23,9 @@ class ChitType(str, enum.Enum):
 class Chit(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(index=True, unique=True, max_length=50)
+    # normalize_name(name); case-insensitive uniqueness and lookups go through this
+    # column's unique index. Kept in sync by the listener in app.db.listeners.
+    name_normalized: str = Field(default="", index=True, unique=True, max_length=50)
     chit_value: int = Field(ge=10000, le=1000000000)  # ₹10K - ₹100Cr
     size: int = Field(ge=10, le=100)  # 10-100 members
     duration_months: int = Field(ge=10, le=100)  # 10-100 months
@@ -56,4 +59,9 @@ class Chit(SQLModel, table=True):
     
     # Relationships - cascade delete (when chit is deleted, related records are also deleted)
     slots: List["ChitSlot"] = Relationship(back_populates="chit", sa_relationship_kwargs={"cascade": "all, delete-orphan"})
-    payments: List["Payment"] = Relationship(back_populates="chit", sa_relationship_kwargs={"cascade": "all, delete-orphan"})
\ No newline at end of file
+    payments: List["Payment"] = Relationship(back_populates="chit", sa_relationship_kwargs={"cascade": "all, delete-orphan"})
+
+
+def sync_name_normalized(mapper, connection, target: Chit) -> None:
+    """Keep Chit.name_normalized in step with Chit.name on ORM inserts and updates."""
+    target.name_normalized = normalize_name(target.name)
@@ -0,0 +1,37 @@
+# backend/app/models/idempotency.py
+
+from typing import Optional
+from datetime import datetime
+from sqlmodel import Field, SQLModel
+from sqlalchemy import Index, Text, UniqueConstraint
+
+from app.core.utils import utc_now
+
+
+class IdempotencyKey(SQLModel, table=True):
+    """
+    Stored outcome of a write request sent with an `Idempotency-Key` header.
+    One row per (scope, key); scope identifies the endpoint (e.g. "POST /payments").
+    
+    The row is inserted with its response, in the same transaction as the write it
+    guards, so a retried request replays the stored response instead of writing again. Rows older than IDEMPOTENCY_KEY_TTL_HOURS are ignored and pruned
+    with `python -m app.manage prune-idempotency-keys`.
+    """
+    __table_args__ = (
+        UniqueConstraint('scope', 'key', name='uq_idempotency_scope_key'),
+        # TTL pruning
+        Index('ix_idempotency_created_at', 'created_at'),
+    )
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    scope: str = Field(max_length=100)
+    key: str = Field(max_length=255)
+    
+    # Hash of the request body, to reject a key reused for a different request
+    request_hash: str = Field(max_length=64)
+    
+    # Stored response, replayed to retries
+    status_code: int
+    response_body: str = Field(sa_type=Text)
+    
+    created_at: datetime = Field(default_factory=utc_now)
@@ -0,0 +1,38 @@
+# backend/app/models/ledger.py
+
+from typing import Optional
+from datetime import datetime
+from sqlmodel import Field, SQLModel
+from sqlalchemy import Index, UniqueConstraint
+
+from app.core.utils import utc_now
+
+
+class CollectionLedger(SQLModel, table=True):
+    """
+    Monthly collection summary per member of a chit.
+    One row per (chit_id, month, member_id), holding the collected amount and
+    payment count of COLLECTION payments.
+    
+    Maintained transactionally by crud_payments on every collection write, so
+    collection views read a point lookup or a small range scan instead of
+    aggregating raw payments. Rebuild with `python -m app.manage rebuild-collection-ledger`.
+    """
+    __table_args__ = (
+        UniqueConstraint('chit_id', 'month', 'member_id', name='uq_ledger_chit_month_member'),
+        # Member-centric lookups (member slot views)
+        Index('ix_ledger_member_chit_month', 'member_id', 'chit_id', 'month'),
+    )
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    chit_id: int = Field(foreign_key="chit.id", ge=1)
+    month: int = Field(ge=1)
+    member_id: int = Field(foreign_key="member.id", ge=1)
+    
+    # Totals of collection payments (amount in rupees)
+    amount_collected: int = Field(default=0)
+    payment_count: int = Field(default=0)
+    
+    # Audit timestamps
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
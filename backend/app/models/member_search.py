@@ -0,0 +1,23 @@
+# backend/app/models/member_search.py
+
+from typing import Optional
+from sqlmodel import Field, SQLModel
+from sqlalchemy import Index
+
+
+class MemberSearchToken(SQLModel, table=True):
+    """
+    One lowercase word of a member's full name, for indexed typeahead search.
+    A name prefix search becomes `token LIKE 'q%'`, a range scan on
+    ix_member_search_token_member instead of a leading-wildcard scan of Member.
+    
+    Maintained by crud_members on every member write; rebuild with
+    `python -m app.manage rebuild-member-search`.
+    """
+    __table_args__ = (
+        Index('ix_member_search_token_member', 'token', 'member_id'),
+    )
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    member_id: int = Field(foreign_key="member.id", index=True)
+    token: str = Field(max_length=100)
@@ -51,6 +51,13 @@ class Payment(SQLModel, table=True):
         # Composite indexes for common query patterns
         Index('ix_payment_chit_member_month', 'chit_id', 'member_id', 'month'),
         Index('ix_payment_chit_month', 'chit_id', 'month'),
+        # Keyset pagination on (date DESC, id DESC), overall and per member/chit/payment type
+        Index('ix_payment_date_id', 'date', 'id'),
+        Index('ix_payment_member_date_id', 'member_id', 'date', 'id'),
+        Index('ix_payment_chit_date_id', 'chit_id', 'date', 'id'),
+        Index('ix_payment_type_date_id', 'payment_type', 'date', 'id'),
+        # Payout payments of a slot (totals, latest payout per slot), newest first
+        Index('ix_payment_slot_date_id', 'slot_id', 'date', 'id'),
     )
     
     id: Optional[int] = Field(default=None, primary_key=True)
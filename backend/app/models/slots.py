@@ -1,9 +1,9 @@
 # backend/app/models/slots.py
 
 from typing import Optional, List, TYPE_CHECKING
-from datetime import datetime
+from datetime import date, datetime
 from sqlmodel import Field, SQLModel, Relationship
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 import enum
 
 from app.core.utils import utc_now
@@ -35,6 +35,8 @@ class ChitSlot(SQLModel, table=True):
     """
     __table_args__ = (
         UniqueConstraint('chit_id', 'month', name='uq_slot_chit_month'),
+        # Status-filtered payout lists ordered by (chit_id, month)
+        Index('ix_slot_status_chit_month', 'status', 'chit_id', 'month'),
     )
     
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -52,6 +54,11 @@ class ChitSlot(SQLModel, table=True):
     # Status (computed from payments, but stored for query efficiency)
     status: SlotStatus = Field(default=SlotStatus.SCHEDULED)
     
+    # Running payout totals (maintained by crud_payments on every payout write,
+    # repairable with `python -m app.manage recompute-slot-totals`)
+    amount_paid: int = Field(default=0, ge=0)  # Sum of payout payments in rupees
+    last_paid_date: Optional[date] = Field(default=None)  # Date of the latest payout payment
+    
     # Foreign Keys
     chit_id: int = Field(foreign_key="chit.id", ge=1)
     member_id: Optional[int] = Field(default=None, foreign_key="member.id", index=True)  # Assigned after auction/selection
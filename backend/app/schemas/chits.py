@@ -14,7 +14,7 @@ class ChitTypeEnum(str, Enum):
 
 
 class ChitNested(BaseModel):
-    """Minimal chit info needed for nested responses."""
+    """Minimal chit info needed for nested responses (no notes; those are deferred in list queries)."""
     id: int
     start_date: date
     end_date: date
@@ -23,11 +23,11 @@ class ChitNested(BaseModel):
     chit_value: int = 0
     size: int = 0
     duration_months: int = 0  # Added for month display
-    base_contribution: int = 0
-    premium_contribution: int = 0
-    payout_premium_percent: float = 0.0
-    foreman_commission_percent: float = 0.0
-    notes: Optional[str] = Field(default=None, max_length=1000000)
+    # NULL in the DB for chit types that don't use them
+    base_contribution: Optional[int] = 0
+    premium_contribution: Optional[int] = 0
+    payout_premium_percent: Optional[float] = 0.0
+    foreman_commission_percent: Optional[float] = 0.0
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -51,7 +51,6 @@ class ChitRead(BaseModel):
     premium_contribution: Optional[int] = None
     payout_premium_percent: Optional[float] = None
     foreman_commission_percent: Optional[float] = None
-    notes: Optional[str] = Field(default=None, max_length=1000000)
 
 
 # ============================================
@@ -169,8 +168,8 @@ class ChitPatch(BaseModel):
 # ============================================
 # RESPONSE SCHEMA - Uses ChitRead (no validation)
 # ============================================
-class ChitResponse(ChitRead):
-    """Response schema - inherits from ChitRead to avoid validation on DB reads."""
+class ChitSummary(ChitRead):
+    """List item schema - everything except notes, which list queries don't load."""
     id: int
     end_date: date
     status: str
@@ -181,8 +180,16 @@ class ChitResponse(ChitRead):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ChitResponse(ChitSummary):
+    """Detail response schema - the summary plus notes."""
+    notes: Optional[str] = Field(default=None, max_length=1000000)
+
+
+BULK_CREATE_MAX = 50  # Chits per POST /chits/bulk (each expands to duration_months slot rows)
+
+
 class ChitListResponse(BaseModel):
-    chits: List[ChitResponse]
+    chits: List[ChitSummary]
 
 
 class AuctionRequest(BaseModel):
@@ -1,7 +1,7 @@
 # backend/app/schemas/payments.py
 
-from pydantic import BaseModel, ConfigDict, Field
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import List, Literal, Optional
 from datetime import date, datetime
 from app.models.payments import PaymentType, PaymentMethod
 from app.schemas.members import MemberPublic
@@ -32,6 +32,43 @@ class PaymentUpdate(BaseModel):
     method: Optional[PaymentMethod] = None
     notes: Optional[str] = None
 
+# --- Filter Schema (query parameters for GET /payments) ---
+class PaymentFilters(BaseModel):
+    chit_id: Optional[int] = Field(default=None, ge=1)
+    member_id: Optional[int] = Field(default=None, ge=1)
+    payment_type: Optional[PaymentType] = None
+    method: Optional[PaymentMethod] = None
+    
+    # Inclusive ranges
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    month_from: Optional[int] = Field(default=None, ge=1)
+    month_to: Optional[int] = Field(default=None, ge=1)
+    amount_min: Optional[int] = Field(default=None, ge=0)
+    amount_max: Optional[int] = Field(default=None, ge=0)
+
+    @model_validator(mode='after')
+    def validate_ranges(self) -> 'PaymentFilters':
+        if self.date_from and self.date_to and self.date_from > self.date_to:
+            raise ValueError('date_from must be on or before date_to.')
+        if self.month_from and self.month_to and self.month_from > self.month_to:
+            raise ValueError('month_from must not be greater than month_to.')
+        if self.amount_min is not None and self.amount_max is not None and self.amount_min > self.amount_max:
+            raise ValueError('amount_min must not be greater than amount_max.')
+        return self
+
+PAGE_SIZE_DEFAULT = 100  # Payments per page when no limit is given
+PAGE_SIZE_MAX = 500
+
+class PaymentListQuery(PaymentFilters):
+    """Query parameters for GET /payments: filters plus keyset pagination."""
+    limit: int = Field(default=PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX)
+    cursor: Optional[str] = None  # next_cursor from the previous page
+
+class PaymentExportQuery(PaymentFilters):
+    """Query parameters for GET /payments/export: filters plus output format."""
+    format: Literal["csv", "ndjson"] = "csv"
+
 # --- Response Schema ---
 class PaymentResponse(BaseModel):
     id: int
@@ -59,3 +96,33 @@ class PaymentResponse(BaseModel):
 # --- List Response Schema ---
 class PaymentListResponse(BaseModel):
     payments: List[PaymentResponse]
+    next_cursor: Optional[str] = None  # Pass as `cursor` to fetch the next page; None on the last page
+
+# --- Summary Schema ---
+class PaymentSummaryResponse(BaseModel):
+    count: int  # Payments matching the filters
+    total_amount: int  # SUM(amount) in rupees
+
+# --- Bulk Create Schemas ---
+BULK_CREATE_MAX = 1000  # Payments per POST /payments/bulk; larger loads go through /payments/import
+
+class PaymentBulkRowResult(BaseModel):
+    index: int  # Position of the row in the request
+    status: str  # 'created' or 'rejected'
+    detail: Optional[str] = None  # Reason for rejection
+
+class PaymentBulkResponse(BaseModel):
+    created_count: int
+    rejected_count: int
+    results: List[PaymentBulkRowResult]
+
+# --- CSV Import Schemas ---
+class PaymentImportRejectedRow(BaseModel):
+    line: int  # Line number in the uploaded file (header is line 1)
+    detail: str
+
+class PaymentImportResponse(BaseModel):
+    total_rows: int
+    imported_count: int
+    rejected_count: int
+    rejected: List[PaymentImportRejectedRow]  # Capped; rejected_count has the full total
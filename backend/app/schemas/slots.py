@@ -1,8 +1,8 @@
 # backend/app/schemas/slots.py
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing import List, Optional
-from datetime import datetime
+from datetime import date, datetime
 from app.models.slots import SlotStatus
 from app.schemas.members import MemberPublic
 from app.schemas.chits import ChitNested
@@ -70,6 +70,47 @@ class ChitSlotResponse(ChitSlotBase):
 class ChitSlotListResponse(BaseModel):
     """List response wrapper."""
     slots: List[ChitSlotResponse]
+    next_cursor: Optional[str] = None  # Set on paginated lists when more rows follow
+
+
+PAYOUT_PAGE_SIZE_DEFAULT = 100  # Payouts per page when no limit is given
+PAYOUT_PAGE_SIZE_MAX = 500
+
+
+class PayoutListQuery(BaseModel):
+    """Query parameters for GET /payouts: filters plus keyset pagination on (chit_id, month)."""
+    chit_id: Optional[int] = Field(default=None, ge=1)
+    member_id: Optional[int] = Field(default=None, ge=1)
+    status: Optional[SlotStatus] = None
+    month_from: Optional[int] = Field(default=None, ge=1)  # Inclusive payout month range
+    month_to: Optional[int] = Field(default=None, ge=1)
+    has_unpaid_balance: Optional[bool] = None  # payout_amount set and not fully paid out
+    paid_from: Optional[date] = None  # Inclusive range on the latest payout payment date
+    paid_to: Optional[date] = None
+    limit: int = Field(default=PAYOUT_PAGE_SIZE_DEFAULT, ge=1, le=PAYOUT_PAGE_SIZE_MAX)
+    cursor: Optional[str] = None  # next_cursor from the previous page
+
+    @model_validator(mode='after')
+    def validate_month_range(self) -> 'PayoutListQuery':
+        if self.month_from and self.month_to and self.month_from > self.month_to:
+            raise ValueError('month_from must not be greater than month_to.')
+        if self.paid_from and self.paid_to and self.paid_from > self.paid_to:
+            raise ValueError('paid_from must be on or before paid_to.')
+        return self
+
+
+class PayoutSummaryQuery(BaseModel):
+    """Query parameters for GET /payouts/summary: the calendar month to summarize."""
+    year: int = Field(ge=2000, le=2100)
+    month: int = Field(ge=1, le=12)
+
+
+class PayoutSummaryResponse(BaseModel):
+    """Totals for the payouts scheduled in a calendar month."""
+    count: int  # Slots whose payout falls in the month
+    paid_count: int  # Of those, slots with at least one payout payment
+    payout_total: int  # SUM(payout_amount) in rupees
+    amount_paid: int  # SUM(amount_paid) in rupees
 
 
 class ChitSlotPublic(BaseModel):
@@ -118,3 +159,18 @@ class BulkSlotAssignment(BaseModel):
 class BulkSlotAssignmentRequest(BaseModel):
     """Request to assign multiple members to multiple slots."""
     assignments: List[BulkSlotAssignment]
+
+
+class BulkSlotAssignmentResult(BaseModel):
+    """Outcome of a single item in a bulk assignment request."""
+    month: int
+    member_id: int
+    status: str  # 'assigned', 'slot_not_found', 'already_assigned', 'member_not_found', 'duplicate_month'
+
+
+class BulkSlotAssignmentResponse(BaseModel):
+    """Per-item report for a bulk assignment request."""
+    message: str
+    assigned_count: int
+    skipped_count: int
+    results: List[BulkSlotAssignmentResult]
@@ -19,6 +19,9 @@ from app.models.chits import Chit
 from app.models.members import Member
 from app.models.slots import ChitSlot
 from app.models.payments import Payment
+from app.models.ledger import CollectionLedger
+from app.models.idempotency import IdempotencyKey
+from app.models.member_search import MemberSearchToken
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,28 @@
+"""add payment slot index
+
+Revision ID: 08342b895296
+Revises: 3401006e8a9b
+Create Date: 2026-10-17 07:16:34.037492
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '08342b895296'
+down_revision: Union[str, Sequence[str], None] = '3401006e8a9b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_payment_slot_date_id", "payment", ["slot_id", "date", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_payment_slot_date_id", table_name="payment")
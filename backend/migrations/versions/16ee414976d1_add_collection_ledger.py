@@ -0,0 +1,58 @@
+"""add collection ledger
+
+Revision ID: 16ee414976d1
+Revises: a3383a6feda6
+Create Date: 2026-10-17 06:59:10.638006
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '16ee414976d1'
+down_revision: Union[str, Sequence[str], None] = 'a3383a6feda6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "collectionledger",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("chit_id", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("member_id", sa.Integer(), nullable=False),
+        sa.Column("amount_collected", sa.Integer(), nullable=False),
+        sa.Column("payment_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["chit_id"], ["chit.id"]),
+        sa.ForeignKeyConstraint(["member_id"], ["member.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("chit_id", "month", "member_id", name="uq_ledger_chit_month_member"),
+    )
+    op.create_index(
+        "ix_ledger_member_chit_month", "collectionledger", ["member_id", "chit_id", "month"]
+    )
+
+    # Backfill from existing collection payments
+    op.execute(
+        """
+        INSERT INTO collectionledger
+            (chit_id, month, member_id, amount_collected, payment_count, created_at, updated_at)
+        SELECT chit_id, month, member_id, SUM(amount), COUNT(id), CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+        FROM payment
+        WHERE payment_type = 'COLLECTION'
+        GROUP BY chit_id, month, member_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_ledger_member_chit_month", table_name="collectionledger")
+    op.drop_table("collectionledger")
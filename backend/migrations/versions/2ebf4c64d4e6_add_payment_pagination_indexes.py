@@ -0,0 +1,32 @@
+"""add payment pagination indexes
+
+Revision ID: 2ebf4c64d4e6
+Revises: 1f902b68d8dd
+Create Date: 2026-10-17 07:08:03.057731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2ebf4c64d4e6'
+down_revision: Union[str, Sequence[str], None] = '1f902b68d8dd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_payment_date_id", "payment", ["date", "id"])
+    op.create_index("ix_payment_member_date_id", "payment", ["member_id", "date", "id"])
+    op.create_index("ix_payment_chit_date_id", "payment", ["chit_id", "date", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_payment_chit_date_id", table_name="payment")
+    op.drop_index("ix_payment_member_date_id", table_name="payment")
+    op.drop_index("ix_payment_date_id", table_name="payment")
@@ -0,0 +1,33 @@
+"""add chit normalized name
+
+Revision ID: 3401006e8a9b
+Revises: 3554c78280e9
+Create Date: 2026-10-17 07:13:42.177287
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3401006e8a9b'
+down_revision: Union[str, Sequence[str], None] = '3554c78280e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("chit", sa.Column("name_normalized", sa.String(length=50), nullable=True))
+    # Backfill with the same rule as app.core.utils.normalize_name
+    op.execute("UPDATE chit SET name_normalized = LOWER(TRIM(name))")
+    op.alter_column("chit", "name_normalized", existing_type=sa.String(length=50), nullable=False)
+    op.create_index("ix_chit_name_normalized", "chit", ["name_normalized"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_chit_name_normalized", table_name="chit")
+    op.drop_column("chit", "name_normalized")
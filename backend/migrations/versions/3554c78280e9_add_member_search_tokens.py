@@ -0,0 +1,52 @@
+"""add member search tokens
+
+Revision ID: 3554c78280e9
+Revises: 4e831dc7a299
+Create Date: 2026-10-17 07:12:01.969237
+
+"""
+from typing import Sequence, Union
+
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3554c78280e9'
+down_revision: Union[str, Sequence[str], None] = '4e831dc7a299'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    token_table = op.create_table(
+        "membersearchtoken",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("member_id", sa.Integer(), nullable=False),
+        sa.Column("token", sa.String(length=100), nullable=False),
+        sa.ForeignKeyConstraint(["member_id"], ["member.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_membersearchtoken_member_id", "membersearchtoken", ["member_id"])
+    op.create_index("ix_member_search_token_member", "membersearchtoken", ["token", "member_id"])
+
+    # Backfill: one row per lowercase word of each member's name
+    # (same rule as crud_members.name_tokens)
+    members = op.get_bind().execute(sa.text("SELECT id, full_name FROM member")).all()
+    rows = [
+        {"member_id": member_id, "token": token[:100]}
+        for member_id, full_name in members
+        for token in set(re.findall(r"\w+", full_name.lower()))
+    ]
+    if rows:
+        op.bulk_insert(token_table, rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_member_search_token_member", table_name="membersearchtoken")
+    op.drop_index("ix_membersearchtoken_member_id", table_name="membersearchtoken")
+    op.drop_table("membersearchtoken")
@@ -0,0 +1,28 @@
+"""add slot status index
+
+Revision ID: 4e831dc7a299
+Revises: baeece56faf7
+Create Date: 2026-10-17 07:10:57.785326
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e831dc7a299'
+down_revision: Union[str, Sequence[str], None] = 'baeece56faf7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_slot_status_chit_month", "chitslot", ["status", "chit_id", "month"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_slot_status_chit_month", table_name="chitslot")
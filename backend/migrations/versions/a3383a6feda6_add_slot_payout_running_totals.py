@@ -0,0 +1,52 @@
+"""add slot payout running totals
+
+Revision ID: a3383a6feda6
+Revises: 
+Create Date: 2026-10-17 06:57:38.288875
+
+Upgrading an existing deployment: its tables were created by the old startup
+create_all and have no amount_paid/last_paid_date columns, so run
+`alembic upgrade head` (do NOT stamp) and then
+`python -m app.manage recompute-slot-totals` to verify the backfilled totals.
+Only a brand-new database, created empty by the current startup create_all,
+already has every column and may be marked with `alembic stamp head`.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3383a6feda6'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "chitslot",
+        sa.Column("amount_paid", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("chitslot", sa.Column("last_paid_date", sa.Date(), nullable=True))
+
+    # Backfill running totals from existing payout payments
+    op.execute(
+        """
+        UPDATE chitslot SET
+            amount_paid = COALESCE(
+                (SELECT SUM(payment.amount) FROM payment WHERE payment.slot_id = chitslot.id), 0
+            ),
+            last_paid_date = (
+                SELECT MAX(payment.date) FROM payment WHERE payment.slot_id = chitslot.id
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("chitslot", "last_paid_date")
+    op.drop_column("chitslot", "amount_paid")
@@ -0,0 +1,28 @@
+"""add payment type date index
+
+Revision ID: baeece56faf7
+Revises: 2ebf4c64d4e6
+Create Date: 2026-10-17 07:08:49.683755
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'baeece56faf7'
+down_revision: Union[str, Sequence[str], None] = '2ebf4c64d4e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_payment_type_date_id", "payment", ["payment_type", "date", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_payment_type_date_id", table_name="payment")
@@ -0,0 +1,31 @@
+// frontend/src/components/ui/LoadMoreButton.jsx
+
+import Button from "./Button";
+
+/**
+ * LoadMoreButton - Fetches the next page of a cursor-paged (infinite) query.
+ * Renders nothing once the last page has been loaded.
+ *
+ * @param {Object} props
+ * @param {boolean} props.hasNextPage - Whether the server returned a next_cursor
+ * @param {boolean} props.isFetchingNextPage - Whether the next page is loading
+ * @param {Function} props.onLoadMore - Callback that fetches the next page
+ * @param {string} [props.className] - Additional CSS classes
+ */
+const LoadMoreButton = ({ hasNextPage, isFetchingNextPage, onLoadMore, className = "" }) => {
+  if (!hasNextPage) return null;
+
+  return (
+    <div className={`flex justify-center mt-4 ${className}`}>
+      <Button
+        variant="secondary"
+        onClick={() => onLoadMore()}
+        isLoading={isFetchingNextPage}
+      >
+        Load more
+      </Button>
+    </div>
+  );
+};
+
+export default LoadMoreButton;
@@ -149,7 +149,7 @@ const formatCurrency = (val) => {
   return isNaN(num) ? "Rs. 0" : `Rs. ${num.toLocaleString("en-IN")}`;
 };
 
-const ChitsListReportPDF = ({ chits, collections = [], payouts = [] }) => {
+const ChitsListReportPDF = ({ chits, collectionSummary = null, payoutSummary = null }) => {
   const data = chits.map((chit, index) => ({
     ...chit,
     s_no: index + 1,
@@ -183,48 +183,15 @@ const ChitsListReportPDF = ({ chits, collections = [], payouts = [] }) => {
     return sum + chitTotal;
   }, 0);
 
-  const currentYear = new Date().getFullYear();
-  const currentMonth = new Date().getMonth();
-
-  // Optimized payout calculation - single pass
-  const payoutMetrics = payouts.reduce(
-    (metrics, p) => {
-      if (!p.chit || !p.chit.start_date) return metrics;
-      
-      const chitStartDate = new Date(p.chit.start_date);
-      const scheduledDate = new Date(chitStartDate);
-      scheduledDate.setMonth(chitStartDate.getMonth() + (p.month - 1));
-      
-      const isThisMonth =
-        scheduledDate.getMonth() === currentMonth &&
-        scheduledDate.getFullYear() === currentYear;
-      
-      if (!isThisMonth) return metrics;
-      
-      return {
-        paidAmount: metrics.paidAmount + (p.paid_date ? (p.amount || 0) : 0),
-        targetAmount: metrics.targetAmount + (p.planned_amount || 0),
-        paidCount: metrics.paidCount + (p.paid_date ? 1 : 0),
-        totalCount: metrics.totalCount + 1,
-      };
-    },
-    { paidAmount: 0, targetAmount: 0, paidCount: 0, totalCount: 0 }
-  );
-
-  const paidThisMonth = payoutMetrics.paidAmount;
-  const monthlyPayoutTarget = payoutMetrics.targetAmount;
-  const paidCount = payoutMetrics.paidCount;
-  const totalScheduledCount = payoutMetrics.totalCount;
+  // Payouts scheduled this month, summed by the server
+  const paidThisMonth = payoutSummary?.amount_paid ?? 0;
+  const monthlyPayoutTarget = payoutSummary?.payout_total ?? 0;
+  const paidCount = payoutSummary?.paid_count ?? 0;
+  const totalScheduledCount = payoutSummary?.count ?? 0;
 
 
-  const collectedThisMonth = collections.reduce((sum, p) => {
-    if (!p.collection_date) return sum;
-    const [pYear, pMonth] = p.collection_date.split("-").map(Number);
-    if (pYear === currentYear && pMonth - 1 === currentMonth) {
-      return sum + (p.amount_paid || 0);
-    }
-    return sum;
-  }, 0);
+  // This month's collections (server-side totals)
+  const collectedThisMonth = collectionSummary?.total_amount ?? 0;
 
   const totalActiveMembers = activeChits.reduce(
     (sum, c) => sum + (c.size || 0),
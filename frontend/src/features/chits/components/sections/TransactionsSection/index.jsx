@@ -4,6 +4,7 @@ import { useState, useMemo } from "react";
 import { useNavigate } from "react-router-dom";
 import Table from "../../../../../components/ui/Table";
 import Pagination from "../../../../../components/ui/Pagination";
+import LoadMoreButton from "../../../../../components/ui/LoadMoreButton";
 import Message from "../../../../../components/ui/Message";
 import Skeleton from "../../../../../components/ui/Skeleton";
 import { formatAmount, formatDate, ITEMS_PER_PAGE } from "./utils/helpers";
@@ -36,6 +37,9 @@ const TransactionsSection = ({ mode, chitId }) => {
         data: collectionsResponse,
         isLoading: collectionsLoading,
         error: collectionsError,
+        fetchNextPage,
+        hasNextPage,
+        isFetchingNextPage,
     } = useCollectionsByChit(chitId);
 
     const {
@@ -252,6 +256,11 @@ const TransactionsSection = ({ mode, chitId }) => {
                                 totalPages={totalPages}
                                 onPageChange={setCurrentPage}
                             />
+                            <LoadMoreButton
+                                hasNextPage={hasNextPage}
+                                isFetchingNextPage={isFetchingNextPage}
+                                onLoadMore={fetchNextPage}
+                            />
                         </>
                     )}
                 </>
@@ -11,8 +11,9 @@ import StaggerContainer from "../../../components/ui/StaggerContainer";
 import StaggerItem from "../../../components/ui/StaggerItem";
 import EmptyState from "../../../components/ui/EmptyState";
 import { useChits, useDeleteChit } from "../hooks/useChits";
-import { useCollections } from "../../collections/hooks/useCollections";
-import { usePayouts } from "../../payouts/hooks/usePayouts";
+import { useCollectionSummary } from "../../collections/hooks/useCollections";
+import { usePayoutSummary } from "../../payouts/hooks/usePayouts";
+import { getMonthDateRange } from "../../../utils/calculations";
 import { getPayoutsByChitId } from "../../../services/payoutsService";
 import { getAssignmentsForChit } from "../../../services/assignmentsService";
 import { getCollectionsByChitId } from "../../../services/collectionsService";
@@ -157,9 +158,10 @@ const ChitsPage = () => {
     error: queryError,
   } = useChits();
 
-  const { data: collectionsData, isLoading: collectionsLoading } =
-    useCollections();
-  const { data: payoutsData, isLoading: payoutsLoading } = usePayouts();
+  const { data: collectionSummary, isLoading: collectionsLoading } =
+    useCollectionSummary(getMonthDateRange());
+  const { data: payoutSummary, isLoading: payoutsLoading } =
+    usePayoutSummary();
 
   const loading = chitsLoading || collectionsLoading || payoutsLoading;
 
@@ -205,63 +207,14 @@ const ChitsPage = () => {
       return sum + chitTotal;
     }, 0);
 
-    const currentYear = new Date().getFullYear();
-    const currentMonth = new Date().getMonth();
-
-    // ========================================================================
-    // OPTIMIZED PAYOUT LOGIC - Single Pass
-    // ========================================================================
-
-    // Calculate all metrics in a single pass through the payouts array
-    const payoutMetrics = (payoutsData?.payouts || []).reduce(
-      (metrics, p) => {
-        // Ensure we have necessary chit data
-        if (!p.chit || !p.chit.start_date) return metrics;
-
-        // Parse the Chit's Start Date and calculate scheduled date
-        const chitStartDate = new Date(p.chit.start_date);
-        const scheduledDate = new Date(chitStartDate);
-        scheduledDate.setMonth(chitStartDate.getMonth() + (p.month - 1));
-
-        // Check if this payout is scheduled for current month/year
-        const isThisMonth =
-          scheduledDate.getMonth() === currentMonth &&
-          scheduledDate.getFullYear() === currentYear;
-
-        if (!isThisMonth) return metrics;
-
-        // Accumulate metrics for payouts scheduled this month
-        return {
-          paidAmount: metrics.paidAmount + (p.paid_date ? (p.amount || 0) : 0),
-          targetAmount: metrics.targetAmount + (p.planned_amount || 0),
-          paidCount: metrics.paidCount + (p.paid_date ? 1 : 0),
-          totalCount: metrics.totalCount + 1,
-        };
-      },
-      { paidAmount: 0, targetAmount: 0, paidCount: 0, totalCount: 0 }
-    );
+    // Payouts scheduled this month, summed by the server
+    const paidThisMonth = payoutSummary?.amount_paid ?? 0;
+    const monthlyPayoutTarget = payoutSummary?.payout_total ?? 0;
+    const paidCount = payoutSummary?.paid_count ?? 0;
+    const totalScheduledCount = payoutSummary?.count ?? 0;
 
-    // Extract values for clarity
-    const paidThisMonth = payoutMetrics.paidAmount;
-    const monthlyPayoutTarget = payoutMetrics.targetAmount;
-    const paidCount = payoutMetrics.paidCount;
-    const totalScheduledCount = payoutMetrics.totalCount;
-
-    // ========================================================================
-    // END OPTIMIZED LOGIC
-    // ========================================================================
-
-    const collectedThisMonth = (collectionsData?.collections || []).reduce(
-      (sum, p) => {
-        if (!p.collection_date) return sum;
-        const [pYear, pMonth] = p.collection_date.split("-").map(Number);
-        if (pYear === currentYear && pMonth - 1 === currentMonth) {
-          return sum + (p.amount_paid || 0);
-        }
-        return sum;
-      },
-      0
-    );
+    // This month's collections, summed by the server
+    const collectedThisMonth = collectionSummary?.total_amount ?? 0;
 
     return (
       <StatsCarousel className="mb-8">
@@ -307,7 +260,7 @@ const ChitsPage = () => {
         />
       </StatsCarousel>
     );
-  }, [chits, collectionsData, payoutsData, loading]);
+  }, [chits, collectionSummary, payoutSummary, loading]);
 
   // Combined query error with local error
   const error = localError || (queryError?.message ?? null);
@@ -428,8 +381,8 @@ const ChitsPage = () => {
       const blob = await pdf(
         <ChitsListReportPDF
           chits={sortedChits}
-          collections={collectionsData?.collections || []}
-          payouts={payoutsData?.payouts || []}
+          collectionSummary={collectionSummary}
+          payoutSummary={payoutSummary}
         />
       ).toBlob();
       const url = URL.createObjectURL(blob);
@@ -1,6 +1,7 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import {
     getPayments,
+    getPaymentsSummary,
     getPaymentById,
     createPayment,
     updatePayment,
@@ -27,79 +28,94 @@ export const collectionKeys = {
     lists: () => [...collectionKeys.all, 'list'],
     list: (filters) => [...collectionKeys.lists(), filters],
     collected: () => [...collectionKeys.all, 'collected'],
+    summary: (filters) => [...collectionKeys.all, 'summary', filters],
     details: () => [...collectionKeys.all, 'detail'],
     detail: (id) => [...collectionKeys.details(), id],
     byChit: (chitId) => [...collectionKeys.all, 'chit', chitId],
     byMember: (memberId) => [...collectionKeys.all, 'member', memberId],
 };
 
+const PAGE_SIZE = 100;
+
 /**
- * Hook to fetch all collections (both scheduled and collected).
- * Uses paymentsService with payment_type='collection'
+ * Shared options for the cursor-paged collection lists.
+ * GET /payments is keyset-paginated: each page is fetched with the previous page's
+ * next_cursor, and `select` flattens the loaded pages into { collections }.
+ * Call fetchNextPage() (while hasNextPage) to load more.
+ */
+const collectionPages = (filters) => ({
+    queryFn: ({ pageParam }) => getPayments({
+        ...filters,
+        payment_type: 'collection',
+        limit: PAGE_SIZE,
+        ...(pageParam ? { cursor: pageParam } : {}),
+    }),
+    initialPageParam: null,
+    getNextPageParam: (lastPage) => lastPage?.next_cursor ?? undefined,
+    select: (data) => ({
+        collections: data.pages.flatMap((page) => page?.payments ?? []),
+    }),
+});
+
+/**
+ * Hook to fetch collections page by page, newest first.
+ * Filters (chit_id, member_id, date_from/date_to, ...) are applied by the server.
  */
 export const useCollections = (filters = {}) => {
-    return useQuery({
+    return useInfiniteQuery({
         queryKey: collectionKeys.list(filters),
-        queryFn: () => getPayments({ ...filters, payment_type: 'collection' }),
+        ...collectionPages(filters),
         staleTime: 1000 * 60 * 5,  // 5 minutes
         gcTime: 1000 * 60 * 30,    // 30 minutes
-        select: (data) => {
-            // Adapt Payment API response to match expected 'collections' format if needed
-            // Assuming API returns { payments: [...] } or just [...]
-            // If it returns { payments: [] }, we might need to map it to { collections: [] } for compatibility
-            if (data?.payments) {
-                return { collections: data.payments };
-            }
-            return { collections: Array.isArray(data) ? data : [] };
-        }
     });
 };
 
 /**
- * Hook to fetch collections with 'collected' status.
+ * Hook to fetch the count and total amount of the collections matching the filters.
+ * Totals are computed by the server (GET /payments/summary), not from loaded pages.
  */
-export const useCollectedPayments = (filters = {}) => {
+export const useCollectionSummary = (filters = {}) => {
     return useQuery({
+        queryKey: collectionKeys.summary(filters),
+        queryFn: () => getPaymentsSummary({ ...filters, payment_type: 'collection' }),
+        staleTime: 1000 * 60 * 5,
+        gcTime: 1000 * 60 * 30,
+    });
+};
+
+/**
+ * Hook to fetch collections with 'collected' status, page by page.
+ */
+export const useCollectedPayments = (filters = {}) => {
+    return useInfiniteQuery({
         queryKey: collectionKeys.collected(),
-        queryFn: () => getPayments({ ...filters, payment_type: 'collection', status: 'collected' }), // status might differ in new API?
+        ...collectionPages(filters),
         staleTime: 1000 * 60 * 5,
         gcTime: 1000 * 60 * 30,
-        select: (data) => {
-            if (data?.payments) return { collections: data.payments };
-            return { collections: Array.isArray(data) ? data : [] };
-        }
     });
 };
 
 /**
- * Hook to fetch collections for a specific chit.
+ * Hook to fetch collections for a specific chit, page by page.
  */
 export const useCollectionsByChit = (chitId) => {
-    return useQuery({
+    return useInfiniteQuery({
         queryKey: collectionKeys.byChit(chitId),
-        queryFn: () => getPayments({ chit_id: chitId, payment_type: 'collection' }),
+        ...collectionPages({ chit_id: chitId }),
         enabled: Boolean(chitId),
         staleTime: 1000 * 60 * 5,
         gcTime: 1000 * 60 * 30,
-        select: (data) => {
-            if (data?.payments) return { collections: data.payments };
-            return { collections: Array.isArray(data) ? data : [] };
-        }
     });
 };
 
 /**
- * Hook to fetch collections for a specific member.
+ * Hook to fetch collections for a specific member, page by page.
  */
 export const useCollectionsByMember = (memberId) => {
-    return useQuery({
+    return useInfiniteQuery({
         queryKey: collectionKeys.byMember(memberId),
-        queryFn: () => getPayments({ member_id: memberId, payment_type: 'collection' }),
+        ...collectionPages({ member_id: memberId }),
         enabled: Boolean(memberId),
-        select: (data) => {
-            if (data?.payments) return { collections: data.payments };
-            return { collections: Array.isArray(data) ? data : [] };
-        }
     });
 };
 
@@ -166,6 +182,7 @@ export const useCreateCollection = () => {
         mutationFn: (data) => createPayment({ ...data, payment_type: 'collection' }),
         onSuccess: (data) => {
             queryClient.invalidateQueries({ queryKey: collectionKeys.lists() });
+            queryClient.invalidateQueries({ queryKey: [...collectionKeys.all, 'summary'] });
             if (data?.chit_id) {
                 queryClient.invalidateQueries({ queryKey: collectionKeys.byChit(data.chit_id) });
             }
@@ -6,6 +6,7 @@ import useTableKeyboardNavigation from "../../../hooks/useTableKeyboardNavigatio
 import { Link, useLocation, useNavigate } from "react-router-dom";
 import {
   useCollections,
+  useCollectionSummary,
   useDeleteCollection,
 } from "../hooks/useCollections";
 import { getAllCollections } from "../../../services/collectionsService";
@@ -21,6 +22,7 @@ import PageHeader from "../../../components/ui/PageHeader";
 import SearchToolbar from "../../../components/ui/SearchToolbar";
 import ActionButton from "../../../components/ui/ActionButton";
 import Pagination from "../../../components/ui/Pagination";
+import LoadMoreButton from "../../../components/ui/LoadMoreButton";
 import CollectionCard from "../components/cards/CollectionCard";
 import CollectionCardSkeleton from "../components/cards/CollectionCardSkeleton";
 import ConfirmationModal from "../../../components/ui/ConfirmationModal";
@@ -39,8 +41,9 @@ import {
 import StatsCard from "../../../components/ui/StatsCard";
 import StatsCarousel from "../../../components/ui/StatsCarousel";
 import FormattedCurrency from "../../../components/ui/FormattedCurrency";
-import { usePayouts } from "../../payouts/hooks/usePayouts";
+import { usePayoutSummary } from "../../payouts/hooks/usePayouts";
 import { useChits } from "../../chits/hooks/useChits";
+import { getMonthDateRange } from "../../../utils/calculations";
 
 import CollectionReportPDF from "../components/reports/CollectionReportPDF";
 import CollectionReportModal from "../components/reports/CollectionReportModal";
@@ -96,12 +99,16 @@ const CollectionsPage = () => {
     data: collectionsData,
     isLoading: loading,
     error: queryError,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
   } = useCollections();
 
   const deleteCollectionMutation = useDeleteCollection();
 
   // Additional data for stats
-  const { data: payoutsData } = usePayouts();
+  const { data: collectionSummary } = useCollectionSummary(getMonthDateRange());
+  const { data: payoutSummary } = usePayoutSummary();
   const { data: chitsData } = useChits();
 
   // Extract collections from query data
@@ -286,13 +293,9 @@ const CollectionsPage = () => {
   const metricsBlock = useMemo(() => {
     if (loading) return null;
 
-    const payouts = payoutsData?.payouts || [];
     const chits = chitsData?.chits || [];
     const activeChits = chits.filter((c) => c.status === "Active");
 
-    const currentYear = new Date().getFullYear();
-    const currentMonth = new Date().getMonth();
-
     // Calculate monthly collection target based on active chits (handle different chit types)
     const monthlyCollectionTarget = activeChits.reduce((sum, c) => {
       let chitTotal = 0;
@@ -377,61 +380,15 @@ const CollectionsPage = () => {
       }
     })();
 
-    // Metric 2: Monthly Collection - Optimized single pass using collection_date
-    // Note: Collections use actual collection_date, not scheduled dates like payouts
-    const collectionMetrics = collections.reduce(
-      (metrics, c) => {
-        if (!c.collection_date) return metrics;
-        
-        const [cYear, cMonth] = c.collection_date.split("-").map(Number);
-        const isThisMonth = cYear === currentYear && cMonth - 1 === currentMonth;
-        
-        if (!isThisMonth) return metrics;
-        
-        return {
-          collectedAmount: metrics.collectedAmount + (c.amount_paid || 0),
-          expectedAmount: metrics.expectedAmount + (c.expected_amount || c.amount_paid || 0),
-          collectedCount: metrics.collectedCount + (c.collection_status === "Paid" ? 1 : 0),
-          totalCount: metrics.totalCount + 1,
-        };
-      },
-      { collectedAmount: 0, expectedAmount: 0, collectedCount: 0, totalCount: 0 }
-    );
+    // Metric 2: Monthly Collection - totals for this month's collections, summed by the server
+    const collectedAmount = collectionSummary?.total_amount ?? 0;
+    const collectedCount = collectionSummary?.count ?? 0;
 
-    const collectedAmount = collectionMetrics.collectedAmount;
-    const expectedAmount = collectionMetrics.expectedAmount;
-    const collectedCount = collectionMetrics.collectedCount;
-    const totalCollectionCount = collectionMetrics.totalCount;
-
-    // Optimized payout calculation - single pass
-    const payoutMetrics = payouts.reduce(
-      (metrics, p) => {
-        if (!p.chit || !p.chit.start_date) return metrics;
-        
-        const chitStartDate = new Date(p.chit.start_date);
-        const scheduledDate = new Date(chitStartDate);
-        scheduledDate.setMonth(chitStartDate.getMonth() + (p.month - 1));
-        
-        const isThisMonth =
-          scheduledDate.getMonth() === currentMonth &&
-          scheduledDate.getFullYear() === currentYear;
-        
-        if (!isThisMonth) return metrics;
-        
-        return {
-          paidAmount: metrics.paidAmount + (p.paid_date ? (p.amount || 0) : 0),
-          targetAmount: metrics.targetAmount + (p.planned_amount || 0),
-          paidCount: metrics.paidCount + (p.paid_date ? 1 : 0),
-          totalCount: metrics.totalCount + 1,
-        };
-      },
-      { paidAmount: 0, targetAmount: 0, paidCount: 0, totalCount: 0 }
-    );
-
-    const paidThisMonth = payoutMetrics.paidAmount;
-    const monthlyPayoutTarget = payoutMetrics.targetAmount;
-    const paidCount = payoutMetrics.paidCount;
-    const totalScheduledCount = payoutMetrics.totalCount;
+    // Payouts scheduled this month, summed by the server
+    const paidThisMonth = payoutSummary?.amount_paid ?? 0;
+    const monthlyPayoutTarget = payoutSummary?.payout_total ?? 0;
+    const paidCount = payoutSummary?.paid_count ?? 0;
+    const totalScheduledCount = payoutSummary?.count ?? 0;
 
     return (
       <StatsCarousel className="mb-8">
@@ -481,7 +438,7 @@ const CollectionsPage = () => {
           icon={CheckCircle2}
           label="Collection Count"
           value={collectedCount}
-          subtext={`Total Scheduled: ${totalCollectionCount}`}
+          subtext="Collected this month"
           color="accent"
         />
         {/* Card 4: Monthly Payouts */}
@@ -498,7 +455,7 @@ const CollectionsPage = () => {
         />
       </StatsCarousel>
     );
-  }, [collections, payoutsData, chitsData, loading]);
+  }, [collections, collectionSummary, payoutSummary, chitsData, loading]);
 
   const columns = [
     {
@@ -700,6 +657,11 @@ const CollectionsPage = () => {
               totalPages={totalPages}
               onPageChange={setCurrentPage}
             />
+            <LoadMoreButton
+              hasNextPage={hasNextPage}
+              isFetchingNextPage={isFetchingNextPage}
+              onLoadMore={fetchNextPage}
+            />
           </>
         )}
       </div>
@@ -33,24 +33,30 @@ import FormattedCurrency from "../../../components/ui/FormattedCurrency";
 import { formatCurrency } from "../../../utils/formatters"; // Imported shared utility
 
 import api from "../../../lib/api";
+import { getPayoutsSummary } from "../../../services/payoutsService";
+import { getPaymentsSummary } from "../../../services/paymentsService";
+import { getMonthDateRange } from "../../../utils/calculations";
 
-// API calls - Note: Collections endpoint removed, using payments for actual transactions
+// API calls - Note: Collections endpoint removed, using payments for actual transactions.
+// Monthly payout and collection totals are summed by the server.
 const fetchDashboardData = async () => {
-  const [chitsRes, membersRes, payoutsRes] = await Promise.all([
+  const today = new Date();
+  const [chitsRes, membersRes, payoutSummary, collectionSummary] = await Promise.all([
     api.get("/chits"),
     api.get("/members"),
-    api.get("/payouts"),
+    getPayoutsSummary({ year: today.getFullYear(), month: today.getMonth() + 1 }),
+    getPaymentsSummary({ payment_type: "collection", ...getMonthDateRange(today) }),
   ]);
 
   const chits = chitsRes.data;
   const members = membersRes.data;
-  const payouts = payoutsRes.data;
 
   return {
     chits: chits.chits || [],
     members: members.members || [],
     collections: [], // Collections are now calculated dynamically
-    payouts: payouts.slots || payouts.payouts || [],
+    payoutSummary,
+    collectionSummary,
   };
 };
 
@@ -66,7 +72,8 @@ const DashboardPage = () => {
     chits: [],
     members: [],
     collections: [],
-    payouts: [],
+    payoutSummary: null,
+    collectionSummary: null,
   });
   const [stats, setStats] = useState(null);
 
@@ -89,10 +96,8 @@ const DashboardPage = () => {
     if (isLoggedIn) loadData();
   }, [isLoggedIn]);
 
-  const calculateStats = ({ chits, members, collections, payouts }) => {
+  const calculateStats = ({ chits, members, collections, payoutSummary, collectionSummary }) => {
     const today = new Date();
-    const currentMonth = today.getMonth();
-    const currentYear = today.getFullYear();
     const todayStr = today.toISOString().split("T")[0];
 
     const activeChits = chits.filter((c) => c.status === "Active");
@@ -121,42 +126,12 @@ const DashboardPage = () => {
       return sum + chitTotal;
     }, 0);
 
-    // Optimized payout calculation - single pass
-    const payoutMetrics = payouts.reduce(
-      (metrics, p) => {
-        if (!p.chit || !p.chit.start_date) return metrics;
-
-        const chitStartDate = new Date(p.chit.start_date);
-        const scheduledDate = new Date(chitStartDate);
-        scheduledDate.setMonth(chitStartDate.getMonth() + (p.month - 1));
-
-        const isThisMonth =
-          scheduledDate.getMonth() === currentMonth &&
-          scheduledDate.getFullYear() === currentYear;
-
-        if (!isThisMonth) return metrics;
-
-        return {
-          paidAmount: metrics.paidAmount + (p.paid_date ? (p.amount || 0) : 0),
-          targetAmount: metrics.targetAmount + (p.planned_amount || 0),
-        };
-      },
-      { paidAmount: 0, targetAmount: 0 }
-    );
-
-    const monthlyPayoutTarget = payoutMetrics.targetAmount;
-
-    // ACTUALS
-    const collectedThisMonth = collections.reduce((sum, p) => {
-      if (!p.collection_date) return sum;
-      const [pYear, pMonth] = p.collection_date.split("-").map(Number);
-      if (pYear === currentYear && pMonth - 1 === currentMonth) {
-        return sum + (p.amount_paid || 0);
-      }
-      return sum;
-    }, 0);
+    // Payouts scheduled this month, summed by the server
+    const monthlyPayoutTarget = payoutSummary?.payout_total ?? 0;
 
-    const paidThisMonth = payoutMetrics.paidAmount;
+    // ACTUALS (this month's totals, summed by the server)
+    const collectedThisMonth = collectionSummary?.total_amount ?? 0;
+    const paidThisMonth = payoutSummary?.amount_paid ?? 0;
 
     const activeMembersCount = members.filter((m) => {
       if (!m.assignments || m.assignments.length === 0) return false;
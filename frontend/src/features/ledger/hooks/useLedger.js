@@ -1,19 +1,26 @@
 // frontend/src/features/ledger/hooks/useLedger.js
 
 import { useMemo } from 'react';
-import { useCollections } from '../../collections/hooks/useCollections';
-import { usePayouts } from '../../payouts/hooks/usePayouts';
+import { useCollections, useCollectionSummary } from '../../collections/hooks/useCollections';
+import { usePayouts, usePayoutPaymentSummary } from '../../payouts/hooks/usePayouts';
 import { useChits } from '../../chits/hooks/useChits';
+import { getMonthDateRange } from '../../../utils/calculations';
 
 /**
  * Combined hook for fetching both collections and payouts data.
  * Provides unified access to transaction data for the Ledger page.
+ * Collections and payouts are loaded page by page (fetchNextPage); monthly and
+ * all-time totals come from the server's summary endpoints rather than the loaded pages.
  * 
  * @returns {Object} Combined ledger data and state
  */
 export const useLedger = () => {
   const collectionsQuery = useCollections();
+  const collectionSummaryQuery = useCollectionSummary(getMonthDateRange());
+  const collectionTotalsQuery = useCollectionSummary();
   const payoutsQuery = usePayouts();
+  const payoutSummaryQuery = usePayoutPaymentSummary(getMonthDateRange());
+  const payoutTotalsQuery = usePayoutPaymentSummary();
   const chitsQuery = useChits();
 
   const isLoading = collectionsQuery.isLoading || payoutsQuery.isLoading || chitsQuery.isLoading;
@@ -25,8 +32,7 @@ export const useLedger = () => {
   }, [collectionsQuery.data]);
 
   const payouts = useMemo(() => {
-    const rawPayouts = payoutsQuery.data?.payouts ?? (Array.isArray(payoutsQuery.data) ? payoutsQuery.data : []);
-    return rawPayouts;
+    return payoutsQuery.data?.payouts || [];
   }, [payoutsQuery.data]);
 
   const chits = useMemo(() => {
@@ -62,10 +68,23 @@ export const useLedger = () => {
     );
   }, [collections, payouts]);
 
+  // Load the next page of whichever lists still have one
+  const fetchNextPage = () => {
+    if (collectionsQuery.hasNextPage) collectionsQuery.fetchNextPage();
+    if (payoutsQuery.hasNextPage) payoutsQuery.fetchNextPage();
+  };
+
+  // All-time record count (collections + payout payments), counted by the server
+  const totalCount = (collectionTotalsQuery.data?.count ?? 0) + (payoutTotalsQuery.data?.count ?? 0);
+
   // Refetch both data sources
   const refetch = () => {
     collectionsQuery.refetch();
+    collectionSummaryQuery.refetch();
+    collectionTotalsQuery.refetch();
     payoutsQuery.refetch();
+    payoutSummaryQuery.refetch();
+    payoutTotalsQuery.refetch();
     chitsQuery.refetch();
   };
 
@@ -75,6 +94,14 @@ export const useLedger = () => {
     payouts,
     chits,
     allTransactions,
+    collectionSummary: collectionSummaryQuery.data,
+    payoutSummary: payoutSummaryQuery.data,
+    totalCount,
+    
+    // Paging
+    hasNextPage: collectionsQuery.hasNextPage || payoutsQuery.hasNextPage,
+    isFetchingNextPage: collectionsQuery.isFetchingNextPage || payoutsQuery.isFetchingNextPage,
+    fetchNextPage,
     
     // Loading and error states
     isLoading,
@@ -22,6 +22,7 @@ import PageHeader from "../../../components/ui/PageHeader";
 import SearchToolbar from "../../../components/ui/SearchToolbar";
 import ActionButton from "../../../components/ui/ActionButton";
 import Pagination from "../../../components/ui/Pagination";
+import LoadMoreButton from "../../../components/ui/LoadMoreButton";
 import StatsCard from "../../../components/ui/StatsCard";
 import StatsCarousel from "../../../components/ui/StatsCarousel";
 import FormattedCurrency from "../../../components/ui/FormattedCurrency";
@@ -76,8 +77,12 @@ const LedgerPage = () => {
     // Data hooks
     const {
         allTransactions,
-        collections,
-        payouts,
+        collectionSummary,
+        payoutSummary,
+        totalCount,
+        hasNextPage,
+        isFetchingNextPage,
+        fetchNextPage,
         isLoading: loading,
         error: queryError,
     } = useLedger();
@@ -125,30 +130,11 @@ const LedgerPage = () => {
     const metricsBlock = useMemo(() => {
         if (loading) return null;
 
-        const currentYear = new Date().getFullYear();
-        const currentMonth = new Date().getMonth();
-
-        // Monthly stats calculation logic (reused)
-        const monthlyIn = collections.reduce((sum, c) => {
-            if (!c.collection_date) return sum;
-            const [cYear, cMonth] = c.collection_date.split("-").map(Number);
-            if (cYear === currentYear && cMonth - 1 === currentMonth) {
-                return sum + (c.amount_paid || 0);
-            }
-            return sum;
-        }, 0);
-
-        const monthlyOut = payouts.reduce((sum, p) => {
-            if (!p.paid_date) return sum;
-            const paidDate = new Date(p.paid_date);
-            if (paidDate.getFullYear() === currentYear && paidDate.getMonth() === currentMonth) {
-                return sum + (p.amount || 0);
-            }
-            return sum;
-        }, 0);
+        // This month's collections and payout payments, summed by the server
+        const monthlyIn = collectionSummary?.total_amount ?? 0;
+        const monthlyOut = payoutSummary?.total_amount ?? 0;
 
         const netFlow = monthlyIn - monthlyOut;
-        const totalCount = allTransactions.length;
 
         return (
             <StatsCarousel className="mb-8">
@@ -182,7 +168,7 @@ const LedgerPage = () => {
                 />
             </StatsCarousel>
         );
-    }, [collections, payouts, allTransactions, loading]);
+    }, [collectionSummary, payoutSummary, totalCount, loading]);
 
 
     // --- FILTERING & SORTING ---
@@ -377,6 +363,11 @@ const LedgerPage = () => {
                             totalPages={totalPages}
                             onPageChange={setCurrentPage}
                         />
+                        <LoadMoreButton
+                            hasNextPage={hasNextPage}
+                            isFetchingNextPage={isFetchingNextPage}
+                            onLoadMore={fetchNextPage}
+                        />
                     </>
                 )}
 
@@ -139,7 +139,7 @@ const styles = StyleSheet.create({
   },
 });
 
-const MembersListReportPDF = ({ members, collections = [], payouts = [], chits = [] }) => {
+const MembersListReportPDF = ({ members, collectionSummary = null, payoutSummary = null, chits = [] }) => {
   // Helper to calculate active chits for a member
   const getActiveCount = (member) => {
     if (!member.assignments || member.assignments.length === 0) return 0;
@@ -160,19 +160,10 @@ const MembersListReportPDF = ({ members, collections = [], payouts = [], chits =
   const activeMembers = data.filter((m) => m.active_chits > 0);
 
   // --- Metrics Calculations ---
-  const currentYear = new Date().getFullYear();
-  const currentMonth = new Date().getMonth();
   const activeChitsData = chits.filter((c) => c.status === "Active");
 
-  // Monthly Collection
-  const collectedThisMonth = collections.reduce((sum, c) => {
-    if (!c.collection_date) return sum;
-    const [cYear, cMonth] = c.collection_date.split("-").map(Number);
-    if (cYear === currentYear && cMonth - 1 === currentMonth) {
-      return sum + (c.amount_paid || 0);
-    }
-    return sum;
-  }, 0);
+  // Monthly Collection (server-side totals for this month's collections)
+  const collectedThisMonth = collectionSummary?.total_amount ?? 0;
 
   // Calculate monthly collection target (handle different chit types)
   const monthlyCollectionTarget = activeChitsData.reduce((sum, c) => {
@@ -197,56 +188,12 @@ const MembersListReportPDF = ({ members, collections = [], payouts = [], chits =
     return sum + chitTotal;
   }, 0);
 
-  // Optimized payout calculation - single pass
-  const payoutMetrics = payouts.reduce(
-    (metrics, p) => {
-      if (!p.chit || !p.chit.start_date) return metrics;
-      
-      const chitStartDate = new Date(p.chit.start_date);
-      const scheduledDate = new Date(chitStartDate);
-      scheduledDate.setMonth(chitStartDate.getMonth() + (p.month - 1));
-      
-      const isThisMonth =
-        scheduledDate.getMonth() === currentMonth &&
-        scheduledDate.getFullYear() === currentYear;
-      
-      if (!isThisMonth) return metrics;
-      
-      return {
-        paidAmount: metrics.paidAmount + (p.paid_date ? (p.amount || 0) : 0),
-        targetAmount: metrics.targetAmount + (p.planned_amount || 0),
-      };
-    },
-    { paidAmount: 0, targetAmount: 0 }
-  );
-
-  const paidThisMonth = payoutMetrics.paidAmount;
-  const monthlyPayoutTarget = payoutMetrics.targetAmount;
-
-  // Pending This Month
-  const membersWithPending = new Set();
-  collections.forEach((c) => {
-    if (!c.collection_date) return;
-    const [cYear, cMonth] = c.collection_date.split("-").map(Number);
-    if (cYear === currentYear && cMonth - 1 === currentMonth) {
-      if (c.collection_status === "Unpaid" || c.collection_status === "Partial") {
-        if (c.member?.id) {
-          membersWithPending.add(c.member.id);
-        }
-      }
-    }
-  });
+  // Payouts scheduled this month, summed by the server
+  const paidThisMonth = payoutSummary?.amount_paid ?? 0;
+  const monthlyPayoutTarget = payoutSummary?.payout_total ?? 0;
 
   // Collection Count - for Box 4
-  const collectionsThisMonth = collections.filter((c) => {
-    if (!c.collection_date) return false;
-    const [cYear, cMonth] = c.collection_date.split("-").map(Number);
-    return cYear === currentYear && cMonth - 1 === currentMonth;
-  });
-
-  const collectedCount = collectionsThisMonth.filter(
-    (c) => c.collection_status === "Paid"
-  ).length;
+  const collectedCount = collectionSummary?.count ?? 0;
 
   const formatCurrency = (val) => {
     if (val === undefined || val === null) return "";
@@ -336,7 +283,7 @@ const MembersListReportPDF = ({ members, collections = [], payouts = [], chits =
                 <Text style={styles.highlightLabel}>Collection Count</Text>
                 <Text style={styles.highlightValue}>{collectedCount}</Text>
                 <Text style={styles.highlightSubtext}>
-                  Total: {collectionsThisMonth.length} this month
+                  Collected this month
                 </Text>
               </View>
             </View>
@@ -4,6 +4,7 @@ import { useState, useMemo } from "react";
 import { useNavigate } from "react-router-dom";
 import Table from "../../../../components/ui/Table";
 import Pagination from "../../../../components/ui/Pagination";
+import LoadMoreButton from "../../../../components/ui/LoadMoreButton";
 import Message from "../../../../components/ui/Message";
 import Skeleton from "../../../../components/ui/Skeleton";
 import {
@@ -39,18 +40,17 @@ const CollectionHistoryList = ({
   const [searchQuery, setSearchQuery] = useState("");
   const [currentPage, setCurrentPage] = useState(1);
 
-  // React Query hooks for collections
+  // React Query hooks for collections (paged)
+  const collectionsByChitQuery = useCollectionsByChit(chitId);
+  const collectionsByMemberQuery = useCollectionsByMember(memberId);
   const {
-    data: collectionsDataByChit,
-    isLoading: collectionsChitLoading,
-    error: collectionsChitError,
-  } = useCollectionsByChit(chitId);
-
-  const {
-    data: collectionsDataByMember,
-    isLoading: collectionsMemberLoading,
-    error: collectionsMemberError,
-  } = useCollectionsByMember(memberId);
+    data: collectionsData,
+    isLoading: collectionsLoading,
+    error: collectionsError,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = chitId ? collectionsByChitQuery : collectionsByMemberQuery;
 
   // React Query hooks for payouts
   const {
@@ -66,11 +66,8 @@ const CollectionHistoryList = ({
   } = usePayoutsByMember(memberId);
 
   // Determine which data to use based on chitId or memberId
-  const collectionsData = chitId ? collectionsDataByChit : collectionsDataByMember;
   const payoutsData = chitId ? payoutsDataByChit : payoutsDataByMember;
-  const collectionsLoading = chitId ? collectionsChitLoading : collectionsMemberLoading;
   const payoutsLoading = chitId ? payoutsChitLoading : payoutsMemberLoading;
-  const collectionsError = chitId ? collectionsChitError : collectionsMemberError;
   const payoutsError = chitId ? payoutsChitError : payoutsMemberError;
 
   const loading = collectionsLoading || payoutsLoading;
@@ -297,6 +294,11 @@ const CollectionHistoryList = ({
                 totalPages={totalPages}
                 onPageChange={setCurrentPage}
               />
+              <LoadMoreButton
+                hasNextPage={hasNextPage}
+                isFetchingNextPage={isFetchingNextPage}
+                onLoadMore={fetchNextPage}
+              />
             </>
           )}
         </>
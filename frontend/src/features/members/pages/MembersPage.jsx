@@ -37,9 +37,10 @@ import {
 import StatsCard from "../../../components/ui/StatsCard";
 import StatsCarousel from "../../../components/ui/StatsCarousel";
 import FormattedCurrency from "../../../components/ui/FormattedCurrency";
-import { useCollections } from "../../collections/hooks/useCollections";
-import { usePayouts } from "../../payouts/hooks/usePayouts";
+import { useCollectionSummary } from "../../collections/hooks/useCollections";
+import { usePayoutSummary } from "../../payouts/hooks/usePayouts";
 import { useChits } from "../../chits/hooks/useChits";
+import { getMonthDateRange } from "../../../utils/calculations";
 
 import MembersListReportPDF from "../components/reports/MembersListReportPDF";
 import MemberReportPDF from "../components/reports/MemberReportPDF";
@@ -125,8 +126,8 @@ const MembersPage = () => {
   const deleteMemberMutation = useDeleteMember();
 
   // Additional data for stats
-  const { data: collectionsData } = useCollections();
-  const { data: payoutsData } = usePayouts();
+  const { data: collectionSummary } = useCollectionSummary(getMonthDateRange());
+  const { data: payoutSummary } = usePayoutSummary();
   const { data: chitsData } = useChits();
 
   // Extract members from query data and add calculated status
@@ -267,8 +268,8 @@ const MembersPage = () => {
       const blob = await pdf(
         <MembersListReportPDF
           members={sortedMembers}
-          collections={collectionsData?.collections || []}
-          payouts={payoutsData?.payouts || []}
+          collectionSummary={collectionSummary}
+          payoutSummary={payoutSummary}
           chits={chitsData?.chits || []}
         />
       ).toBlob();
@@ -327,23 +328,11 @@ const MembersPage = () => {
   const metricsBlock = useMemo(() => {
     if (loading) return null;
 
-    const collections = collectionsData?.collections || [];
-    const payouts = payoutsData?.payouts || [];
     const chits = chitsData?.chits || [];
     const activeChits = chits.filter((c) => c.status === "Active");
 
-    const currentYear = new Date().getFullYear();
-    const currentMonth = new Date().getMonth();
-
-    // Metric 1: Monthly Collection (same as ChitsPage)
-    const collectedThisMonth = collections.reduce((sum, c) => {
-      if (!c.collection_date) return sum;
-      const [cYear, cMonth] = c.collection_date.split("-").map(Number);
-      if (cYear === currentYear && cMonth - 1 === currentMonth) {
-        return sum + (c.amount_paid || 0);
-      }
-      return sum;
-    }, 0);
+    // Metric 1: Monthly Collection (same as ChitsPage), summed by the server
+    const collectedThisMonth = collectionSummary?.total_amount ?? 0;
 
     // Calculate monthly collection target (handle different chit types)
     const monthlyCollectionTarget = activeChits.reduce((sum, c) => {
@@ -368,60 +357,16 @@ const MembersPage = () => {
       return sum + chitTotal;
     }, 0);
 
-    // Optimized payout calculation - single pass
-    const payoutMetrics = payouts.reduce(
-      (metrics, p) => {
-        if (!p.chit || !p.chit.start_date) return metrics;
-
-        const chitStartDate = new Date(p.chit.start_date);
-        const scheduledDate = new Date(chitStartDate);
-        scheduledDate.setMonth(chitStartDate.getMonth() + (p.month - 1));
-
-        const isThisMonth =
-          scheduledDate.getMonth() === currentMonth &&
-          scheduledDate.getFullYear() === currentYear;
-
-        if (!isThisMonth) return metrics;
-
-        return {
-          paidAmount: metrics.paidAmount + (p.paid_date ? (p.amount || 0) : 0),
-          targetAmount: metrics.targetAmount + (p.planned_amount || 0),
-        };
-      },
-      { paidAmount: 0, targetAmount: 0 }
-    );
-
-    const paidThisMonth = payoutMetrics.paidAmount;
-    const monthlyPayoutTarget = payoutMetrics.targetAmount;
+    // Payouts scheduled this month, summed by the server
+    const paidThisMonth = payoutSummary?.amount_paid ?? 0;
+    const monthlyPayoutTarget = payoutSummary?.payout_total ?? 0;
 
     // Collection Count - for Card 4
-    const collectionsThisMonth = collections.filter((c) => {
-      if (!c.collection_date) return false;
-      const [cYear, cMonth] = c.collection_date.split("-").map(Number);
-      return cYear === currentYear && cMonth - 1 === currentMonth;
-    });
-
-    const collectedCount = collectionsThisMonth.filter(
-      (c) => c.collection_status === "Paid"
-    ).length;
+    const collectedCount = collectionSummary?.count ?? 0;
 
     // Metric 3: Active Members
     const activeMembers = members.filter((m) => (m.active_chits_count || 0) > 0);
 
-    // Metric 4: Pending Collections Count (members with pending collections this month)
-    const membersWithPending = new Set();
-    collections.forEach((c) => {
-      if (!c.collection_date) return;
-      const [cYear, cMonth] = c.collection_date.split("-").map(Number);
-      if (cYear === currentYear && cMonth - 1 === currentMonth) {
-        if (c.collection_status === "Unpaid" || c.collection_status === "Partial") {
-          if (c.member?.id) {
-            membersWithPending.add(c.member.id);
-          }
-        }
-      }
-    });
-
     return (
       <StatsCarousel className="mb-8">
         {/* Card 1: Monthly Collection */}
@@ -461,12 +406,12 @@ const MembersPage = () => {
           icon={CheckCircle2}
           label="Collection Count"
           value={collectedCount}
-          subtext={`Total count: ${collectionsThisMonth.length}`}
+          subtext="Collected this month"
           color="accent"
         />
       </StatsCarousel>
     );
-  }, [members, collectionsData, payoutsData, chitsData, loading]);
+  }, [members, collectionSummary, payoutSummary, chitsData, loading]);
 
   const columns = [
     {
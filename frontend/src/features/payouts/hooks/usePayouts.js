@@ -1,12 +1,14 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import {
-    getAllPayouts,
+    getPayouts,
+    getPayoutsSummary,
     getPayoutsByChitId,
     getPayoutsByMemberId,
     getPayoutById,
     updatePayout,
     deletePayout,
 } from '../../../services/payoutsService';
+import { getPaymentsSummary } from '../../../services/paymentsService';
 
 /**
  * Query key factory for payouts-related queries.
@@ -16,31 +18,83 @@ export const payoutKeys = {
     all: ['payouts'],
     lists: () => [...payoutKeys.all, 'list'],
     list: (filters) => [...payoutKeys.lists(), filters],
+    summary: (period) => [...payoutKeys.all, 'summary', period],
+    paymentSummary: (filters) => [...payoutKeys.all, 'payment-summary', filters],
     details: () => [...payoutKeys.all, 'detail'],
     detail: (id) => [...payoutKeys.details(), id],
     byChit: (chitId) => [...payoutKeys.all, 'chit', chitId],
     byMember: (memberId) => [...payoutKeys.all, 'member', memberId],
 };
 
+const PAGE_SIZE = 100;
+
 /**
- * Hook to fetch all payouts with optional filters.
+ * Hook to fetch payouts page by page, ordered by chit and month.
+ * GET /payouts is keyset-paginated: each page is fetched with the previous page's
+ * next_cursor and `select` flattens the loaded pages into { payouts }.
+ * Call fetchNextPage() (while hasNextPage) to load more.
  * 
- * @param {Object} filters - Optional filter parameters
- * @param {string} [filters.chitId] - Filter by chit ID
- * @param {string} [filters.memberId] - Filter by member ID
- * @param {string} [filters.startDate] - Filter by start date
- * @param {string} [filters.endDate] - Filter by end date
- * @returns {import('@tanstack/react-query').UseQueryResult} Query result with payouts data
+ * @param {Object} filters - Optional server-side filters
+ * @param {number} [filters.chit_id] - Filter by chit ID
+ * @param {number} [filters.member_id] - Filter by member ID
+ * @param {string} [filters.status] - Filter by slot status
+ * @param {string} [filters.paid_from] - Latest payout payment on or after (YYYY-MM-DD)
+ * @param {string} [filters.paid_to] - Latest payout payment on or before (YYYY-MM-DD)
+ * @returns {import('@tanstack/react-query').UseInfiniteQueryResult} Query result with payouts data
  */
 export const usePayouts = (filters = {}) => {
-    return useQuery({
+    return useInfiniteQuery({
         queryKey: payoutKeys.list(filters),
-        queryFn: () => getAllPayouts(filters),
+        queryFn: ({ pageParam }) => getPayouts({
+            ...filters,
+            limit: PAGE_SIZE,
+            ...(pageParam ? { cursor: pageParam } : {}),
+        }),
+        initialPageParam: null,
+        getNextPageParam: (lastPage) => lastPage?.next_cursor ?? undefined,
+        select: (data) => ({
+            payouts: data.pages.flatMap((page) => page?.slots ?? []),
+        }),
         staleTime: 1000 * 60 * 5,  // 5 minutes
         gcTime: 1000 * 60 * 30,    // 30 minutes
     });
 };
 
+/**
+ * Hook to fetch totals for the payouts scheduled in a calendar month.
+ * Totals are computed by the server (GET /payouts/summary), not from loaded pages.
+ * 
+ * @param {Date} [date] - Any day in the month to summarize (defaults to today)
+ * @returns {import('@tanstack/react-query').UseQueryResult} Query result with
+ *   { count, paid_count, payout_total, amount_paid }
+ */
+export const usePayoutSummary = (date = new Date()) => {
+    const period = { year: date.getFullYear(), month: date.getMonth() + 1 };
+    return useQuery({
+        queryKey: payoutKeys.summary(period),
+        queryFn: () => getPayoutsSummary(period),
+        staleTime: 1000 * 60 * 5,
+        gcTime: 1000 * 60 * 30,
+    });
+};
+
+/**
+ * Hook to fetch the count and total amount of the payout payments matching the filters.
+ * Totals are computed by the server (GET /payments/summary), not from loaded pages.
+ * 
+ * @param {Object} filters - Optional server-side filters (date_from/date_to, chit_id, ...)
+ * @returns {import('@tanstack/react-query').UseQueryResult} Query result with
+ *   { count, total_amount }
+ */
+export const usePayoutPaymentSummary = (filters = {}) => {
+    return useQuery({
+        queryKey: payoutKeys.paymentSummary(filters),
+        queryFn: () => getPaymentsSummary({ ...filters, payment_type: 'payout' }),
+        staleTime: 1000 * 60 * 5,
+        gcTime: 1000 * 60 * 30,
+    });
+};
+
 /**
  * Hook to fetch payouts for a specific chit.
  * 
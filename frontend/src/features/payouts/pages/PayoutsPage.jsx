@@ -4,8 +4,12 @@ import { useState, useEffect, useMemo, useRef } from "react";
 import useScrollToTop from "../../../hooks/useScrollToTop";
 import useTableKeyboardNavigation from "../../../hooks/useTableKeyboardNavigation";
 import { Link, useLocation, useNavigate } from "react-router-dom";
-import { usePayouts, useDeletePayout } from "../hooks/usePayouts";
-import { getAllPayouts } from "../../../services/payoutsService";
+import { usePayouts, usePayoutSummary, useDeletePayout } from "../hooks/usePayouts";
+import {
+  getPayouts,
+  getPayoutsByChitId,
+  getPayoutsByMemberId,
+} from "../../../services/payoutsService";
 import Message from "../../../components/ui/Message";
 import Button from "../../../components/ui/Button";
 import Table from "../../../components/ui/Table";
@@ -18,6 +22,7 @@ import PageHeader from "../../../components/ui/PageHeader";
 import SearchToolbar from "../../../components/ui/SearchToolbar";
 import ActionButton from "../../../components/ui/ActionButton";
 import Pagination from "../../../components/ui/Pagination";
+import LoadMoreButton from "../../../components/ui/LoadMoreButton";
 import PayoutCard from "../components/cards/PayoutCard";
 import PayoutCardSkeleton from "../components/cards/PayoutCardSkeleton";
 import ConfirmationModal from "../../../components/ui/ConfirmationModal";
@@ -36,7 +41,8 @@ import {
 import StatsCard from "../../../components/ui/StatsCard";
 import StatsCarousel from "../../../components/ui/StatsCarousel";
 import FormattedCurrency from "../../../components/ui/FormattedCurrency";
-import { useCollections } from "../../collections/hooks/useCollections";
+import { useCollectionSummary } from "../../collections/hooks/useCollections";
+import { getMonthDateRange } from "../../../utils/calculations";
 import { useChits } from "../../chits/hooks/useChits";
 
 import { pdf } from "@react-pdf/renderer";
@@ -60,6 +66,28 @@ const SORT_OPTIONS = [
   { value: "member_desc", label: "Member (Z-A)" },
 ];
 
+const REPORT_PAGE_SIZE = 500;
+
+// Fetch only the payouts the report covers: one chit, one member, or a paid-date range
+const fetchReportPayouts = async (filters) => {
+  if (filters.chitId) return (await getPayoutsByChitId(filters.chitId))?.slots ?? [];
+  if (filters.memberId) return (await getPayoutsByMemberId(filters.memberId))?.slots ?? [];
+
+  const payouts = [];
+  let cursor = null;
+  do {
+    const page = await getPayouts({
+      paid_from: filters.startDate,
+      paid_to: filters.endDate,
+      limit: REPORT_PAGE_SIZE,
+      ...(cursor ? { cursor } : {}),
+    });
+    payouts.push(...(page?.slots ?? []));
+    cursor = page?.next_cursor ?? null;
+  } while (cursor);
+  return payouts;
+};
+
 const PayoutsPage = () => {
   const navigate = useNavigate();
   const location = useLocation();
@@ -92,18 +120,21 @@ const PayoutsPage = () => {
     data: payoutsData,
     isLoading: loading,
     error: queryError,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
   } = usePayouts();
 
   const deletePayoutMutation = useDeletePayout();
 
   // Additional data for stats
-  const { data: collectionsData } = useCollections();
+  const { data: collectionSummary } = useCollectionSummary(getMonthDateRange());
+  const { data: payoutSummary } = usePayoutSummary();
   const { data: chitsData } = useChits();
 
   // Extract payouts from query data
   const payouts = useMemo(() => {
-    const rawPayouts = payoutsData?.payouts ?? (Array.isArray(payoutsData) ? payoutsData : []);
-    return rawPayouts;
+    return payoutsData?.payouts ?? [];
   }, [payoutsData]);
 
   // Combine query error with local error
@@ -163,8 +194,7 @@ const PayoutsPage = () => {
     setReportLoading(true);
     setLocalError(null);
     try {
-      const data = await getAllPayouts(filters);
-      const reportPayouts = Array.isArray(data) ? data : data.payouts || [];
+      const reportPayouts = await fetchReportPayouts(filters);
 
       if (!reportPayouts || reportPayouts.length === 0) {
         setLocalError("No payouts found for the selected criteria.");
@@ -284,13 +314,9 @@ const PayoutsPage = () => {
   const metricsBlock = useMemo(() => {
     if (loading) return null;
 
-    const collections = collectionsData?.collections || [];
     const chits = chitsData?.chits || [];
     const activeChits = chits.filter((c) => c.status === "Active");
 
-    const currentYear = new Date().getFullYear();
-    const currentMonth = new Date().getMonth();
-
     // Metric 1: Priority Payout
     const priorityPayout = (() => {
       const today = new Date();
@@ -341,45 +367,14 @@ const PayoutsPage = () => {
       }
     })();
 
-    // Metric 2: Monthly Payouts - Optimized single pass using scheduled dates
-    const payoutMetrics = payouts.reduce(
-      (metrics, p) => {
-        if (!p.chit || !p.chit.start_date) return metrics;
-        
-        const chitStartDate = new Date(p.chit.start_date);
-        const scheduledDate = new Date(chitStartDate);
-        scheduledDate.setMonth(chitStartDate.getMonth() + (p.month - 1));
-        
-        const isThisMonth =
-          scheduledDate.getMonth() === currentMonth &&
-          scheduledDate.getFullYear() === currentYear;
-        
-        if (!isThisMonth) return metrics;
-        
-        return {
-          paidAmount: metrics.paidAmount + (p.paid_date ? (p.amount || 0) : 0),
-          expectedAmount: metrics.expectedAmount + (p.planned_amount || 0),
-          paidCount: metrics.paidCount + (p.paid_date ? 1 : 0),
-          totalCount: metrics.totalCount + 1,
-        };
-      },
-      { paidAmount: 0, expectedAmount: 0, paidCount: 0, totalCount: 0 }
-    );
+    // Metric 2: Monthly Payouts - payouts scheduled this month, summed by the server
+    const paidAmount = payoutSummary?.amount_paid ?? 0;
+    const expectedAmount = payoutSummary?.payout_total ?? 0;
+    const paidCount = payoutSummary?.paid_count ?? 0;
+    const totalScheduledCount = payoutSummary?.count ?? 0;
 
-    const paidAmount = payoutMetrics.paidAmount;
-    const expectedAmount = payoutMetrics.expectedAmount;
-    const paidCount = payoutMetrics.paidCount;
-    const totalScheduledCount = payoutMetrics.totalCount;
-
-    // Metric 4: Monthly Collection
-    const collectedThisMonth = collections.reduce((sum, c) => {
-      if (!c.collection_date) return sum;
-      const [cYear, cMonth] = c.collection_date.split("-").map(Number);
-      if (cYear === currentYear && cMonth - 1 === currentMonth) {
-        return sum + (c.amount_paid || 0);
-      }
-      return sum;
-    }, 0);
+    // Metric 4: Monthly Collection, summed by the server
+    const collectedThisMonth = collectionSummary?.total_amount ?? 0;
 
     // Calculate monthly collection target (handle different chit types)
     const monthlyCollectionTarget = activeChits.reduce((sum, c) => {
@@ -460,7 +455,7 @@ const PayoutsPage = () => {
         />
       </StatsCarousel>
     );
-  }, [payouts, collectionsData, chitsData, loading]);
+  }, [payouts, payoutSummary, collectionSummary, chitsData, loading]);
 
   const columns = [
     {
@@ -663,6 +658,11 @@ const PayoutsPage = () => {
               totalPages={totalPages}
               onPageChange={setCurrentPage}
             />
+            <LoadMoreButton
+              hasNextPage={hasNextPage}
+              isFetchingNextPage={isFetchingNextPage}
+              onLoadMore={fetchNextPage}
+            />
           </>
         )}
       </div>
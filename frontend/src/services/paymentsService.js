@@ -24,6 +24,20 @@ export const getPayments = async (filters = {}) => {
     }
 };
 
+/**
+ * Get the count and total amount of the payments matching the filters.
+ * GET /payments/summary
+ * Accepts the same filters as getPayments; returns { count, total_amount }.
+ */
+export const getPaymentsSummary = async (filters = {}) => {
+    try {
+        const response = await api.get(`${BASE_URL}/summary`, { params: filters });
+        return response.data;
+    } catch (error) {
+        handleError(error, "Failed to fetch payment totals.");
+    }
+};
+
 /**
  * Create a new payment.
  * POST /payments
@@ -10,21 +10,35 @@ const handleError = (error, defaultMessage) => {
 };
 
 /**
- * Get all slots (payouts). Response uses ChitSlot format.
+ * Get one page of slots (payouts). Response uses ChitSlot format.
  * GET /payouts
+ * Supports filtering by chit_id, member_id, status, month_from/month_to,
+ * has_unpaid_balance and paid_from/paid_to. Returns { slots, next_cursor };
+ * pass next_cursor as `cursor` to fetch the following page.
  */
-export const getAllPayouts = async (filters = {}) => {
-  const params = {};
-  if (filters.status) params.status = filters.status;
-
+export const getPayouts = async (filters = {}) => {
   try {
-    const response = await api.get(`${BASE_URL}`, { params });
+    const response = await api.get(`${BASE_URL}`, { params: filters });
     return response.data;
   } catch (error) {
     handleError(error, "Failed to fetch payouts.");
   }
 };
 
+/**
+ * Get totals for the payouts scheduled in a calendar month.
+ * GET /payouts/summary
+ * Returns { count, paid_count, payout_total, amount_paid }.
+ */
+export const getPayoutsSummary = async ({ year, month }) => {
+  try {
+    const response = await api.get(`${BASE_URL}/summary`, { params: { year, month } });
+    return response.data;
+  } catch (error) {
+    handleError(error, "Failed to fetch payout totals.");
+  }
+};
+
 /**
  * Get all slots (payouts) for a specific chit.
  * GET /payouts/chit/{chitId}
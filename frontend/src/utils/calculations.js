@@ -35,6 +35,16 @@ export const calculatePayoutDate = (startDateStr, monthIndex) => {
     return `${month}/${year}`;
 };
 
+/**
+ * First and last day (YYYY-MM-DD) of the month containing `date`, as date_from/date_to filters.
+ */
+export const getMonthDateRange = (date = new Date()) => {
+    const year = date.getFullYear();
+    const month = (date.getMonth() + 1).toString().padStart(2, "0");
+    const lastDay = new Date(year, date.getMonth() + 1, 0).getDate().toString().padStart(2, "0");
+    return { date_from: `${year}-${month}-01`, date_to: `${year}-${month}-${lastDay}` };
+};
+
 /**
  * Validate date string (YYYY-MM format, valid month 1-12, in range 01/2000-12/2999)
  */